@@ -39,6 +39,9 @@ class AliasedGroup(click.Group):
               help=("Change OpenPype log level (debug - critical or 0-50)"))
 @click.option("--automatic-tests", is_flag=True, expose_value=False,
               help=("Run in automatic tests mode"))
+@click.option("--import-profile", is_flag=True, expose_value=False,
+              help=("Write report of import times on exit"
+                    " (path can be set with --import-profile=<path>)"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
@@ -75,6 +78,10 @@ def tray():
     Default action of pype command is to launch tray widget to control basic
     aspects of pype. See documentation for more information.
     """
+    if not AYON_SERVER_ENABLED:
+        from openpype.client.mongo import OpenPypeMongoConnection
+
+        OpenPypeMongoConnection.set_process_type("tray")
     PypeCommands().launch_tray()
 
 
@@ -120,6 +127,10 @@ def eventserver(ftrack_url,
 
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'eventserver' command.")
+
+    from openpype.client.mongo import OpenPypeMongoConnection
+
+    OpenPypeMongoConnection.set_process_type("event_server")
     PypeCommands().launch_eventservercli(
         ftrack_url,
         ftrack_user,
@@ -382,6 +393,21 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.option("--project", help="Project name", default=None)
+def create_project_indexes(project):
+    """Create database indexes of project (all projects if not specified).
+
+    Indexes are created with new projects. Projects created with older
+    version of OpenPype should be updated with this command.
+    """
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'create-project-indexes' command."
+        )
+    PypeCommands().create_project_indexes(project)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
@@ -29,6 +29,7 @@ from .entities import (
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
     get_output_link_versions,
+    get_source_hash_paths,
 
     version_is_latest,
 
@@ -46,6 +47,9 @@ from .entities import (
     get_workfile_info,
 
     get_asset_name_identifier,
+
+    entity_cache,
+    invalidate_entity_cache,
 )
 
 from .entity_links import (
@@ -89,6 +93,7 @@ __all__ = (
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
     "get_output_link_versions",
+    "get_source_hash_paths",
 
     "version_is_latest",
 
@@ -112,4 +117,7 @@ __all__ = (
     "create_project",
 
     "get_asset_name_identifier",
+
+    "entity_cache",
+    "invalidate_entity_cache",
 )
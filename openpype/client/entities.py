@@ -2,6 +2,10 @@ from openpype import AYON_SERVER_ENABLED
 
 if not AYON_SERVER_ENABLED:
     from .mongo.entities import *
+    from .mongo.entity_cache import (  # noqa: F401
+        entity_cache,
+        invalidate_entity_cache,
+    )
 else:
     from .server.entities import *
 
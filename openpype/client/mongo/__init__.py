@@ -9,6 +9,15 @@ from .mongo import (
     load_json_file,
     replace_project_documents,
     store_project_documents,
+    get_mongo_process_type,
+    get_mongo_client_options,
+)
+from .instrumentation import (
+    QueryRecord,
+    QueryStats,
+    add_query_recorder,
+    remove_query_recorder,
+    record_queries,
 )
 
 
@@ -23,4 +32,12 @@ __all__ = (
     "load_json_file",
     "replace_project_documents",
     "store_project_documents",
+    "get_mongo_process_type",
+    "get_mongo_client_options",
+
+    "QueryRecord",
+    "QueryStats",
+    "add_query_recorder",
+    "remove_query_recorder",
+    "record_queries",
 )
@@ -13,6 +13,7 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import get_active_entity_cache
 
 PatternType = type(re.compile(""))
 
@@ -112,6 +113,10 @@ def get_project(project_name, active=True, inactive=True, fields=None):
     if not active and not inactive:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and active and inactive and not fields:
+        return cache.get_project(project_name)
+
     query_filter = {"type": "project"}
     # Keep query untouched if both should be available
     if active and inactive:
@@ -169,6 +174,10 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     if not asset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and not fields:
+        return cache.get_entity(project_name, "asset", asset_id)
+
     query_filter = {"type": "asset", "_id": asset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -192,6 +201,10 @@ def get_asset_by_name(project_name, asset_name, fields=None):
     if not asset_name:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and not fields:
+        return cache.get_entity_by_name(project_name, "asset", asset_name)
+
     query_filter = {"type": "asset", "name": asset_name}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -403,6 +416,10 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and not fields:
+        return cache.get_entity(project_name, "subset", subset_id)
+
     query_filters = {"type": "subset", "_id": subset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filters, _prepare_fields(fields))
@@ -567,6 +584,10 @@ def get_version_by_id(project_name, version_id, fields=None):
     if not version_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and not fields:
+        return cache.get_entity(project_name, "version", version_id)
+
     query_filter = {
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
@@ -855,6 +876,83 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+def get_source_hash_paths(project_name, source_hashes, include_legacy=False):
+    """Published paths of source files found by their source hashes.
+
+    Versions store published files by hash of their source in
+    'data.sourceHashEntries' as list of '{"hash": ..., "path": ...}' items,
+    which are indexed (see 'create_project_indexes').
+
+    Versions published before the entries were added have hashes only as
+    keys of 'data.sourceHashes'. Query of these keys can't use an index and
+    scans all versions of project, so they are looked up only when
+    'include_legacy' is enabled.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        source_hashes (Iterable[str]): Source hashes to look for.
+        include_legacy (bool): Look for hashes which were not found in
+            entries also in 'data.sourceHashes' of versions.
+
+    Returns:
+        dict[str, list[str]]: Published paths by source hash. Hashes which
+            were not found are not in output.
+    """
+
+    source_hashes = set(source_hashes)
+    if not source_hashes:
+        return {}
+
+    conn = get_project_connection(project_name)
+    output = collections.defaultdict(list)
+    version_docs = conn.find(
+        {
+            "type": "version",
+            "data.sourceHashEntries.hash": {"$in": list(source_hashes)}
+        },
+        {"data.sourceHashEntries": True}
+    )
+    for version_doc in version_docs:
+        entries = version_doc["data"].get("sourceHashEntries") or []
+        for entry in entries:
+            source_hash = entry.get("hash")
+            if source_hash not in source_hashes:
+                continue
+            path = entry.get("path")
+            if path and path not in output[source_hash]:
+                output[source_hash].append(path)
+
+    missing_hashes = source_hashes - set(output.keys())
+    if include_legacy and missing_hashes:
+        # Fallback for versions published without hash entries
+        hash_keys = {
+            "data.sourceHashes.{}".format(source_hash): source_hash
+            for source_hash in missing_hashes
+        }
+        version_docs = conn.find(
+            {
+                "type": "version",
+                "$or": [
+                    {hash_key: {"$exists": True}}
+                    for hash_key in hash_keys.keys()
+                ]
+            },
+            {hash_key: True for hash_key in hash_keys.keys()}
+        )
+        for version_doc in version_docs:
+            source_hashes_data = version_doc["data"].get("sourceHashes") or {}
+            for source_hash in missing_hashes:
+                path = source_hashes_data.get(source_hash)
+                if path and path not in output[source_hash]:
+                    output[source_hash].append(path)
+
+    return {
+        source_hash: paths
+        for source_hash, paths in output.items()
+        if paths
+    }
+
+
 def get_last_versions(project_name, subset_ids, active=None, fields=None):
     """Latest versions for entered subset_ids.
 
@@ -1034,6 +1132,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     if not representation_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None and not fields:
+        return cache.get_entity(
+            project_name, "representation", convert_id(representation_id)
+        )
+
     repre_types = ["representation", "archived_representation"]
     query_filter = {
         "type": {"$in": repre_types}
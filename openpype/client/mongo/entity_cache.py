@@ -0,0 +1,267 @@
+"""Scoped cache of entity documents.
+
+Cache is opt-in and lives only in 'entity_cache' context. While the context
+is active, single entity getters ('get_project', 'get_asset_by_id',
+'get_asset_by_name', 'get_subset_by_id', 'get_version_by_id' and
+'get_representation_by_id') called without 'fields' return cached documents
+so each document is queried only once.
+
+Lookups can be queued with 'EntityCache.load' which returns a handle. All
+queued lookups of an entity type are resolved with single '$in' query when
+any of the handles is resolved. Single entity getters resolve queued lookups
+too, so caller which knows ids upfront can queue them and keep using the
+getters.
+
+Examples:
+    >>> with entity_cache() as cache:
+    ...     handles = [
+    ...         cache.load(project_name, "asset", asset_id)
+    ...         for asset_id in asset_ids
+    ...     ]
+    ...     # Only one query is made
+    ...     asset_docs = [handle.get() for handle in handles]
+
+Cached documents are not shared, each call returns a copy which can be
+modified by the caller.
+
+Cache is invalidated when 'OperationsSession' commits changes of project.
+"""
+import copy
+import threading
+import contextlib
+import collections
+
+import six
+from bson.objectid import ObjectId
+
+from .mongo import get_project_connection
+
+# Document types of entity types matching single entity getters
+ENTITY_QUERY_TYPES = {
+    "asset": ["asset"],
+    "subset": ["subset"],
+    "version": ["version", "hero_version"],
+    "representation": ["representation", "archived_representation"],
+}
+
+_THREAD_DATA = threading.local()
+_ACTIVE_CACHES = set()
+_ACTIVE_CACHES_LOCK = threading.Lock()
+
+
+class EntityHandle(object):
+    """Lazy result of queued lookup."""
+
+    def __init__(self, cache, key, lookup):
+        self._cache = cache
+        self._key = key
+        self._lookup = lookup
+
+    def get(self):
+        """Copy of entity document or 'None' if was not found."""
+        return copy.deepcopy(self._cache._resolve(self._key, self._lookup))
+
+
+class EntityCache(object):
+    """Identity map of entity documents with batched loading."""
+
+    def __init__(self):
+        # Documents by (project name, entity type) and id, 'None' for
+        #   entities which were not found
+        self._docs_by_id = collections.defaultdict(dict)
+        # Asset ids by (project name, entity type) and name
+        self._ids_by_name = collections.defaultdict(dict)
+        self._pending_ids = collections.defaultdict(set)
+        self._pending_names = collections.defaultdict(set)
+        self._project_docs = {}
+        # Cache can be invalidated from other threads
+        self._lock = threading.RLock()
+
+    def get_project(self, project_name):
+        with self._lock:
+            if project_name not in self._project_docs:
+                self._project_docs[project_name] = (
+                    get_project_connection(project_name).find_one(
+                        {"type": "project"}
+                    )
+                )
+            return copy.deepcopy(self._project_docs[project_name])
+
+    def load(self, project_name, entity_type, entity_id):
+        """Queue lookup of entity by id.
+
+        Returns:
+            EntityHandle: Handle which returns document when resolved.
+        """
+        if isinstance(entity_id, six.string_types):
+            entity_id = ObjectId(entity_id)
+        key = (project_name, entity_type)
+        with self._lock:
+            if entity_id not in self._docs_by_id[key]:
+                self._pending_ids[key].add(entity_id)
+        return EntityHandle(self, key, ("_id", entity_id))
+
+    def load_by_name(self, project_name, entity_type, name):
+        """Queue lookup of entity by name.
+
+        Should be used only for entity types with unique names (assets).
+
+        Returns:
+            EntityHandle: Handle which returns document when resolved.
+        """
+        key = (project_name, entity_type)
+        with self._lock:
+            if name not in self._ids_by_name[key]:
+                self._pending_names[key].add(name)
+        return EntityHandle(self, key, ("name", name))
+
+    def get_entity(self, project_name, entity_type, entity_id):
+        return self.load(project_name, entity_type, entity_id).get()
+
+    def get_entity_by_name(self, project_name, entity_type, name):
+        return self.load_by_name(project_name, entity_type, name).get()
+
+    def prime(self, project_name, entity_type, docs):
+        """Add documents queried elsewhere to cache.
+
+        Documents must contain all fields.
+        """
+        key = (project_name, entity_type)
+        with self._lock:
+            docs_by_id = self._docs_by_id[key]
+            ids_by_name = self._ids_by_name[key]
+            for doc in docs:
+                docs_by_id[doc["_id"]] = doc
+                if entity_type == "asset":
+                    ids_by_name[doc["name"]] = doc["_id"]
+
+    def invalidate(self, project_name=None):
+        """Remove cached documents of project or of all projects."""
+        with self._lock:
+            self._invalidate(project_name)
+
+    def _invalidate(self, project_name):
+        if project_name is None:
+            self._docs_by_id.clear()
+            self._ids_by_name.clear()
+            self._pending_ids.clear()
+            self._pending_names.clear()
+            self._project_docs.clear()
+            return
+
+        self._project_docs.pop(project_name, None)
+        for mapping in (
+            self._docs_by_id,
+            self._ids_by_name,
+            self._pending_ids,
+            self._pending_names,
+        ):
+            for key in tuple(mapping.keys()):
+                if key[0] == project_name:
+                    mapping.pop(key)
+
+    def _resolve(self, key, lookup):
+        with self._lock:
+            return self._resolve_lookup(key, lookup)
+
+    def _resolve_lookup(self, key, lookup):
+        lookup_key, value = lookup
+        if lookup_key == "name":
+            if value not in self._ids_by_name[key]:
+                self._flush(key)
+            entity_id = self._ids_by_name[key].get(value)
+            if entity_id is None:
+                return None
+        else:
+            entity_id = value
+
+        docs_by_id = self._docs_by_id[key]
+        if entity_id not in docs_by_id:
+            # Lookup could be invalidated in meantime
+            self._pending_ids[key].add(entity_id)
+            self._flush(key)
+        return docs_by_id.get(entity_id)
+
+    def _flush(self, key):
+        """Query all pending lookups of entity type with single query."""
+        project_name, entity_type = key
+        entity_ids = self._pending_ids.pop(key, set())
+        names = self._pending_names.pop(key, set())
+        docs_by_id = self._docs_by_id[key]
+        ids_by_name = self._ids_by_name[key]
+        entity_ids.difference_update(docs_by_id.keys())
+        names.difference_update(ids_by_name.keys())
+
+        conditions = []
+        if entity_ids:
+            conditions.append({"_id": {"$in": list(entity_ids)}})
+        if names:
+            conditions.append({"name": {"$in": list(names)}})
+        if not conditions:
+            return
+
+        doc_types = ENTITY_QUERY_TYPES[entity_type]
+        if len(doc_types) == 1:
+            query_filter = {"type": doc_types[0]}
+        else:
+            query_filter = {"type": {"$in": doc_types}}
+        if len(conditions) == 1:
+            query_filter.update(conditions[0])
+        else:
+            query_filter["$or"] = conditions
+
+        docs = get_project_connection(project_name).find(query_filter)
+        self.prime(project_name, entity_type, docs)
+        # Remember missing entities
+        for entity_id in entity_ids:
+            docs_by_id.setdefault(entity_id, None)
+        for name in names:
+            ids_by_name.setdefault(name, None)
+
+
+def get_active_entity_cache():
+    """Entity cache of current thread.
+
+    Returns:
+        Union[EntityCache, None]: Cache if 'entity_cache' context is active.
+    """
+    return getattr(_THREAD_DATA, "cache", None)
+
+
+@contextlib.contextmanager
+def entity_cache():
+    """Cache entity documents in the context.
+
+    Nested contexts are using the outer cache. Cache is bound to current
+    thread.
+
+    Yields:
+        EntityCache: Active cache.
+    """
+    cache = get_active_entity_cache()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = EntityCache()
+    _THREAD_DATA.cache = cache
+    with _ACTIVE_CACHES_LOCK:
+        _ACTIVE_CACHES.add(cache)
+    try:
+        yield cache
+    finally:
+        _THREAD_DATA.cache = None
+        with _ACTIVE_CACHES_LOCK:
+            _ACTIVE_CACHES.discard(cache)
+
+
+def invalidate_entity_cache(project_name=None):
+    """Invalidate active caches of all threads.
+
+    Args:
+        project_name (Optional[str]): Invalidate only documents of project.
+    """
+    with _ACTIVE_CACHES_LOCK:
+        caches = tuple(_ACTIVE_CACHES)
+    for cache in caches:
+        cache.invalidate(project_name)
@@ -0,0 +1,489 @@
+"""Instrumentation of mongo queries.
+
+Queries are captured using pymongo command monitoring so all queries made
+through 'OpenPypeMongoConnection' clients are recorded, including cursors
+iterated outside of 'openpype.client' functions.
+
+Recording is disabled until a recorder is added. Recorders are objects with
+'record(query)' method which receives 'QueryRecord'. 'QueryStats' is default
+recorder which aggregates counts and latency per function and caller and can
+create N+1 report.
+
+Examples:
+    >>> from openpype.client.mongo import record_queries
+    >>> with record_queries() as stats:
+    ...     refresh_model()
+    >>> print(stats.format_report())
+
+Recording for whole process can be enabled by setting environment variable
+'OPENPYPE_MONGO_QUERY_STATS' to '1'. Report is logged on process exit.
+"""
+import os
+import sys
+import json
+import atexit
+import logging
+import threading
+import contextlib
+import collections
+
+import pymongo
+from pymongo import monitoring
+
+log = logging.getLogger(__name__)
+
+QUERY_STATS_ENV_KEY = "OPENPYPE_MONGO_QUERY_STATS"
+# Minimum number of same queries from one caller reported as N+1
+N_PLUS_ONE_THRESHOLD = 5
+
+_RECORDED_COMMANDS = {
+    "find",
+    "aggregate",
+    "count",
+    "distinct",
+    "insert",
+    "update",
+    "delete",
+    "findAndModify",
+}
+_PYMONGO_DIR = os.path.dirname(os.path.abspath(pymongo.__file__))
+_CLIENT_DIR = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+_THIS_FILE = os.path.abspath(__file__)
+# Fields of commands holding filter
+_FILTER_KEYS = ("filter", "query", "pipeline", "updates", "deletes")
+
+
+class QueryRecord(object):
+    """Information about single query.
+
+    Attributes:
+        command_name (str): Name of mongo command e.g. 'find'.
+        database (str): Database name.
+        collection (str): Collection (project) name.
+        shape (str): Query filter where values are replaced by their type.
+        function (Union[str, None]): Name of function in 'openpype.client'
+            which created the query.
+        caller (str): Code outside of 'openpype.client' which triggered
+            the query.
+        duration (float): Duration of query in seconds including duration of
+            fetching next batches of cursor.
+        documents (int): Number of returned documents.
+        succeeded (bool): Query did not fail.
+    """
+
+    __slots__ = (
+        "command_name",
+        "database",
+        "collection",
+        "shape",
+        "function",
+        "caller",
+        "duration",
+        "documents",
+        "succeeded",
+        "cursor_id",
+    )
+
+    def __init__(
+        self, command_name, database, collection, shape, function, caller
+    ):
+        self.command_name = command_name
+        self.database = database
+        self.collection = collection
+        self.shape = shape
+        self.function = function
+        self.caller = caller
+        self.duration = 0.0
+        self.documents = 0
+        self.succeeded = True
+        self.cursor_id = None
+
+
+class QueryStats(object):
+    """Recorder aggregating query records.
+
+    Args:
+        keep_records (Optional[bool]): Store all records in 'records'.
+    """
+
+    def __init__(self, keep_records=False):
+        self._lock = threading.Lock()
+        self._keep_records = keep_records
+        self.records = []
+        self.query_count = 0
+        self.document_count = 0
+        self.duration = 0.0
+        self.failed_count = 0
+        self._by_function = collections.defaultdict(_StatsItem)
+        self._by_caller = collections.defaultdict(_StatsItem)
+        self._by_shape = collections.defaultdict(_StatsItem)
+
+    def record(self, query):
+        key = query.function or "<direct>"
+        shape_key = (
+            query.caller, query.command_name, query.collection, query.shape
+        )
+        with self._lock:
+            if self._keep_records:
+                self.records.append(query)
+            self.query_count += 1
+            self.document_count += query.documents
+            self.duration += query.duration
+            if not query.succeeded:
+                self.failed_count += 1
+            self._by_function[key].add(query)
+            self._by_caller[(key, query.caller)].add(query)
+            self._by_shape[shape_key].add(query)
+
+    def get_function_stats(self):
+        """Stats by 'openpype.client' function.
+
+        Returns:
+            list[dict[str, Any]]: Stats sorted by duration.
+        """
+        with self._lock:
+            items = [
+                item.to_data(function=function)
+                for function, item in self._by_function.items()
+            ]
+        return sorted(items, key=lambda i: i["duration"], reverse=True)
+
+    def get_caller_stats(self):
+        """Stats by 'openpype.client' function and its caller.
+
+        Returns:
+            list[dict[str, Any]]: Stats sorted by duration.
+        """
+        with self._lock:
+            items = [
+                item.to_data(function=function, caller=caller)
+                for (function, caller), item in self._by_caller.items()
+            ]
+        return sorted(items, key=lambda i: i["duration"], reverse=True)
+
+    def get_n_plus_one_report(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """Queries with same filter shape repeated by single caller.
+
+        These are usually queries in a loop which could be replaced by
+        single query with '$in' filter.
+
+        Args:
+            threshold (Optional[int]): Minimum count of repeated queries.
+
+        Returns:
+            list[dict[str, Any]]: Repeated queries sorted by count.
+        """
+        output = []
+        with self._lock:
+            for key, item in self._by_shape.items():
+                if item.count < threshold:
+                    continue
+                caller, command_name, collection, shape = key
+                output.append(item.to_data(
+                    caller=caller,
+                    command=command_name,
+                    collection=collection,
+                    shape=shape,
+                ))
+        return sorted(output, key=lambda i: i["count"], reverse=True)
+
+    def format_report(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """Human readable report of recorded queries."""
+        lines = [
+            "Mongo queries: {} ({} failed), documents: {}, time: {:.3f}s"
+            .format(
+                self.query_count,
+                self.failed_count,
+                self.document_count,
+                self.duration
+            ),
+            "",
+            "By caller:",
+        ]
+        for item in self.get_caller_stats():
+            lines.append(
+                "  {count:>6} queries {documents:>8} docs {duration:>8.3f}s"
+                "  {function} <- {caller}".format(**item)
+            )
+
+        n_plus_one = self.get_n_plus_one_report(threshold)
+        if n_plus_one:
+            lines.extend(["", "Possible N+1 queries:"])
+            for item in n_plus_one:
+                lines.append(
+                    "  {count:>6}x {command} '{collection}' {shape}"
+                    "  <- {caller}".format(**item)
+                )
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+            self.query_count = 0
+            self.document_count = 0
+            self.duration = 0.0
+            self.failed_count = 0
+            self._by_function.clear()
+            self._by_caller.clear()
+            self._by_shape.clear()
+
+
+class _StatsItem(object):
+    __slots__ = ("count", "documents", "duration", "max_duration")
+
+    def __init__(self):
+        self.count = 0
+        self.documents = 0
+        self.duration = 0.0
+        self.max_duration = 0.0
+
+    def add(self, query):
+        self.count += 1
+        self.documents += query.documents
+        self.duration += query.duration
+        self.max_duration = max(self.max_duration, query.duration)
+
+    def to_data(self, **kwargs):
+        kwargs.update({
+            "count": self.count,
+            "documents": self.documents,
+            "duration": self.duration,
+            "max_duration": self.max_duration,
+        })
+        return kwargs
+
+
+def _get_value_shape(value):
+    if isinstance(value, dict):
+        return {
+            key: _get_value_shape(value[key])
+            for key in sorted(value)
+        }
+    if isinstance(value, (list, tuple)):
+        # Length of list is not part of shape so '$in' queries with
+        #   different count of ids are same
+        shapes = []
+        for item in value:
+            shape = _get_value_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return type(value).__name__
+
+
+def get_query_shape(command):
+    """Filter of command with values replaced by their type names."""
+    for key in _FILTER_KEYS:
+        if key in command:
+            return json.dumps(_get_value_shape(command[key]))
+    return ""
+
+
+def _get_frame_location(frame):
+    return "{}:{} {}".format(
+        frame.f_globals.get("__name__", "?"),
+        frame.f_lineno,
+        frame.f_code.co_name
+    )
+
+
+def _find_query_origin():
+    """Find 'openpype.client' function and its caller from call stack.
+
+    Returns:
+        tuple[Union[str, None], str]: Function name and caller location.
+    """
+    function = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename == _THIS_FILE or filename.startswith(_PYMONGO_DIR):
+            pass
+        elif filename.startswith(_CLIENT_DIR):
+            # Keep outermost function in 'openpype.client'
+            function = frame.f_code.co_name
+        else:
+            return function, _get_frame_location(frame)
+        frame = frame.f_back
+    return function, "<unknown>"
+
+
+def _get_reply_documents_count(command_name, reply):
+    if not reply:
+        return 0
+    cursor = reply.get("cursor")
+    if cursor:
+        batch = cursor.get("firstBatch")
+        if batch is None:
+            batch = cursor.get("nextBatch") or []
+        return len(batch)
+    if command_name == "distinct":
+        return len(reply.get("values") or [])
+    if command_name == "findAndModify":
+        return int(reply.get("value") is not None)
+    return int(reply.get("n") or 0)
+
+
+class QueryCommandListener(monitoring.CommandListener):
+    """Pymongo command listener passing query records to recorders.
+
+    Commands are ignored when there is no recorder so listener can be
+    attached to every client.
+    """
+
+    def __init__(self):
+        self._recorders = []
+        self._lock = threading.Lock()
+        # Queries waiting for reply by request id and connection
+        self._pending = {}
+        # Queries by cursor id to attribute 'getMore' to original query
+        self._cursors = {}
+
+    @property
+    def enabled(self):
+        return bool(self._recorders)
+
+    def add_recorder(self, recorder):
+        with self._lock:
+            if recorder not in self._recorders:
+                self._recorders = self._recorders + [recorder]
+
+    def remove_recorder(self, recorder):
+        with self._lock:
+            if recorder not in self._recorders:
+                return
+            self._recorders = [
+                item for item in self._recorders if item is not recorder
+            ]
+            # Pass queries with cursors that were not exhausted yet
+            for query in tuple(self._cursors.values()):
+                recorder.record(query)
+            if not self._recorders:
+                self._pending.clear()
+                self._cursors.clear()
+
+    def started(self, event):
+        if not self._recorders:
+            return
+
+        command_name = event.command_name
+        if command_name == "getMore":
+            query = self._cursors.get(event.command.get("getMore"))
+        elif command_name == "killCursors":
+            # Cursor was closed before it was exhausted
+            for cursor_id in event.command.get("cursors") or []:
+                query = self._cursors.pop(cursor_id, None)
+                if query is not None:
+                    self._record(query)
+            return
+        elif command_name in _RECORDED_COMMANDS:
+            command = event.command
+            function, caller = _find_query_origin()
+            query = QueryRecord(
+                command_name,
+                event.database_name,
+                command.get(command_name),
+                get_query_shape(command),
+                function,
+                caller
+            )
+        else:
+            return
+
+        if query is not None:
+            self._pending[(event.request_id, event.connection_id)] = query
+
+    def succeeded(self, event):
+        key = (event.request_id, event.connection_id)
+        query = self._pending.pop(key, None)
+        if query is None:
+            return
+
+        query.duration += event.duration_micros / 1000000.0
+        reply = event.reply
+        query.documents += _get_reply_documents_count(
+            query.command_name, reply
+        )
+        cursor_id = (reply.get("cursor") or {}).get("id")
+        if event.command_name == "getMore":
+            if not cursor_id:
+                self._cursors.pop(query.cursor_id, None)
+                self._record(query)
+            return
+
+        if cursor_id:
+            # Record is passed to recorders when cursor is exhausted
+            #   or closed
+            query.cursor_id = cursor_id
+            self._cursors[cursor_id] = query
+            return
+        self._record(query)
+
+    def failed(self, event):
+        key = (event.request_id, event.connection_id)
+        query = self._pending.pop(key, None)
+        if query is None:
+            return
+        query.duration += event.duration_micros / 1000000.0
+        query.succeeded = False
+        if event.command_name == "getMore":
+            self._cursors.pop(query.cursor_id, None)
+        self._record(query)
+
+    def _record(self, query):
+        for recorder in self._recorders:
+            try:
+                recorder.record(query)
+            except Exception:
+                log.warning("Query recorder failed", exc_info=True)
+
+
+_QUERY_LISTENER = QueryCommandListener()
+
+
+def get_query_listener():
+    """Listener which should be passed to mongo clients."""
+    return _QUERY_LISTENER
+
+
+def add_query_recorder(recorder):
+    """Start passing queries to recorder.
+
+    Args:
+        recorder (Any): Object with 'record(QueryRecord)' method.
+    """
+    _QUERY_LISTENER.add_recorder(recorder)
+
+
+def remove_query_recorder(recorder):
+    _QUERY_LISTENER.remove_recorder(recorder)
+
+
+@contextlib.contextmanager
+def record_queries(keep_records=False):
+    """Record queries made in the context.
+
+    Args:
+        keep_records (Optional[bool]): Keep all query records in stats.
+
+    Yields:
+        QueryStats: Stats of recorded queries.
+    """
+    stats = QueryStats(keep_records)
+    add_query_recorder(stats)
+    try:
+        yield stats
+    finally:
+        remove_query_recorder(stats)
+
+
+def _log_process_stats(stats):
+    log.info(stats.format_report())
+
+
+if os.getenv(QUERY_STATS_ENV_KEY) == "1":
+    _PROCESS_STATS = QueryStats()
+    add_query_recorder(_PROCESS_STATS)
+    atexit.register(_log_process_stats, _PROCESS_STATS)
@@ -12,12 +12,32 @@ from bson.json_util import (
 )
 
 from openpype import AYON_SERVER_ENABLED
+
+from .instrumentation import get_query_listener
+
 if sys.version_info[0] == 2:
     from urlparse import urlparse, parse_qs
 else:
     from urllib.parse import urlparse, parse_qs
 
 
+# Default options of mongo client by process type
+#   - options set in mongo url or by environment variables have priority
+MONGO_CLIENT_OPTIONS_BY_PROCESS_TYPE = {
+    "tray": {"maxPoolSize": 20, "maxIdleTimeMS": 300000},
+    # Keep number of connections from render nodes low
+    "farm": {"maxPoolSize": 5, "maxIdleTimeMS": 60000},
+    "event_server": {"maxPoolSize": 50},
+}
+# Environment variables overriding client options
+MONGO_CLIENT_OPTIONS_ENV_KEYS = {
+    "maxPoolSize": "OPENPYPE_MONGO_MAX_POOL_SIZE",
+    "minPoolSize": "OPENPYPE_MONGO_MIN_POOL_SIZE",
+    "maxIdleTimeMS": "OPENPYPE_MONGO_MAX_IDLE_TIME_MS",
+    "readPreference": "OPENPYPE_MONGO_READ_PREFERENCE",
+}
+
+
 class MongoEnvNotSet(Exception):
     pass
 
@@ -170,6 +190,66 @@ def validate_mongo_connection(mongo_uri):
     client.close()
 
 
+def get_mongo_process_type():
+    """Type of process used to define mongo client options.
+
+    Returns:
+        str: Process type set by 'OpenPypeMongoConnection.process_type',
+            'farm' for processes of farm jobs or 'default'.
+    """
+
+    if OpenPypeMongoConnection.process_type:
+        return OpenPypeMongoConnection.process_type
+
+    if (
+        os.getenv("OPENPYPE_RENDER_JOB") == "1"
+        or os.getenv("OPENPYPE_PUBLISH_JOB") == "1"
+    ):
+        return "farm"
+    return "default"
+
+
+def get_mongo_client_options(mongo_url, process_type=None):
+    """Options of mongo client for process type.
+
+    Options are defined by process type and can be overridden with
+    environment variables (e.g. 'OPENPYPE_MONGO_MAX_POOL_SIZE'). Options
+    which are already set in mongo url are skipped.
+
+    Args:
+        mongo_url (str): Url of mongo server.
+        process_type (Optional[str]): Process type. Current process type is
+            used if not passed.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for 'pymongo.MongoClient'.
+    """
+
+    if process_type is None:
+        process_type = get_mongo_process_type()
+
+    options = dict(
+        MONGO_CLIENT_OPTIONS_BY_PROCESS_TYPE.get(process_type) or {}
+    )
+    for key, env_key in MONGO_CLIENT_OPTIONS_ENV_KEYS.items():
+        value = os.getenv(env_key)
+        if not value:
+            continue
+        if key != "readPreference":
+            value = int(value)
+        options[key] = value
+
+    url_keys = {
+        key.lower()
+        for key in parse_qs(urlparse(mongo_url).query).keys()
+    }
+    return {
+        key: value
+        for key, value in options.items()
+        if key.lower() not in url_keys
+    }
+
+
 class OpenPypeMongoConnection:
     """Singleton MongoDB connection.
 
@@ -178,6 +258,13 @@ class OpenPypeMongoConnection:
 
     mongo_clients = {}
     log = logging.getLogger("OpenPypeMongoConnection")
+    # Process type defining client options (e.g. 'tray')
+    process_type = None
+
+    @classmethod
+    def set_process_type(cls, process_type):
+        """Set process type used for client options of new connections."""
+        cls.process_type = process_type
 
     @staticmethod
     def get_default_mongo_url():
@@ -220,9 +307,9 @@ class OpenPypeMongoConnection:
         if timeout is None:
             timeout = int(os.environ.get("AVALON_TIMEOUT") or 1000)
 
-        kwargs = {
-            "serverSelectionTimeoutMS": timeout
-        }
+        kwargs = get_mongo_client_options(mongo_url)
+        kwargs["serverSelectionTimeoutMS"] = timeout
+        kwargs["event_listeners"] = [get_query_listener()]
         if should_add_certificate_path_to_mongo_url(mongo_url):
             kwargs["tlsCAFile"] = certifi.where()
 
@@ -14,6 +14,7 @@ from openpype.client.operations_base import (
 )
 from .mongo import get_project_connection
 from .entities import get_project
+from .entity_cache import invalidate_entity_cache
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -505,6 +506,7 @@ class MongoOperationsSession(BaseOperationsSession):
             if bulk_writes:
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+            invalidate_entity_cache(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -542,6 +544,37 @@ class MongoOperationsSession(BaseOperationsSession):
         return operation
 
 
+# Indexes of project collection by name
+PROJECT_INDEXES = {
+    # Published files looked up by hash of their source file
+    "version_source_hash": {
+        "keys": "data.sourceHashEntries.hash",
+        "partialFilterExpression": {"type": "version"},
+    },
+}
+
+
+def create_project_indexes(project_name):
+    """Create indexes of project collection.
+
+    Indexes are created when project is created. Existing projects can be
+    updated using 'create_project_indexes' command. Existing indexes are kept
+    untouched.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    conn = get_project_connection(project_name)
+    existing_names = set(conn.index_information().keys())
+    for name, index_data in PROJECT_INDEXES.items():
+        if name in existing_names:
+            continue
+        index_data = copy.deepcopy(index_data)
+        keys = index_data.pop("keys")
+        conn.create_index(keys, name=name, background=True, **index_data)
+
+
 def create_project(
     project_name,
     project_code,
@@ -601,6 +634,7 @@ def create_project(
         project_name, project_doc["type"], project_doc
     )
     op_session.commit()
+    create_project_indexes(project_name)
 
     # Load ProjectSettings for the project and save it to store all attributes
     #   and Anatomy
@@ -1,4 +1,5 @@
 import collections
+import contextlib
 
 from openpype.client.mongo.operations import CURRENT_THUMBNAIL_SCHEMA
 
@@ -476,6 +477,10 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return get_versions(project_name, version_ids=version_ids, fields=fields)
 
 
+def get_source_hash_paths(project_name, source_hashes, include_legacy=False):
+    raise NotImplementedError("'get_source_hash_paths' not implemented")
+
+
 def version_is_latest(project_name, version_id):
     con = get_ayon_server_api_connection()
     return con.version_is_latest(project_name, version_id)
@@ -723,3 +728,17 @@ def get_workfile_info(
         if workfile_info["name"] == filename:
             return convert_v4_workfile_info_to_v3(workfile_info, task)
     return None
+
+
+@contextlib.contextmanager
+def entity_cache():
+    """Entity cache is not available with AYON server.
+
+    Yields:
+        None: Queries are not cached.
+    """
+    yield None
+
+
+def invalidate_entity_cache(project_name=None):
+    pass
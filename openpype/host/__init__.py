@@ -11,6 +11,8 @@ from .interfaces import (
 
 from .dirmap import HostDirmap
 
+from .containers_index import ContainersIndex
+
 
 __all__ = (
     "HostBase",
@@ -21,4 +23,6 @@ __all__ = (
     "INewPublisher",
 
     "HostDirmap",
+
+    "ContainersIndex",
 )
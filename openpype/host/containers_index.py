@@ -0,0 +1,150 @@
+import threading
+
+
+class ContainersIndex(object):
+    """Index of containers in host scene.
+
+    Scene is scanned for containers only once and the index is kept up to
+    date by host callbacks which notify the index about added, removed,
+    renamed or changed nodes. Notified nodes are parsed again only when
+    containers are requested.
+
+    Host integration defines how nodes are listed and parsed. The index does
+    not use any host api so it can be used by any host.
+
+    Args:
+        list_nodes (Callable[[], Iterable[Any]]): Function listing nodes
+            which can be containers. Used for full scan of scene.
+        parse_node (Callable[[Any], Union[dict[str, Any], None]]): Function
+            returning container data of node or 'None' if node is not
+            a container.
+        get_node_key (Optional[Callable[[Any], Hashable]]): Function
+            returning unique key of node. Node itself is used as key if not
+            passed.
+    """
+
+    def __init__(self, list_nodes, parse_node, get_node_key=None):
+        if get_node_key is None:
+            get_node_key = _get_node_itself
+
+        self._list_nodes = list_nodes
+        self._parse_node = parse_node
+        self._get_node_key = get_node_key
+
+        self._lock = threading.RLock()
+        self._containers_by_key = {}
+        self._dirty_nodes_by_key = {}
+        self._needs_scan = True
+        self._suspended = False
+
+    @property
+    def is_suspended(self):
+        return self._suspended
+
+    def suspend(self):
+        """Stop tracking of changes until 'reset' is called.
+
+        Should be used when scene is being replaced (e.g. before open of
+        scene) so the index does not process nodes of closed scene.
+        Containers are scanned on each request until 'reset' is called.
+        """
+        with self._lock:
+            self._suspended = True
+            self._clear()
+
+    def reset(self):
+        """Scan scene again on next request and continue with tracking."""
+        with self._lock:
+            self._suspended = False
+            self._clear()
+
+    def node_added(self, node):
+        self._mark_dirty(node)
+
+    def node_changed(self, node):
+        self._mark_dirty(node)
+
+    def node_renamed(self, node, previous_key=None):
+        """Node was renamed.
+
+        Args:
+            node (Any): Renamed node.
+            previous_key (Optional[Hashable]): Key of node before rename.
+                Should be passed when key of node is based on its name.
+        """
+        with self._lock:
+            if previous_key is not None:
+                self._containers_by_key.pop(previous_key, None)
+                self._dirty_nodes_by_key.pop(previous_key, None)
+            self._mark_dirty(node)
+
+    def node_removed(self, node):
+        with self._lock:
+            if self._suspended or self._needs_scan:
+                return
+            key = self._get_node_key(node)
+            self._containers_by_key.pop(key, None)
+            self._dirty_nodes_by_key.pop(key, None)
+
+    def get_containers(self):
+        """Containers in scene.
+
+        Returns:
+            list[dict[str, Any]]: Copies of container data.
+        """
+        with self._lock:
+            if self._suspended:
+                return [
+                    container
+                    for _, container in self._scan()
+                ]
+
+            if self._needs_scan:
+                self._containers_by_key = dict(self._scan())
+                self._dirty_nodes_by_key.clear()
+                self._needs_scan = False
+
+            elif self._dirty_nodes_by_key:
+                self._update_dirty_nodes()
+
+            return [
+                dict(container)
+                for container in self._containers_by_key.values()
+            ]
+
+    def _clear(self):
+        self._containers_by_key = {}
+        self._dirty_nodes_by_key = {}
+        self._needs_scan = True
+
+    def _mark_dirty(self, node):
+        with self._lock:
+            if self._suspended or self._needs_scan:
+                return
+            self._dirty_nodes_by_key[self._get_node_key(node)] = node
+
+    def _scan(self):
+        for node in self._list_nodes():
+            container = self._parse_node(node)
+            if container:
+                yield self._get_node_key(node), container
+
+    def _update_dirty_nodes(self):
+        dirty_nodes_by_key = self._dirty_nodes_by_key
+        self._dirty_nodes_by_key = {}
+        for key, node in dirty_nodes_by_key.items():
+            # Key could change after node was marked dirty, e.g. when key is
+            #   based on name of node which was renamed without notification
+            current_key = self._get_node_key(node)
+            if current_key != key:
+                self._containers_by_key.pop(key, None)
+
+            container = self._parse_node(node)
+            if container:
+                self._containers_by_key[current_key] = container
+            else:
+                self._containers_by_key.pop(current_key, None)
+
+
+def _get_node_itself(node):
+    return node
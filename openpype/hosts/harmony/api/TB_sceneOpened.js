@@ -203,64 +203,72 @@ function Client() {
     /**
      * Process data received in buffer.
      * This detects messages by looking for header and message length.
+     * Buffer may contain multiple messages (e.g. batch of requests) and
+     * all of them are processed. Incomplete message stays in buffer until
+     * more data are received.
      * @function
      */
     self.processBuffer = function() {
-        var length = self.waitingForData;
-        if (self.waitingForData == 0) {
-            // read header from the buffer and remove it
-            var header_data = self.buffer.mid(0, 6);
-            self.buffer = self.buffer.remove(0, 6);
-
-            // convert header to string
-            var header = '';
-            for (var i = 0; i < header_data.size(); ++i) {
-                // data in QByteArray come out as signed bytes.
-                var unsigned = header_data.at(i) & 0xff;
-                header = header.concat(String.fromCharCode(unsigned));
-            }
-
-            // skip 'AH' and read only length, unpack it to integer
-            header = header.substr(2);
-            length = self.unpack(header);
-        }
-
-        var data = self.buffer.mid(0, length);
-        self.logDebug('--- Expected: ' + length + ' | Got: ' + data.size());
-        if (length > data.size()) {
-            // we didn't received whole message.
-            self.waitingForData = length;
-            self.logDebug('... waiting for more data (' + length + ') ...');
-            return;
-        }
-        self.waitingForData = 0;
-        self.buffer.remove(0, length);
+        while (true) {
+            var length = self.waitingForData;
+            if (length == 0) {
+                if (self.buffer.size() < 6) {
+                    // header was not received completely yet
+                    return;
+                }
+                // read header from the buffer and remove it
+                var header_data = self.buffer.mid(0, 6);
+                self.buffer = self.buffer.remove(0, 6);
+
+                // convert header to string
+                var header = '';
+                for (var i = 0; i < header_data.size(); ++i) {
+                    // data in QByteArray come out as signed bytes.
+                    var unsigned = header_data.at(i) & 0xff;
+                    header = header.concat(String.fromCharCode(unsigned));
+                }
 
-        for (var j = 0; j < data.size(); ++j) {
-            self.received = self.received.concat(String.fromCharCode(data.at(j)));
-        }
+                // skip 'AH' and read only length, unpack it to integer
+                header = header.substr(2);
+                length = self.unpack(header);
+            }
 
-        // self.logDebug('--- Received: ' + self.received);
-        var to_parse = self.received;
-        var request = JSON.parse(to_parse);
-        var mid = request.message_id;
-        // self.logDebug('[' + mid + '] - Request: ' + '\n' + JSON.stringify(request));
-        self.logDebug('[' + mid + '] Received.');
+            var data = self.buffer.mid(0, length);
+            self.logDebug('--- Expected: ' + length + ' | Got: ' + data.size());
+            if (length > data.size()) {
+                // we didn't received whole message.
+                self.waitingForData = length;
+                self.logDebug('... waiting for more data (' + length + ') ...');
+                return;
+            }
+            self.waitingForData = 0;
+            self.buffer.remove(0, length);
 
-        request.result = self.processRequest(request);
-        self.logDebug('[' + mid + '] Processing done.');
-        self.received = '';
+            for (var j = 0; j < data.size(); ++j) {
+                self.received = self.received.concat(String.fromCharCode(data.at(j)));
+            }
 
-        if (request.reply !== true) {
-            request.reply = true;
-            self.logDebug('[' + mid + '] Replying.');
-            self._send(JSON.stringify(request));
-        }
+            // self.logDebug('--- Received: ' + self.received);
+            var to_parse = self.received;
+            var request = JSON.parse(to_parse);
+            var mid = request.message_id;
+            // self.logDebug('[' + mid + '] - Request: ' + '\n' + JSON.stringify(request));
+            self.logDebug('[' + mid + '] Received.');
+
+            request.result = self.processRequest(request);
+            self.logDebug('[' + mid + '] Processing done.');
+            self.received = '';
+
+            if (request.reply !== true) {
+                request.reply = true;
+                self.logDebug('[' + mid + '] Replying.');
+                self._send(JSON.stringify(request));
+            }
 
-        if ((length < data.size()) || (length < self.buffer.size())) {
-            // we've received more data.
-            self.logDebug('--- Got more data to process ...');
-            self.processBuffer();
+            if (self.buffer.size() > 0) {
+                // we've received more data.
+                self.logDebug('--- Got more data to process ...');
+            }
         }
     };
 
@@ -4,7 +4,6 @@ import subprocess
 import threading
 import os
 import random
-import zipfile
 import sys
 import filecmp
 import shutil
@@ -23,6 +22,13 @@ from openpype.tools.stdout_broker.app import StdOutBroker
 from openpype.tools.utils import host_tools
 from openpype import style
 from openpype.lib.applications import get_non_python_host_kwargs
+from openpype.hosts.harmony.lib import (
+    HarmonyZipFile,
+    create_scene_archive,
+    get_archive_manifest_path,
+    load_archive_manifest,
+    save_archive_manifest,
+)
 
 # Setup logging.
 log = logging.getLogger(__name__)
@@ -67,18 +73,6 @@ def signature(postfix="func") -> str:
     return "f{}_{}".format(str(uuid4()).replace("-", "_"), postfix)
 
 
-class _ZipFile(zipfile.ZipFile):
-    """Extended check for windows invalid characters."""
-
-    # this is extending default zipfile table for few invalid characters
-    # that can come from Mac
-    _windows_illegal_characters = ":<>|\"?*\r\n\x00"
-    _windows_illegal_name_trans_table = str.maketrans(
-        _windows_illegal_characters,
-        "_" * len(_windows_illegal_characters)
-    )
-
-
 def main(*subprocess_args):
     # coloring in StdOutBroker
     os.environ["OPENPYPE_LOG_NO_COLORS"] = "False"
@@ -265,7 +259,7 @@ def launch_zip_file(filepath):
         unzip = True
 
     if unzip:
-        with _ZipFile(filepath, "r") as zip_ref:
+        with HarmonyZipFile(filepath, "r") as zip_ref:
             zip_ref.extractall(temp_path)
 
         if os.path.exists(os.path.join(temp_path, scene_name)):
@@ -354,20 +348,36 @@ def on_file_changed(path, threaded=True):
         zip_and_move(os.path.dirname(path), ProcessContext.workfile_path)
 
 
-def zip_and_move(source, destination):
+def zip_and_move(source, destination, incremental=True):
     """Zip a directory and move to `destination`.
 
+    Files which did not change since last save are copied from the
+    `destination` archive without recompression when `incremental` is
+    enabled.
+
     Args:
         source (str): Directory to zip and move to destination.
         destination (str): Destination file path to zip file.
+        incremental (bool): Reuse data of unchanged files from
+            previous archive.
 
     """
-    os.chdir(os.path.dirname(source))
-    shutil.make_archive(os.path.basename(source), "zip", source)
-    with _ZipFile(os.path.basename(source) + ".zip") as zr:
+    source = os.path.normpath(source)
+    archive_path = source + ".zip"
+    manifest_path = get_archive_manifest_path(source)
+    previous_manifest = None
+    if incremental:
+        previous_manifest = load_archive_manifest(manifest_path, destination)
+
+    manifest = create_scene_archive(
+        source, archive_path, destination, previous_manifest
+    )
+    with HarmonyZipFile(archive_path) as zr:
         if zr.testzip() is not None:
             raise Exception("File archive is corrupted.")
-    shutil.move(os.path.basename(source) + ".zip", destination)
+    shutil.move(archive_path, destination)
+    if incremental:
+        save_archive_manifest(manifest_path, destination, manifest)
     log.debug(f"Saved '{source}' to '{destination}'")
 
 
@@ -516,6 +526,21 @@ def send(request):
     return ProcessContext.server.send(request)
 
 
+def send_batch(requests):
+    """Send multiple requests to Harmony at once.
+
+    Requests are processed by Harmony in passed order and replies are
+    returned when all of them are processed.
+
+    Args:
+        requests (Iterable[dict]): Requests to send.
+
+    Returns:
+        list[Union[dict, None]]: Replies in order of requests.
+    """
+    return ProcessContext.server.send_batch(requests)
+
+
 def select_nodes(nodes):
     """ Selects nodes in Node View """
     _ = send(
@@ -138,8 +138,7 @@ def application_launch(event):
             script += child.read_text()
 
     # send scripts to Harmony
-    harmony.send({"script": pype_harmony_js})
-    harmony.send({"script": script})
+    harmony.send_batch([{"script": pype_harmony_js}, {"script": script}])
     inject_avalon_js()
 
     # ensure_scene_settings()
@@ -6,22 +6,30 @@ import json
 import traceback
 import importlib
 import functools
-import time
 import struct
 from datetime import datetime
 import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from . import lib
 
+# Seconds to wait for reply before logging an error and waiting again
+REPLY_TIMEOUT = 30
+# How many times is waited for reply before giving up
+REPLY_MAX_TRIES = 30
+
 
 class Server(threading.Thread):
     """Class for communication with Toon Boon Harmony.
 
+    Requests are sent with unique message id and replies from Harmony are
+    matched to waiting requests by the id, so requests can be sent from
+    multiple threads and multiple requests can wait for replies at once.
+
     Attributes:
         connection (Socket): connection holding object.
         received (str): received data buffer.any(iterable)
         port (int): port number.
-        message_id (int): index of last message going out.
-        queue (dict): dictionary holding queue of incoming messages.
+        message_id (int): index of next message going out.
 
     """
 
@@ -34,9 +42,14 @@ class Server(threading.Thread):
         self.port = port
         self.message_id = 1
 
+        # Futures waiting for reply by message id
+        self._waiters = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._connected = threading.Event()
+
         # Setup logging.
         self.log = logging.getLogger(__name__)
-        self.log.setLevel(logging.DEBUG)
 
         # Create a TCP/IP socket
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -51,7 +64,6 @@ class Server(threading.Thread):
 
         # Listen for incoming connections
         self.socket.listen(1)
-        self.queue = {}
 
     def process_request(self, request):
         """Process incoming request.
@@ -65,9 +77,10 @@ class Server(threading.Thread):
                 "reply" (bool),  # Optional wait for method completion.
             }
         """
-        pretty = self._pretty(request)
-        self.log.debug(
-            f"[{self.timestamp()}] Processing request:\n{pretty}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            pretty = self._pretty(request)
+            self.log.debug(
+                f"[{self.timestamp()}] Processing request:\n{pretty}")
 
         try:
             module = importlib.import_module(request["module"])
@@ -81,25 +94,44 @@ class Server(threading.Thread):
         except Exception:
             self.log.error(traceback.format_exc())
 
+    def _recv_exactly(self, length):
+        """Receive exactly 'length' bytes from connection.
+
+        Returns:
+            Union[bytes, None]: Received data or None if connection
+                was closed.
+        """
+        data = b""
+        while len(data) < length:
+            connection = self.connection
+            if connection is None:
+                self.log.error(f"[{self.timestamp()}] Connection is broken")
+                return None
+            chunk = connection.recv(length - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
     def receive(self):
         """Receives data from `self.connection`.
 
         When the data is a json serializable string, a reply is sent then
-        processing of the request.
+        processing of the request. Replies from Harmony are passed to
+        requests waiting for them.
         """
-        current_time = time.time()
         while True:
-            self.log.info("wait ttt")
             # Receive the data in small chunks and retransmit it
             request = None
             try:
-                header = self.connection.recv(10)
+                # Header may be received in multiple chunks
+                header = self._recv_exactly(10)
             except OSError:
                 # could happen on MacOS
                 self.log.info("")
                 break
 
-            if len(header) == 0:
+            if not header:
                 # null data received, socket is closing.
                 self.log.info(f"[{self.timestamp()}] Connection closing.")
                 break
@@ -109,26 +141,20 @@ class Server(threading.Thread):
             content_length_str = header[2:].decode()
 
             length = int(content_length_str, 16)
-            data = self.connection.recv(length)
-            while (len(data) < length):
-                # we didn't received everything in first try, lets wait for
-                # all data.
-                self.log.info("loop")
-                time.sleep(0.1)
-                if self.connection is None:
-                    self.log.error(f"[{self.timestamp()}] "
-                                   "Connection is broken")
-                    break
-                if time.time() > current_time + 30:
-                    self.log.error(f"[{self.timestamp()}] Connection timeout.")
-                    break
-
-                data += self.connection.recv(length - len(data))
-            self.log.debug("data:: {} {}".format(data, type(data)))
+            try:
+                data = self._recv_exactly(length)
+            except OSError:
+                data = None
+
+            if data is None:
+                self.log.info(f"[{self.timestamp()}] Connection closing.")
+                break
+
             self.received += data.decode("utf-8")
-            pretty = self._pretty(self.received)
-            self.log.debug(
-                f"[{self.timestamp()}] Received:\n{pretty}")
+            if self.log.isEnabledFor(logging.DEBUG):
+                pretty = self._pretty(self.received)
+                self.log.debug(
+                    f"[{self.timestamp()}] Received:\n{pretty}")
 
             try:
                 request = json.loads(self.received)
@@ -141,27 +167,46 @@ class Server(threading.Thread):
             if request is None:
                 continue
 
-            if "message_id" in request.keys():
-                message_id = request["message_id"]
-                self.message_id = message_id + 1
-                self.log.debug(f"--- storing request as {message_id}")
-                self.queue[message_id] = request
-            if "reply" not in request.keys():
-                request["reply"] = True
-                self.send(request)
-                self.process_request(request)
-
-                if "message_id" in request.keys():
-                    try:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"Removing from the queue {message_id}")
-                        del self.queue[message_id]
-                    except IndexError:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"{message_id} is no longer in queue")
-            else:
-                self.log.debug(f"[{self.timestamp()}] "
-                               "received data was just a reply.")
+            message_id = request.get("message_id")
+            if "reply" in request.keys():
+                self._resolve_reply(message_id, request)
+                continue
+
+            if message_id is not None:
+                # Make sure next message ids won't collide with Harmony's
+                with self._lock:
+                    self.message_id = max(self.message_id, message_id + 1)
+
+            request["reply"] = True
+            self.send(request)
+            self.process_request(request)
+
+        self._cancel_waiters()
+
+    def _resolve_reply(self, message_id, reply):
+        with self._lock:
+            future = self._waiters.pop(message_id, None)
+
+        if future is None:
+            self.log.debug(
+                f"[{self.timestamp()}] "
+                f"Nobody is waiting for reply {message_id}.")
+            return
+
+        self.log.debug(
+            f"[{self.timestamp()}] Got reply for {message_id}.")
+        future.set_result(reply)
+
+    def _cancel_waiters(self):
+        """Fail all requests waiting for reply when connection closed."""
+        with self._lock:
+            waiters = list(self._waiters.items())
+            self._waiters.clear()
+
+        for message_id, future in waiters:
+            future.set_exception(ConnectionError(
+                f"Connection to Harmony closed before reply to {message_id}."
+            ))
 
     def run(self):
         """Entry method for server.
@@ -172,6 +217,7 @@ class Server(threading.Thread):
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Waiting for a connection.")
         self.connection, client_address = self.socket.accept()
+        self._connected.set()
 
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Connection from: {client_address}")
@@ -187,31 +233,86 @@ class Server(threading.Thread):
             socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM
             ).connect(("localhost", self.port))
+            self._connected.wait()
 
         self.connection.close()
         self.connection = None
+        self._connected.clear()
 
         self.socket.close()
+        self._cancel_waiters()
 
-    def _send(self, message):
+    def _send(self, message, message_id=None):
         """Send a message to Harmony.
 
         Args:
             message (str): Data to send to Harmony.
+            message_id (Optional[int]): Id of message used for logging.
         """
         # Wait for a connection.
-        while not self.connection:
-            pass
+        self._connected.wait()
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
         encoded = message.encode("utf-8")
         coded_message = b"AH" + struct.pack('>I', len(encoded)) + encoded
-        pretty = self._pretty(coded_message)
-        self.log.debug(
-            f"[{timestamp}] Sending [{self.message_id}]:\n{pretty}")
-        self.log.debug(f"--- Message length: {len(encoded)}")
-        self.connection.sendall(coded_message)
-        self.message_id += 1
+        if self.log.isEnabledFor(logging.DEBUG):
+            pretty = self._pretty(coded_message)
+            self.log.debug(
+                f"[{self.timestamp()}] Sending [{message_id}]:\n{pretty}")
+            self.log.debug(f"--- Message length: {len(encoded)}")
+
+        with self._send_lock:
+            self.connection.sendall(coded_message)
+
+    def send_async(self, request):
+        """Send a request to Harmony without waiting for reply.
+
+        Args:
+            request (dict): Data to send to Harmony.
+
+        Returns:
+            Union[Future, None]: Future with reply from Harmony or None if
+                request is a reply.
+        """
+        future = None
+        with self._lock:
+            message_id = self.message_id
+            self.message_id += 1
+            request["message_id"] = message_id
+            if not request.get("reply"):
+                future = Future()
+                self._waiters[message_id] = future
+
+        try:
+            self._send(json.dumps(request), message_id)
+        except Exception as exc:
+            if future is not None:
+                with self._lock:
+                    self._waiters.pop(message_id, None)
+                future.set_exception(exc)
+        return future
+
+    def wait_for_reply(self, future, message_id=None):
+        """Wait for reply of a request sent with 'send_async'.
+
+        Args:
+            future (Future): Future returned by 'send_async'.
+            message_id (Optional[int]): Id of message used for logging.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony or None if Harmony did not
+                reply in time.
+        """
+        for try_index in range(1, REPLY_MAX_TRIES + 1):
+            try:
+                return future.result(REPLY_TIMEOUT)
+            except FutureTimeoutError:
+                self.log.error((f"[{self.timestamp()}][{message_id}] "
+                                f"No reply from Harmony in {REPLY_TIMEOUT}s."
+                                f" Retrying {try_index}"))
+
+        with self._lock:
+            self._waiters.pop(message_id, None)
+        return None
 
     def send(self, request):
         """Send a request in dictionary to Harmony.
@@ -220,48 +321,38 @@ class Server(threading.Thread):
 
         Args:
             request (dict): Data to send to Harmony.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony.
         """
-        request["message_id"] = self.message_id
-        self._send(json.dumps(request))
-        if request.get("reply"):
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")
+        future = self.send_async(request)
+        if future is None:
             self.log.debug(
-                f"[{timestamp}] sent reply, not waiting for anything.")
+                f"[{self.timestamp()}] sent reply, not waiting for anything.")
             return None
-        result = None
-        current_time = time.time()
-        try_index = 1
-        while True:
-            time.sleep(0.1)
-            if time.time() > current_time + 30:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.error((f"[{timestamp}][{self.message_id}] "
-                                "No reply from Harmony in 30s. "
-                                f"Retrying {try_index}"))
-                try_index += 1
-                current_time = time.time()
-            if try_index > 30:
-                break
-            try:
-                result = self.queue[request["message_id"]]
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.debug((f"[{timestamp}] Got request "
-                                f"id {self.message_id}, "
-                                "removing from queue"))
-                del self.queue[request["message_id"]]
-                break
-            except KeyError:
-                # response not in received queue yey
-                pass
-            try:
-                result = json.loads(self.received)
-                break
-            except json.decoder.JSONDecodeError:
-                pass
+        return self.wait_for_reply(future, request["message_id"])
 
-        self.received = ""
+    def send_batch(self, requests):
+        """Send multiple requests to Harmony and wait for all replies.
 
-        return result
+        All requests are sent at once and Harmony processes all buffered
+        messages in order, so there is no round-trip waiting between them.
+
+        Args:
+            requests (Iterable[dict]): Requests to send.
+
+        Returns:
+            list[Union[dict, None]]: Replies in order of requests.
+        """
+        sent = []
+        for request in requests:
+            sent.append((self.send_async(request), request["message_id"]))
+
+        return [
+            self.wait_for_reply(future, message_id)
+            if future is not None else None
+            for future, message_id in sent
+        ]
 
     def _pretty(self, message) -> str:
         # result = pformat(message, indent=2)
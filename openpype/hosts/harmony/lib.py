@@ -0,0 +1,377 @@
+"""Incremental archiving of Harmony scene folders.
+
+Harmony workfiles are zip archives of scene folder. Most of files in scene
+folder (drawings, palettes, audio) don't change between saves so archive
+can reuse their compressed data from previously saved archive instead of
+compressing them again. Manifest with hashes of archived files is stored
+next to the local scene folder.
+"""
+import os
+import json
+import zlib
+import struct
+import hashlib
+import zipfile
+import logging
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+# Files bigger than this are compressed by streaming in main thread
+MAX_BUFFERED_SIZE = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# Indexes in unpacked local file header
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+
+
+class HarmonyZipFile(zipfile.ZipFile):
+    """Extended check for windows invalid characters."""
+
+    # this is extending default zipfile table for few invalid characters
+    # that can come from Mac
+    _windows_illegal_characters = ":<>|\"?*\r\n\x00"
+    _windows_illegal_name_trans_table = str.maketrans(
+        _windows_illegal_characters,
+        "_" * len(_windows_illegal_characters)
+    )
+
+    def write_compressed(self, zinfo, chunks):
+        """Write member with already compressed data.
+
+        Args:
+            zinfo (zipfile.ZipInfo): Member info with filled 'CRC',
+                'file_size', 'compress_size' and 'compress_type'.
+            chunks (Iterable[bytes]): Compressed data.
+        """
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle"
+                " exists."
+            )
+
+        # Sizes are known so data descriptor is not used
+        zinfo.flag_bits = 0
+        with self._lock:
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader())
+            written = 0
+            for chunk in chunks:
+                self.fp.write(chunk)
+                written += len(chunk)
+            if written != zinfo.compress_size:
+                raise zipfile.BadZipFile(
+                    "Size of compressed data of '{}' does not match".format(
+                        zinfo.filename
+                    )
+                )
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+            self.start_dir = self.fp.tell()
+
+
+def get_archive_manifest_path(source):
+    """Path to manifest of archive created from scene folder."""
+    return os.path.normpath(source) + MANIFEST_SUFFIX
+
+
+def _get_archive_stamp(archive_path):
+    stat = os.stat(archive_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_archive_manifest(manifest_path, archive_path):
+    """Load manifest of files which are stored in archive.
+
+    Manifest is returned only if it describes the archive, e.g. archive was
+    not overridden since the manifest was stored.
+
+    Returns:
+        Union[dict[str, dict[str, Any]], None]: Manifest items by member
+            name.
+    """
+    if not os.path.exists(manifest_path) or not os.path.exists(archive_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            manifest = json.load(stream)
+    except ValueError:
+        log.warning("Invalid archive manifest '{}'".format(manifest_path))
+        return None
+
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("archive") != os.path.normpath(archive_path)
+        or manifest.get("stamp") != _get_archive_stamp(archive_path)
+    ):
+        return None
+    return manifest["files"]
+
+
+def save_archive_manifest(manifest_path, archive_path, files):
+    """Store manifest of files stored in archive.
+
+    Args:
+        manifest_path (str): Path where manifest is stored.
+        archive_path (str): Path to archive in its final location.
+        files (dict[str, dict[str, Any]]): Manifest items by member name
+            returned by 'create_scene_archive'.
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "archive": os.path.normpath(archive_path),
+        "stamp": _get_archive_stamp(archive_path),
+        "files": files,
+    }
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as stream:
+        json.dump(manifest, stream)
+    os.replace(tmp_path, manifest_path)
+
+
+def _hash_file(filepath):
+    hasher = hashlib.sha1()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _compress(data):
+    # Same compressor as 'zipfile' uses for ZIP_DEFLATED
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+    )
+    return compressor.compress(data) + compressor.flush()
+
+
+def _prepare_member(filepath, stat, previous_item):
+    """Find out if file changed and compress it if it did.
+
+    Returns:
+        tuple[dict[str, Any], Union[bytes, None], bool]: Manifest item,
+            compressed data and if file content is same as in previous
+            archive. Compressed data are 'None' for unchanged files and
+            files which are too big to be held in memory.
+    """
+    item = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if (
+        previous_item
+        and previous_item["size"] == stat.st_size
+        and previous_item["mtime_ns"] == stat.st_mtime_ns
+    ):
+        item["sha1"] = previous_item["sha1"]
+        item["crc"] = previous_item["crc"]
+        return item, None, True
+
+    if stat.st_size > MAX_BUFFERED_SIZE:
+        item["sha1"] = _hash_file(filepath)
+        if previous_item and previous_item["sha1"] == item["sha1"]:
+            item["crc"] = previous_item["crc"]
+            return item, None, True
+        return item, None, False
+
+    with open(filepath, "rb") as stream:
+        data = stream.read()
+    item["size"] = len(data)
+    item["sha1"] = hashlib.sha1(data).hexdigest()
+    item["crc"] = zlib.crc32(data)
+    if previous_item and previous_item["sha1"] == item["sha1"]:
+        return item, None, True
+    return item, _compress(data), False
+
+
+def _iter_member_data(stream, zinfo):
+    """Iterate over compressed data of member in archive."""
+    stream.seek(zinfo.header_offset)
+    header = stream.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader:
+        raise zipfile.BadZipFile("Truncated file header")
+    header = struct.unpack(zipfile.structFileHeader, header)
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile("Bad magic number for file header")
+    stream.seek(
+        header[_FH_FILENAME_LENGTH] + header[_FH_EXTRA_FIELD_LENGTH], 1
+    )
+    remaining = zinfo.compress_size
+    while remaining > 0:
+        chunk = stream.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated file data")
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _iter_scene_files(source):
+    """Walk scene folder in same order as 'shutil.make_archive'."""
+    for dirpath, dirnames, filenames in os.walk(source):
+        for name in sorted(dirnames):
+            path = os.path.join(dirpath, name)
+            yield path, os.path.relpath(path, source), True
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.isfile(path):
+                yield path, os.path.relpath(path, source), False
+
+
+def _get_previous_members(previous_archive):
+    if not previous_archive:
+        return {}
+    try:
+        with zipfile.ZipFile(previous_archive) as zip_file:
+            return {
+                zinfo.filename: zinfo
+                for zinfo in zip_file.infolist()
+                # Skip encrypted members
+                if not zinfo.flag_bits & 0x1
+            }
+    except (OSError, zipfile.BadZipFile):
+        log.warning(
+            "Previous archive '{}' can't be reused".format(previous_archive),
+            exc_info=True
+        )
+    return {}
+
+
+def create_scene_archive(
+    source, archive_path,
+    previous_archive=None, previous_manifest=None,
+    max_workers=None
+):
+    """Create archive of scene folder.
+
+    Files which did not change since previous archive was created are
+    copied from previous archive without recompression. Changed files are
+    compressed in multiple threads.
+
+    Args:
+        source (str): Scene folder.
+        archive_path (str): Path where archive is created.
+        previous_archive (Optional[str]): Archive created from previous
+            state of the scene folder.
+        previous_manifest (Optional[dict[str, dict[str, Any]]]): Manifest
+            items of previous archive. Previous archive is not used without
+            manifest.
+        max_workers (Optional[int]): Number of threads compressing files.
+
+    Returns:
+        dict[str, dict[str, Any]]: Manifest items of the created archive.
+    """
+    previous_manifest = previous_manifest or {}
+    previous_members = {}
+    if previous_manifest:
+        previous_members = _get_previous_members(previous_archive)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    manifest = {}
+    previous_stream = None
+    if previous_members:
+        previous_stream = open(previous_archive, "rb")
+
+    counts = {True: 0, False: 0}
+
+    def _write_next(pending):
+        result = _write_member(
+            zip_file, previous_stream, previous_members, *pending.popleft()
+        )
+        if result is not None:
+            member_name, item, reused = result
+            manifest[member_name] = item
+            counts[reused] += 1
+
+    try:
+        with HarmonyZipFile(
+            archive_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zip_file, ThreadPoolExecutor(max_workers) as executor:
+            # Limit number of prepared members held in memory
+            pending = collections.deque()
+            for path, arcname, is_dir in _iter_scene_files(source):
+                if is_dir:
+                    pending.append((path, arcname, None, None))
+                else:
+                    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                    future = executor.submit(
+                        _prepare_member,
+                        path,
+                        os.stat(path),
+                        previous_manifest.get(zinfo.filename)
+                    )
+                    pending.append((path, arcname, zinfo, future))
+
+                while len(pending) > max_workers * 2:
+                    _write_next(pending)
+
+            while pending:
+                _write_next(pending)
+
+    finally:
+        if previous_stream is not None:
+            previous_stream.close()
+
+    log.debug((
+        "Archived '{}': {} files reused from previous archive,"
+        " {} files compressed"
+    ).format(source, counts[True], counts[False]))
+    return manifest
+
+
+def _write_member(
+    zip_file, previous_stream, previous_members, path, arcname, zinfo, future
+):
+    """Write prepared member to archive.
+
+    Returns:
+        Union[tuple[str, dict[str, Any], bool], None]: Member name, manifest
+            item and if data were reused from previous archive. 'None' for
+            directories.
+    """
+    if future is None:
+        zip_file.write(path, arcname)
+        return None
+
+    item, data, unchanged = future.result()
+    previous_zinfo = previous_members.get(zinfo.filename)
+    if (
+        unchanged
+        and previous_zinfo is not None
+        and previous_zinfo.CRC == item["crc"]
+        and previous_zinfo.file_size == item["size"]
+    ):
+        zinfo.compress_type = previous_zinfo.compress_type
+        zinfo.CRC = previous_zinfo.CRC
+        zinfo.file_size = previous_zinfo.file_size
+        zinfo.compress_size = previous_zinfo.compress_size
+        zip_file.write_compressed(
+            zinfo, _iter_member_data(previous_stream, previous_zinfo)
+        )
+        return zinfo.filename, item, True
+
+    if data is None:
+        # Big file or unchanged file missing in previous archive
+        zip_file.write(path, arcname)
+        item["crc"] = zip_file.getinfo(zinfo.filename).CRC
+        return zinfo.filename, item, False
+
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = item["crc"]
+    zinfo.file_size = item["size"]
+    zinfo.compress_size = len(data)
+    zip_file.write_compressed(zinfo, [data])
+    return zinfo.filename, item, False
@@ -18,6 +18,7 @@ from openpype.host import (
     ILoadHost,
     IPublishHost,
     HostDirmap,
+    ContainersIndex,
 )
 from openpype.tools.utils import host_tools
 from openpype.tools.workfiles.lock_dialog import WorkfileLockDialog
@@ -66,6 +67,17 @@ CREATE_PATH = os.path.join(PLUGINS_DIR, "create")
 INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory")
 
 AVALON_CONTAINERS = ":AVALON_CONTAINERS"
+CONTAINER_IDS = {
+    AVALON_CONTAINER_ID,
+    # Backwards compatibility
+    "pyblish.mindbender.container"
+}
+
+# Index of containers is available only when callbacks are installed
+_containers_index = None
+_containers_index_callbacks = []
+# Attribute changed callback ids by hash code of watched set nodes
+_set_attribute_callbacks = {}
 
 
 class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
@@ -239,6 +251,9 @@ class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         self.log.info("Installed event handler _check_lock_file..")
         self.log.info("Installed event handler _before_close_maya..")
 
+        install_containers_index()
+        self.log.info("Installed containers index..")
+
 
 def _set_project():
     """Sets the maya project to the current Session's work directory.
@@ -360,6 +375,36 @@ def parse_container(container):
     return data
 
 
+def _get_container_node_name(mobject):
+    """Name of container node.
+
+    Args:
+        mobject (om.MObject): Node to check.
+
+    Returns:
+        Union[str, None]: Name of node or 'None' if node is not container.
+    """
+    if mobject.apiTypeStr != "kSet":
+        # Only match by exact type
+        return None
+
+    fn_dep = om.MFnDependencyNode(mobject)
+    if not fn_dep.hasAttribute("id"):
+        return None
+
+    plug = fn_dep.findPlug("id", True)
+    if plug.asString() in CONTAINER_IDS:
+        return fn_dep.name()
+    return None
+
+
+def _iter_set_nodes():
+    iterator = om.MItDependencyNodes(om.MFn.kSet)
+    while not iterator.isDone():
+        yield iterator.thisNode()
+        iterator.next()
+
+
 def _ls():
     """Yields Avalon container node names.
 
@@ -371,33 +416,12 @@ def _ls():
 
     """
 
-    def _maya_iterate(iterator):
-        """Helper to iterate a maya iterator"""
-        while not iterator.isDone():
-            yield iterator.thisNode()
-            iterator.next()
-
-    ids = {AVALON_CONTAINER_ID,
-           # Backwards compatibility
-           "pyblish.mindbender.container"}
-
     # Iterate over all 'set' nodes in the scene to detect whether
     # they have the avalon container ".id" attribute.
-    fn_dep = om.MFnDependencyNode()
-    iterator = om.MItDependencyNodes(om.MFn.kSet)
-    for mobject in _maya_iterate(iterator):
-        if mobject.apiTypeStr != "kSet":
-            # Only match by exact type
-            continue
-
-        fn_dep.setObject(mobject)
-        if not fn_dep.hasAttribute("id"):
-            continue
-
-        plug = fn_dep.findPlug("id", True)
-        value = plug.asString()
-        if value in ids:
-            yield fn_dep.name()
+    for mobject in _iter_set_nodes():
+        container_name = _get_container_node_name(mobject)
+        if container_name is not None:
+            yield container_name
 
 
 def ls():
@@ -407,15 +431,157 @@ def ls():
     assets on disk, it lists assets already loaded in Maya; once loaded
     they are called 'containers'
 
+    Containers are listed from containers index when callbacks are
+    installed.
+
     Yields:
         dict: container
 
     """
+    if _containers_index is not None:
+        containers = _containers_index.get_containers()
+        for container in sorted(
+            containers, key=lambda item: item["objectName"]
+        ):
+            yield container
+        return
+
     container_names = _ls()
     for container in sorted(container_names):
         yield parse_container(container)
 
 
+def _list_index_nodes():
+    for mobject in _iter_set_nodes():
+        yield om.MObjectHandle(mobject)
+
+
+def _parse_index_node(handle):
+    if not handle.isValid():
+        return None
+
+    container_name = _get_container_node_name(handle.object())
+    if container_name is None:
+        return None
+
+    # Changes of container attributes must be tracked
+    _watch_set_attributes(handle)
+    return parse_container(container_name)
+
+
+def _get_index_node_key(handle):
+    return handle.hashCode()
+
+
+def _watch_set_attributes(handle):
+    key = handle.hashCode()
+    if key not in _set_attribute_callbacks:
+        _set_attribute_callbacks[key] = (
+            om.MNodeMessage.addAttributeChangedCallback(
+                handle.object(), _on_set_attribute_changed
+            )
+        )
+
+
+def _unwatch_set_attributes(handle):
+    callback_id = _set_attribute_callbacks.pop(handle.hashCode(), None)
+    if callback_id is not None:
+        om.MMessage.removeCallback(callback_id)
+
+
+def _clear_set_attribute_callbacks():
+    callback_ids = list(_set_attribute_callbacks.values())
+    _set_attribute_callbacks.clear()
+    if callback_ids:
+        om.MMessage.removeCallbacks(callback_ids)
+
+
+def _on_set_node_added(mobject, client_data):
+    if _containers_index.is_suspended:
+        return
+    handle = om.MObjectHandle(mobject)
+    # Container attributes are imprinted after the set is created
+    _watch_set_attributes(handle)
+    _containers_index.node_added(handle)
+
+
+def _on_set_node_removed(mobject, client_data):
+    handle = om.MObjectHandle(mobject)
+    _unwatch_set_attributes(handle)
+    _containers_index.node_removed(handle)
+
+
+def _on_node_name_changed(mobject, previous_name, client_data):
+    if mobject.apiTypeStr == "kSet":
+        _containers_index.node_renamed(om.MObjectHandle(mobject))
+
+
+def _on_set_attribute_changed(msg, plug, other_plug, client_data):
+    _containers_index.node_changed(om.MObjectHandle(plug.node()))
+
+
+def _suspend_containers_index(client_data=None):
+    _clear_set_attribute_callbacks()
+    _containers_index.suspend()
+
+
+def _reset_containers_index(client_data=None):
+    _clear_set_attribute_callbacks()
+    _containers_index.reset()
+
+
+def install_containers_index():
+    """Track containers in scene using Maya callbacks.
+
+    Once installed 'ls' does not scan whole scene on each call.
+    """
+    global _containers_index
+
+    uninstall_containers_index()
+    _containers_index = ContainersIndex(
+        _list_index_nodes, _parse_index_node, _get_index_node_key
+    )
+    _containers_index_callbacks.extend([
+        om.MDGMessage.addNodeAddedCallback(_on_set_node_added, "objectSet"),
+        om.MDGMessage.addNodeRemovedCallback(
+            _on_set_node_removed, "objectSet"
+        ),
+        om.MNodeMessage.addNameChangedCallback(
+            om.MObject.kNullObj, _on_node_name_changed
+        ),
+    ])
+    for message in (
+        om.MSceneMessage.kBeforeOpen,
+        om.MSceneMessage.kBeforeNew,
+    ):
+        _containers_index_callbacks.append(
+            om.MSceneMessage.addCallback(message, _suspend_containers_index)
+        )
+
+    for message in (
+        om.MSceneMessage.kAfterOpen,
+        om.MSceneMessage.kAfterNew,
+        om.MSceneMessage.kAfterCreateReference,
+        om.MSceneMessage.kAfterLoadReference,
+        om.MSceneMessage.kAfterUnloadReference,
+        om.MSceneMessage.kAfterRemoveReference,
+    ):
+        _containers_index_callbacks.append(
+            om.MSceneMessage.addCallback(message, _reset_containers_index)
+        )
+
+
+def uninstall_containers_index():
+    """Remove callbacks of containers index and fall back to scene scan."""
+    global _containers_index
+
+    if _containers_index_callbacks:
+        om.MMessage.removeCallbacks(_containers_index_callbacks)
+        del _containers_index_callbacks[:]
+    _clear_set_attribute_callbacks()
+    _containers_index = None
+
+
 def containerise(name,
                  namespace,
                  nodes,
@@ -4,10 +4,13 @@ import sys
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 import contextlib
+import errno
 import json
 import logging
 import os
+import platform
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import six
 import attr
 
@@ -23,7 +26,8 @@ from openpype.lib import (
     ToolNotFoundError,
 )
 
-from openpype.pipeline import legacy_io, publish, KnownPublishError
+from openpype.client import get_source_hash_paths
+from openpype.pipeline import publish, KnownPublishError
 from openpype.hosts.maya.api import lib
 from openpype import AYON_SERVER_ENABLED
 
@@ -46,26 +50,30 @@ class TextureResult(object):
     transfer_mode = attr.ib()
 
 
-def find_paths_by_hash(texture_hash):
-    """Find the texture hash key in the dictionary.
+def find_paths_by_hashes(project_name, texture_hashes, include_legacy=False):
+    """Find published paths of textures by their hashes.
 
-    All paths that originate from it.
+    All hashes are looked up with one query.
 
     Args:
-        texture_hash (str): Hash of the texture.
+        project_name (str): Project where to look for published textures.
+        texture_hashes (Iterable[str]): Hashes of the textures.
+        include_legacy (bool): Look also for textures of versions published
+            before hashes were stored as indexed entries (slow).
 
     Return:
-        str: path to texture if found.
+        dict[str, list[str]]: Paths to published textures by hash.
 
     """
     if AYON_SERVER_ENABLED:
         raise KnownPublishError(
-            "This is a bug. \"find_paths_by_hash\" is not compatible with "
+            "This is a bug. \"find_paths_by_hashes\" is not compatible with "
             "AYON."
         )
 
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
+    return get_source_hash_paths(
+        project_name, texture_hashes, include_legacy=include_legacy
+    )
 
 
 @contextlib.contextmanager
@@ -351,10 +359,13 @@ class MakeTX(TextureProcessor):
         hash_args = ["maketx"] + args + self.extra_args
         texture_hash = source_hash(source, *hash_args)
 
-        # Ensure folder exists
+        # Ensure folder exists, other textures may be converted concurrently
         resources_dir = os.path.join(staging_dir, "resources")
-        if not os.path.exists(resources_dir):
+        try:
             os.makedirs(resources_dir)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
 
         self.log.debug("Generating .tx file for %s .." % source)
 
@@ -428,6 +439,16 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Max. number of texture conversions running at once (0 = CPU count)
+    max_concurrent_conversions = 0
+    # Copy textures instead of hardlinking already published textures with
+    #   the same source hash
+    # TODO: Temporary disable all hardlinking, due to the feature not being
+    #   used or properly working.
+    force_copy = True
+    # Look for published textures also in versions published before source
+    #   hashes were stored as indexed entries (query can't use an index)
+    legacy_hash_lookup = False
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -614,12 +635,11 @@ class ExtractLook(publish.Extractor):
         resources = instance.data["resources"]
         color_management = lib.get_color_management_preferences()
 
-        # TODO: Temporary disable all hardlinking, due to the feature not being
-        # used or properly working.
-        self.log.info(
-            "Forcing copy instead of hardlink."
-        )
-        force_copy = True
+        force_copy = self.force_copy
+        if force_copy:
+            self.log.info(
+                "Forcing copy instead of hardlink."
+            )
 
         if not force_copy and platform.system().lower() == "windows":
             # Temporary fix to NOT create hardlinks on windows machines
@@ -638,6 +658,24 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        # Collect unique files of all resources, the first resource using
+        # the file defines colorspace used for processing
+        files_colorspace = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                filepath = os.path.normpath(filepath)
+                if filepath not in files_colorspace:
+                    files_colorspace[filepath] = resource["color_space"]
+
+        texture_results = self._process_textures(
+            files_colorspace,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management,
+            project_name=instance.context.data["projectName"]
+        )
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -678,14 +716,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -746,6 +777,113 @@ class ExtractLook(publish.Extractor):
             "attrRemap": remap,
         }
 
+    def _get_max_concurrent_conversions(self):
+        max_workers = self.max_concurrent_conversions
+        if not max_workers or max_workers < 0:
+            max_workers = os.cpu_count() or 1
+        return max_workers
+
+    def _process_textures(self,
+                          files_colorspace,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management,
+                          project_name):
+        """Process texture files concurrently.
+
+        Each texture conversion runs in its own subprocess (e.g. `maketx`)
+        so conversions are dispatched to a bounded pool of workers which
+        wait for the subprocesses.
+
+        Args:
+            files_colorspace (OrderedDict[str, str]): Source colorspace by
+                texture filepath.
+            processors (list): List of TextureProcessor processing the texture
+            staging_dir (str): The staging directory to write to.
+            force_copy (bool): Whether to force a copy even if a file hash
+                might have existed already in the project.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+            project_name (str): Project where to look for already published
+                textures.
+
+        Returns:
+            dict[str, TextureResult]: Texture result by source filepath.
+        """
+        if len(processors) > 1:
+            raise KnownPublishError(
+                "More than one texture processor not supported. "
+                "Current processors enabled: {}".format(processors)
+            )
+
+        filepaths = list(files_colorspace.keys())
+
+        # Look for already published textures of all files at once
+        existing_paths = {}
+        if not processors and not force_copy:
+            existing_paths = self._get_existing_hashed_textures(
+                project_name, filepaths
+            )
+
+        def process_texture(filepath):
+            return self._process_texture(
+                filepath,
+                processors=processors,
+                staging_dir=staging_dir,
+                force_copy=force_copy,
+                color_management=color_management,
+                colorspace=files_colorspace[filepath],
+                existing_path=existing_paths.get(filepath)
+            )
+
+        total = len(filepaths)
+        max_workers = min(self._get_max_concurrent_conversions(), total)
+        if max_workers <= 1 or not processors:
+            return {
+                filepath: process_texture(filepath)
+                for filepath in filepaths
+            }
+
+        self.log.debug(
+            "Processing {} textures with {} concurrent conversions".format(
+                total, max_workers
+            )
+        )
+
+        # Files with the same name would be converted to the same output
+        # file so they are processed one after another in one task
+        filepaths_by_name = OrderedDict()
+        for filepath in filepaths:
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            filepaths_by_name.setdefault(name, []).append(filepath)
+
+        def process_texture_group(group_filepaths):
+            return [
+                (filepath, process_texture(filepath))
+                for filepath in group_filepaths
+            ]
+
+        texture_results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(process_texture_group, group_filepaths)
+                for group_filepaths in filepaths_by_name.values()
+            ]
+            try:
+                for future in as_completed(futures):
+                    for filepath, texture_result in future.result():
+                        texture_results[filepath] = texture_result
+                        self.log.debug("Processed texture {}/{}: {}".format(
+                            len(texture_results), total, filepath
+                        ))
+            except Exception:
+                # Don't start conversions which did not start yet
+                for future in futures:
+                    future.cancel()
+                raise
+        return texture_results
+
     def get_resource_destination(self, filepath, resources_dir, processors):
         """Get resource destination path.
 
@@ -779,21 +917,43 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
+    def _get_existing_hashed_textures(self, project_name, filepaths):
+        """Return the first found published filepath for each texture.
+
+        Args:
+            project_name (str): Project where to look for published textures.
+            filepaths (list[str]): Source texture filepaths.
+
+        Returns:
+            dict[str, str]: Existing published path by source filepath.
+        """
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
-        if existing:
+        hashes_by_filepath = {
+            filepath: source_hash(filepath)
+            for filepath in filepaths
+        }
+        paths_by_hash = find_paths_by_hashes(
+            project_name,
+            set(hashes_by_filepath.values()),
+            include_legacy=self.legacy_hash_lookup
+        )
+
+        output = {}
+        for filepath, texture_hash in hashes_by_filepath.items():
+            existing = paths_by_hash.get(texture_hash)
+            if not existing:
+                continue
             source = next((p for p in existing if os.path.exists(p)), None)
             if source:
-                return source
+                output[filepath] = source
             else:
                 self.log.warning(
                     "Paths not found on disk, "
                     "skipping hardlink: {}".format(existing)
                 )
+        return output
 
     def _process_texture(self,
                          filepath,
@@ -801,7 +961,8 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         existing_path=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -822,6 +983,8 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            existing_path (Optional[str]): Already published texture with
+                the same hash found in database.
 
         Returns:
             TextureResult: The texture result information.
@@ -854,16 +1017,14 @@ class ExtractLook(publish.Extractor):
 
         # No texture processing for this file
         texture_hash = source_hash(filepath)
-        if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
-            if existing:
-                self.log.debug("Found hash in database, preparing hardlink..")
-                return TextureResult(
-                    path=filepath,
-                    file_hash=texture_hash,
-                    colorspace=colorspace,
-                    transfer_mode=HARDLINK
-                )
+        if not force_copy and existing_path:
+            self.log.debug("Found hash in database, preparing hardlink..")
+            return TextureResult(
+                path=existing_path,
+                file_hash=texture_hash,
+                colorspace=colorspace,
+                transfer_mode=HARDLINK
+            )
 
         return TextureResult(
             path=filepath,
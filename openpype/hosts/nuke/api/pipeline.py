@@ -11,7 +11,8 @@ from openpype.host import (
     HostBase,
     IWorkfileHost,
     ILoadHost,
-    IPublishHost
+    IPublishHost,
+    ContainersIndex,
 )
 from openpype.settings import get_current_project_settings
 from openpype.lib import register_event_callback, Logger
@@ -76,6 +77,9 @@ INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory")
 
 MENU_LABEL = os.environ["AVALON_LABEL"]
 
+# Index of containers is available only when callbacks are installed
+_containers_index = None
+
 # registering pyblish gui regarding settings in presets
 if os.getenv("PYBLISH_GUI", None):
     pyblish.api.register_gui(os.getenv("PYBLISH_GUI", None))
@@ -177,6 +181,7 @@ def add_nuke_callbacks():
     # set apply all workfile settings on script load and save
     nuke.addOnScriptLoad(WorkfileSettings().set_context_settings)
 
+    install_containers_index()
 
     if nuke_settings["nuke-dirmap"]["enabled"]:
         log.info("Added Nuke's dir-mapping callback ...")
@@ -430,6 +435,7 @@ def containerise(node,
     )
 
     set_avalon_knob_data(node, data)
+    _container_node_changed(node)
 
     # set tab to first native
     node.setTab(0)
@@ -488,6 +494,7 @@ def update_container(node, keys=None):
 
     container.update(keys)
     node = set_avalon_knob_data(node, container)
+    _container_node_changed(node)
 
     return node
 
@@ -501,7 +508,15 @@ def ls():
 
     See the `container.json` schema for details on how it should look,
     and the Maya equivalent, which is in `avalon.maya.pipeline`
+
+    Containers are listed from containers index when callbacks are
+    installed.
     """
+    if _containers_index is not None:
+        for container in _containers_index.get_containers():
+            yield container
+        return
+
     all_nodes = nuke.allNodes(recurseGroups=False)
 
     nodes = [n for n in all_nodes]
@@ -512,6 +527,74 @@ def ls():
             yield container
 
 
+def _list_index_nodes():
+    return nuke.allNodes(recurseGroups=False)
+
+
+def _get_index_node_key(node):
+    return node.fullName()
+
+
+def _is_top_level_node(node):
+    # Containers are listed only from root of script
+    return "." not in node.fullName()
+
+
+def _container_node_changed(node):
+    if _containers_index is not None and _is_top_level_node(node):
+        _containers_index.node_changed(node)
+
+
+def _on_node_create():
+    node = nuke.thisNode()
+    if _is_top_level_node(node):
+        _containers_index.node_added(node)
+
+
+def _on_node_destroy():
+    node = nuke.thisNode()
+    if _is_top_level_node(node):
+        _containers_index.node_removed(node)
+
+
+def _on_knob_changed():
+    knob_name = nuke.thisKnob().name()
+    if knob_name == "name":
+        # Previous name of node is not known at this point
+        _containers_index.reset()
+
+    elif knob_name.startswith("avalon:"):
+        _container_node_changed(nuke.thisNode())
+
+
+def _on_script_load():
+    _containers_index.reset()
+
+
+def _on_script_close():
+    _containers_index.suspend()
+
+
+def install_containers_index():
+    """Track containers in script using Nuke callbacks.
+
+    Once installed 'ls' does not parse all nodes on each call.
+    """
+    global _containers_index
+
+    if _containers_index is not None:
+        return
+
+    _containers_index = ContainersIndex(
+        _list_index_nodes, parse_container, _get_index_node_key
+    )
+    nuke.addOnCreate(_on_node_create)
+    nuke.addOnDestroy(_on_node_destroy)
+    nuke.addKnobChanged(_on_knob_changed)
+    nuke.addOnScriptLoad(_on_script_load)
+    nuke.addOnScriptClose(_on_script_close)
+
+
 def list_instances(creator_id=None):
     """List all created instances to publish from current workfile.
 
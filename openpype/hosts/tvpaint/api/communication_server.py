@@ -13,6 +13,7 @@ import threading
 import shutil
 
 from contextlib import closing
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 from aiohttp import web
 from aiohttp_json_rpc import JsonRpc
@@ -199,11 +200,16 @@ class WebsocketServerThread(threading.Thread):
 
 
 class BaseTVPaintRpc(JsonRpc):
+    # Interval in which is checked if client's connection was closed while
+    #   waiting for response
+    closed_check_interval = 0.5
+
     def __init__(self, communication_obj, route_name="", **kwargs):
         super().__init__(**kwargs)
         self.requests_ids = collections.defaultdict(lambda: 0)
-        self.waiting_requests = collections.defaultdict(list)
-        self.responses = collections.defaultdict(list)
+        # Futures waiting for response by client host and request id
+        self._response_waiters = {}
+        self._requests_lock = threading.Lock()
 
         self.route_name = route_name
         self.communication_obj = communication_obj
@@ -212,20 +218,23 @@ class BaseTVPaintRpc(JsonRpc):
         # This is duplicated code from super but there is no way how to do it
         # to be able handle server->client requests
         host = http_request.host
-        if host in self.waiting_requests:
-            try:
-                _raw_message = raw_msg.data
-                msg = decode_msg(_raw_message)
+        try:
+            _raw_message = raw_msg.data
+            msg = decode_msg(_raw_message)
 
-            except RpcError as error:
-                await self._ws_send_str(http_request, encode_error(error))
-                return
+        except RpcError as error:
+            await self._ws_send_str(http_request, encode_error(error))
+            return
 
-            if msg.type in (JsonRpcMsgTyp.RESULT, JsonRpcMsgTyp.ERROR):
-                msg_data = json.loads(_raw_message)
-                if msg_data.get("id") in self.waiting_requests[host]:
-                    self.responses[host].append(msg_data)
-                    return
+        if msg.type in (JsonRpcMsgTyp.RESULT, JsonRpcMsgTyp.ERROR):
+            msg_data = json.loads(_raw_message)
+            with self._requests_lock:
+                future = self._response_waiters.pop(
+                    (host, msg_data.get("id")), None
+                )
+            if future is not None:
+                future.set_result(msg_data)
+                return
 
         return await super()._handle_rpc_msg(http_request, raw_msg)
 
@@ -243,52 +252,82 @@ class BaseTVPaintRpc(JsonRpc):
             loop=self.loop
         )
 
-    def send_request(self, client, method, params=None, timeout=0):
+    def send_request_async(self, client, method, params=None):
+        """Send request to client without waiting for response.
+
+        Args:
+            client (JsonRpcClient): Client to which request is sent.
+            method (str): Name of method.
+            params (Optional[list]): Method parameters.
+
+        Returns:
+            tuple[int, Future]: Request id and future with response message.
+        """
         if params is None:
             params = []
 
         client_host = client.host
-
-        request_id = self.requests_ids[client_host]
-        self.requests_ids[client_host] += 1
-
-        self.waiting_requests[client_host].append(request_id)
+        future = Future()
+        with self._requests_lock:
+            request_id = self.requests_ids[client_host]
+            self.requests_ids[client_host] += 1
+            self._response_waiters[(client_host, request_id)] = future
 
         log.debug("Sending request to client {} ({}, {}) id: {}".format(
             client_host, method, params, request_id
         ))
-        future = asyncio.run_coroutine_threadsafe(
+        send_future = asyncio.run_coroutine_threadsafe(
             client.ws.send_str(encode_request(method, request_id, params)),
             loop=self.loop
         )
-        result = future.result()
+        try:
+            send_future.result()
+        except Exception:
+            # Response won't come for request which was not sent
+            self._remove_response_waiter(client, request_id)
+            raise
+        return request_id, future
 
-        not_found = object()
-        response = not_found
-        start = time.time()
-        while True:
-            if client.ws.closed:
-                return None
+    def _remove_response_waiter(self, client, request_id):
+        with self._requests_lock:
+            self._response_waiters.pop((client.host, request_id), None)
 
-            for _response in self.responses[client_host]:
-                _id = _response.get("id")
-                if _id == request_id:
-                    response = _response
-                    break
+    def wait_for_response(self, client, request_id, future, timeout=0):
+        """Wait for response of request sent with 'send_request_async'.
 
-            if response is not not_found:
-                break
+        Args:
+            client (JsonRpcClient): Client to which request was sent.
+            request_id (int): Request id.
+            future (Future): Future with response message.
+            timeout (Optional[float]): Timeout in seconds, wait until
+                response comes if is '0'.
 
-            if timeout > 0 and (time.time() - start) > timeout:
-                raise Exception("Timeout passed")
-                return
+        Returns:
+            Any: Result of request or None if connection was closed.
+        """
+        start = time.time()
+        response = None
+        while response is None:
+            if client.ws.closed:
+                break
 
-            time.sleep(0.1)
+            wait_time = self.closed_check_interval
+            if timeout > 0:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    break
+                wait_time = min(wait_time, remaining)
 
-        if response is not_found:
-            raise Exception("Connection closed")
+            try:
+                response = future.result(wait_time)
+            except FutureTimeoutError:
+                pass
 
-        self.responses[client_host].remove(response)
+        if response is None:
+            self._remove_response_waiter(client, request_id)
+            if client.ws.closed:
+                return None
+            raise Exception("Timeout passed")
 
         error = response.get("error")
         result = response.get("result")
@@ -296,6 +335,41 @@ class BaseTVPaintRpc(JsonRpc):
             raise Exception("Error happened: {}".format(error))
         return result
 
+    def send_request(self, client, method, params=None, timeout=0):
+        request_id, future = self.send_request_async(client, method, params)
+        return self.wait_for_response(client, request_id, future, timeout)
+
+    def send_requests(self, client, requests, timeout=0):
+        """Send multiple requests at once and wait for all responses.
+
+        Requests are sent without waiting for responses between them so
+        they're processed by client one after another without round-trips.
+
+        Args:
+            client (JsonRpcClient): Client to which requests are sent.
+            requests (Iterable[tuple[str, list]]): Method names with
+                parameters.
+            timeout (Optional[float]): Timeout for each response in seconds.
+
+        Returns:
+            list[Any]: Results in order of requests.
+        """
+        sent_requests = []
+        try:
+            for method, params in requests:
+                sent_requests.append(
+                    self.send_request_async(client, method, params)
+                )
+        except Exception:
+            for request_id, _ in sent_requests:
+                self._remove_response_waiter(client, request_id)
+            raise
+
+        return [
+            self.wait_for_response(client, request_id, future, timeout)
+            for request_id, future in sent_requests
+        ]
+
 
 class QtTVPaintRpc(BaseTVPaintRpc):
     def __init__(self, *args, **kwargs):
@@ -379,15 +453,19 @@ class MainThreadItem:
     for the callback. Item hold information about it's process.
     """
     not_set = object()
-    sleep_time = 0.1
 
     def __init__(self, callback, *args, **kwargs):
-        self.done = False
         self.exception = self.not_set
         self.result = self.not_set
         self.callback = callback
         self.args = args
         self.kwargs = kwargs
+        # Future is used only to signal that item was processed
+        self._done_future = Future()
+
+    @property
+    def done(self):
+        return self._done_future.done()
 
     def execute(self):
         """Execute callback and store its result.
@@ -413,7 +491,12 @@ class MainThreadItem:
             self.exception = exc
 
         finally:
-            self.done = True
+            self._done_future.set_result(None)
+
+    def _get_result(self):
+        if self.exception is self.not_set:
+            return self.result
+        raise self.exception
 
     def wait(self):
         """Wait for result from main thread.
@@ -427,12 +510,8 @@ class MainThreadItem:
             Exception: Reraise any exception that happened during callback
                 execution.
         """
-        while not self.done:
-            time.sleep(self.sleep_time)
-
-        if self.exception is self.not_set:
-            return self.result
-        raise self.exception
+        self._done_future.result()
+        return self._get_result()
 
     async def async_wait(self):
         """Wait for result from main thread.
@@ -444,12 +523,8 @@ class MainThreadItem:
             Exception: Reraise any exception that happened during callback
                 execution.
         """
-        while not self.done:
-            await asyncio.sleep(self.sleep_time)
-
-        if self.exception is self.not_set:
-            return self.result
-        raise self.exception
+        await asyncio.wrap_future(self._done_future)
+        return self._get_result()
 
 
 class BaseCommunicator:
@@ -806,12 +881,46 @@ class BaseCommunicator:
             client, method, params
         )
 
+    def send_requests(self, requests):
+        """Send multiple requests at once and wait for all results.
+
+        Args:
+            requests (Iterable[tuple[str, list]]): Method names with
+                parameters.
+
+        Returns:
+            Union[list[Any], None]: Results in order of requests or None
+                if client is not connected.
+        """
+        client = self.client()
+        if not client:
+            return
+
+        return self.websocket_rpc.send_requests(client, requests)
+
     def execute_george(self, george_script):
         """Execute passed goerge script in TVPaint."""
         return self.send_request(
             "execute_george", [george_script]
         )
 
+    def execute_george_batch(self, george_scripts):
+        """Execute multiple george scripts and return all their outputs.
+
+        Scripts are sent at once without waiting for each of them.
+
+        Args:
+            george_scripts (Iterable[str]): George scripts to execute.
+
+        Returns:
+            Union[list[str], None]: Outputs in order of scripts or None
+                if client is not connected.
+        """
+        return self.send_requests([
+            ("execute_george", [george_script])
+            for george_script in george_scripts
+        ])
+
     def execute_george_through_file(self, george_script):
         """Execute george script with temp file.
 
@@ -1,6 +1,8 @@
 import os
 import shutil
 import collections
+from concurrent.futures import ThreadPoolExecutor
+
 from PIL import Image, ImageDraw
 
 
@@ -542,10 +544,46 @@ def cleanup_rendered_layers(filepaths_by_layer_id):
             os.remove(filepath)
 
 
+def _get_file_identity(filepath):
+    """Identity of file content which is same for hardlinked files.
+
+    Held frames are hardlinks of a rendered frame (see
+    'fill_reference_frames') so they have different paths but same identity.
+    """
+    stat = os.stat(filepath)
+    if not stat.st_ino:
+        return os.path.normcase(os.path.abspath(filepath))
+    return (stat.st_dev, stat.st_ino)
+
+
+def _composite_images_in_parallel(items, max_workers=None):
+    """Composite images of each item where item is (src paths, dst path).
+
+    Pillow releases GIL during decoding, compositing and encoding so
+    threads are enough to use multiple cores.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(items))
+    if max_workers < 2:
+        for src_filepaths, dst_filepath in items:
+            composite_images(src_filepaths, dst_filepath)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(composite_images, src_filepaths, dst_filepath)
+            for src_filepaths, dst_filepath in items
+        ]
+        # Propagate first exception if any happened
+        for future in futures:
+            future.result()
+
+
 def composite_rendered_layers(
     layers_data, filepaths_by_layer_id,
     range_start, range_end,
-    dst_filepaths_by_frame, cleanup=True
+    dst_filepaths_by_frame, cleanup=True, max_workers=None
 ):
     """Composite multiple rendered layers by their position.
 
@@ -556,6 +594,10 @@ def composite_rendered_layers(
     Function can be used even if single layer was created to fill transparent
     filepaths.
 
+    Frames with same source images (e.g. held frames of all layers) are
+    composited only once and the result is linked to other frames. Unique
+    composites are processed in parallel.
+
     Args:
         layers_data(list): Layers data loaded from TVPaint.
         filepaths_by_layer_id(dict): Rendered filepaths stored by frame index
@@ -566,6 +608,8 @@ def composite_rendered_layers(
             image after compositing will be stored. Path must not clash with
             source filepaths.
         cleanup(bool): Remove all source filepaths when done with compositing.
+        max_workers(Optional[int]): Maximum number of images composited at
+            once. Number of CPUs is used when not passed.
     """
     # Prepare layers by their position
     #   - position tells in which order will compositing happen
@@ -581,6 +625,9 @@ def composite_rendered_layers(
     transparent_filepaths = set()
     # Store first final filepath
     first_dst_filepath = None
+    # Composites to process by identity of source files
+    composite_items = []
+    dst_filepaths_by_identity = collections.defaultdict(list)
     for frame_idx in range(range_start, range_end + 1):
         dst_filepath = dst_filepaths_by_frame[frame_idx]
         src_filepaths = []
@@ -605,9 +652,24 @@ def composite_rendered_layers(
                 os.rename(src_filepath, dst_filepath)
             else:
                 copy_render_file(src_filepath, dst_filepath)
+            continue
 
-        else:
-            composite_images(src_filepaths, dst_filepath)
+        identity = tuple(
+            _get_file_identity(src_filepath)
+            for src_filepath in src_filepaths
+        )
+        dst_filepaths = dst_filepaths_by_identity[identity]
+        if not dst_filepaths:
+            composite_items.append((src_filepaths, dst_filepath))
+        dst_filepaths.append(dst_filepath)
+
+    _composite_images_in_parallel(composite_items, max_workers)
+
+    # Link composited image to frames with same sources
+    for dst_filepaths in dst_filepaths_by_identity.values():
+        src_filepath = dst_filepaths[0]
+        for dst_filepath in dst_filepaths[1:]:
+            copy_render_file(src_filepath, dst_filepath)
 
     # Store first transparent filepath to be able copy it
     transparent_filepath = None
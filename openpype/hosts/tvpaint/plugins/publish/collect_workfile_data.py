@@ -7,6 +7,7 @@ import pyblish.api
 from openpype.pipeline import legacy_io
 from openpype.hosts.tvpaint.api.lib import (
     execute_george,
+    execute_george_batch,
     execute_george_through_file,
     get_layers_data,
     get_groups_data,
@@ -148,7 +149,15 @@ class CollectWorkfileData(pyblish.api.ContextPlugin):
         )
 
         self.log.info("Collecting scene data from workfile")
-        workfile_info_parts = execute_george("tv_projectinfo").split(" ")
+        (
+            workfile_info,
+            mark_in_result,
+            mark_out_result,
+            start_frame
+        ) = execute_george_batch(
+            ["tv_projectinfo", "tv_markin", "tv_markout", "tv_startframe"]
+        )
+        workfile_info_parts = workfile_info.split(" ")
 
         # Project frame start - not used
         workfile_info_parts.pop(-1)
@@ -160,11 +169,8 @@ class CollectWorkfileData(pyblish.api.ContextPlugin):
         workfile_path = " ".join(workfile_info_parts).replace("\"", "")
 
         # Marks return as "{frame - 1} {state} ", example "0 set".
-        result = execute_george("tv_markin")
-        mark_in_frame, mark_in_state, _ = result.split(" ")
-
-        result = execute_george("tv_markout")
-        mark_out_frame, mark_out_state, _ = result.split(" ")
+        mark_in_frame, mark_in_state, _ = mark_in_result.split(" ")
+        mark_out_frame, mark_out_state, _ = mark_out_result.split(" ")
 
         scene_data = {
             "currentFile": workfile_path,
@@ -177,7 +183,7 @@ class CollectWorkfileData(pyblish.api.ContextPlugin):
             "sceneMarkInState": mark_in_state == "set",
             "sceneMarkOut": int(mark_out_frame),
             "sceneMarkOutState": mark_out_state == "set",
-            "sceneStartFrame": int(execute_george("tv_startframe")),
+            "sceneStartFrame": int(start_frame),
             "sceneBgColor": self._get_bg_color()
         }
         self.log.debug(
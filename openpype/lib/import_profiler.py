@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""Profiler of python imports.
+
+Profiler measures execution time of each imported module and keeps
+the tree of imports. Report contains import time aggregated by packages,
+modules with the biggest own import time and the import tree.
+
+Module can use only standard library because it is used on start of
+OpenPype process before OpenPype is imported. Only Python 3 is supported.
+
+Example:
+    >>> profiler = ImportProfiler()
+    >>> profiler.install()
+    >>> import openpype.pipeline
+    >>> profiler.uninstall()
+    >>> print(profiler.get_report())
+"""
+import os
+import sys
+import time
+import atexit
+import tempfile
+import threading
+import collections
+
+
+class ImportRecord(object):
+    """Import of one module.
+
+    Args:
+        name (str): Full name of module.
+        parent (Union[ImportRecord, None]): Import during which the module
+            was imported.
+    """
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.cumulative_time = 0.0
+
+    @property
+    def self_time(self):
+        """Import time without imports of other modules."""
+        return max(
+            0.0,
+            self.cumulative_time - sum(
+                child.cumulative_time
+                for child in self.children
+            )
+        )
+
+
+class ImportProfiler(object):
+    """Meta path finder measuring execution time of imported modules.
+
+    Profiler does not find modules. Module spec is found by other finders
+    in 'sys.meta_path' and its loader is replaced by proxy which measures
+    'exec_module'. Builtin and frozen modules are not measured.
+    """
+
+    def __init__(self):
+        self._thread_data = threading.local()
+        self._lock = threading.Lock()
+        self._root_records = []
+        self._installed = False
+
+    @property
+    def root_records(self):
+        return list(self._root_records)
+
+    def install(self):
+        """Start measuring of imports."""
+        if self._installed:
+            return
+        self._installed = True
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop measuring of imports."""
+        if not self._installed:
+            return
+        self._installed = False
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = None
+        for finder in tuple(sys.meta_path):
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+
+        loader = getattr(spec, "loader", None)
+        if (
+            loader is not None
+            # Skip builtin and frozen importers (classes)
+            and not isinstance(loader, type)
+            and hasattr(loader, "exec_module")
+        ):
+            # Spec is created for each find so only this import is affected,
+            #   loader itself can be shared by more modules (zipimporter)
+            spec.loader = _ProfiledLoader(self, fullname, loader)
+        return spec
+
+    def _get_stack(self):
+        stack = getattr(self._thread_data, "stack", None)
+        if stack is None:
+            stack = []
+            self._thread_data.stack = stack
+        return stack
+
+    def _exec_module(self, fullname, loader, module):
+        stack = self._get_stack()
+        parent = stack[-1] if stack else None
+        record = ImportRecord(fullname, parent)
+        if parent is None:
+            with self._lock:
+                self._root_records.append(record)
+        else:
+            parent.children.append(record)
+
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            record.cumulative_time = time.perf_counter() - start
+            stack.pop()
+
+    def iter_records(self):
+        """Iterate over all import records.
+
+        Yields:
+            tuple[ImportRecord, int]: Record with depth in import tree.
+        """
+        queue = collections.deque(
+            (record, 0) for record in self.root_records
+        )
+        while queue:
+            record, depth = queue.popleft()
+            yield record, depth
+            queue.extendleft(
+                (child, depth + 1)
+                for child in reversed(record.children)
+            )
+
+    def get_package_times(self, openpype_depth=2):
+        """Import time aggregated by packages.
+
+        Args:
+            openpype_depth (int): Depth of package names of OpenPype
+                modules. Other packages are aggregated by top level name.
+
+        Returns:
+            list[tuple[str, float, int]]: Package name, import time and
+                count of modules, sorted from the slowest.
+        """
+        times_by_package = collections.defaultdict(float)
+        counts_by_package = collections.defaultdict(int)
+        for record, _ in self.iter_records():
+            parts = record.name.split(".")
+            depth = openpype_depth if parts[0] == "openpype" else 1
+            package_name = ".".join(parts[:depth])
+            times_by_package[package_name] += record.self_time
+            counts_by_package[package_name] += 1
+
+        return sorted(
+            (
+                (package_name, package_time, counts_by_package[package_name])
+                for package_name, package_time in times_by_package.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def get_report(self, top_count=30, min_tree_time=0.001):
+        """Text report of measured imports.
+
+        Args:
+            top_count (int): Count of modules listed by own import time.
+            min_tree_time (float): Imports faster than the time (in seconds)
+                are not listed in import tree.
+
+        Returns:
+            str: Report.
+        """
+        records = [record for record, _ in self.iter_records()]
+        total_time = sum(
+            record.cumulative_time
+            for record in self._root_records
+        )
+        lines = [
+            "Import profile of process {} ({})".format(
+                os.getpid(), " ".join(sys.argv)
+            ),
+            "Imported modules: {}".format(len(records)),
+            "Total import time: {:.1f} ms".format(total_time * 1000),
+            "",
+            "Packages:",
+            "{:>12} {:>8}  {}".format("self[ms]", "modules", "package"),
+        ]
+        for package_name, package_time, count in self.get_package_times():
+            lines.append("{:>12.1f} {:>8}  {}".format(
+                package_time * 1000, count, package_name
+            ))
+
+        lines.extend([
+            "",
+            "Slowest modules:",
+            "{:>12} {:>12}  {}".format("self[ms]", "total[ms]", "module"),
+        ])
+        slowest_records = sorted(
+            records, key=lambda item: item.self_time, reverse=True
+        )
+        for record in slowest_records[:top_count]:
+            lines.append("{:>12.1f} {:>12.1f}  {}".format(
+                record.self_time * 1000,
+                record.cumulative_time * 1000,
+                record.name
+            ))
+
+        lines.extend([
+            "",
+            "Import tree (imports faster than {:.1f} ms are skipped):".format(
+                min_tree_time * 1000
+            ),
+            "{:>12} {:>12}  {}".format("self[ms]", "total[ms]", "module"),
+        ])
+        for record, depth in self.iter_records():
+            if record.cumulative_time < min_tree_time:
+                continue
+            lines.append("{:>12.1f} {:>12.1f}  {}{}".format(
+                record.self_time * 1000,
+                record.cumulative_time * 1000,
+                "| " * depth,
+                record.name
+            ))
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, filepath, **kwargs):
+        """Write report to a file.
+
+        Args:
+            filepath (str): Path to output file.
+            **kwargs (Any): Arguments passed to 'get_report'.
+        """
+        dirpath = os.path.dirname(os.path.abspath(filepath))
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(filepath, "w") as stream:
+            stream.write(self.get_report(**kwargs))
+
+
+class _ProfiledLoader(object):
+    """Proxy of loader measuring execution of one module.
+
+    Other attributes are taken from the original loader so the proxy can be
+    used as module's '__loader__' (e.g. 'get_data' or resource readers).
+    """
+
+    def __init__(self, profiler, fullname, loader):
+        self._profiler = profiler
+        self._fullname = fullname
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        return create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._exec_module(self._fullname, self._loader, module)
+
+
+def get_default_report_path():
+    return os.path.join(
+        tempfile.gettempdir(),
+        "openpype_import_profile_{}.txt".format(os.getpid())
+    )
+
+
+def start_import_profiler(report_path=None):
+    """Profile imports of current process and write report on exit.
+
+    Args:
+        report_path (Optional[str]): Path to report file. Report is stored
+            to temp directory if not passed.
+
+    Returns:
+        ImportProfiler: Installed profiler.
+    """
+    if not report_path:
+        report_path = get_default_report_path()
+
+    profiler = ImportProfiler()
+    profiler.install()
+
+    def _on_exit():
+        profiler.uninstall()
+        profiler.write_report(report_path)
+        sys.stderr.write(
+            "Import profile was written to \"{}\"\n".format(report_path)
+        )
+
+    atexit.register(_on_exit)
+    return profiler
@@ -23,6 +23,7 @@ import time
 import traceback
 import threading
 import copy
+import collections
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
@@ -32,13 +33,6 @@ from openpype.client.mongo import (
 )
 from . import Terminal
 
-try:
-    import log4mongo
-    from log4mongo.handlers import MongoHandler
-except ImportError:
-    log4mongo = None
-    MongoHandler = type("NOT_SET", (), {})
-
 # Check for `unicode` in builtins
 USE_UNICODE = hasattr(__builtins__, "unicode")
 
@@ -144,14 +138,14 @@ class LogFormatter(logging.Formatter):
 
 class MongoFormatter(logging.Formatter):
 
-    DEFAULT_PROPERTIES = logging.LogRecord(
-        '', '', '', '', '', '', '', '').__dict__.keys()
+    DEFAULT_PROPERTIES = frozenset(logging.LogRecord(
+        '', '', '', '', '', '', '', '').__dict__.keys())
 
     def format(self, record):
         """Formats LogRecord into python dictionary."""
         # Standard document
         document = {
-            'timestamp': datetime.datetime.now(),
+            'timestamp': datetime.datetime.fromtimestamp(record.created),
             'level': record.levelname,
             'thread': record.thread,
             'threadName': record.threadName,
@@ -162,7 +156,12 @@ class MongoFormatter(logging.Formatter):
             'method': record.funcName,
             'lineNumber': record.lineno
         }
-        document.update(Logger.get_process_data())
+        # Process data contain only immutable values so copy is not needed
+        process_data = Logger.process_data
+        if process_data is None:
+            Logger.get_process_data()
+            process_data = Logger.process_data
+        document.update(process_data)
 
         # Standard document decorated with exception info
         if record.exc_info is not None:
@@ -174,14 +173,254 @@ class MongoFormatter(logging.Formatter):
 
         # Standard document decorated with extra contextual information
         if len(self.DEFAULT_PROPERTIES) != len(record.__dict__):
-            contextual_extra = set(record.__dict__).difference(
-                set(self.DEFAULT_PROPERTIES))
-            if contextual_extra:
-                for key in contextual_extra:
-                    document[key] = record.__dict__[key]
+            for key in set(record.__dict__) - self.DEFAULT_PROPERTIES:
+                document[key] = record.__dict__[key]
         return document
 
 
+class MongoQueueHandler(logging.Handler):
+    """Handler storing log records to mongo from background thread.
+
+    Records are queued on emit and formatted and inserted in batches by
+    worker thread. Batch is inserted when has 'batch_size' records or after
+    'flush_interval' seconds.
+
+    Queue has limited size. When queue is filled over 'sample_threshold'
+    only each 'debug_sample_rate' debug record is kept, when queue is full
+    records with lower level than warning are dropped and warnings and
+    errors wait up to 'block_timeout' seconds for free space. Count of
+    dropped records is stored to mongo with next batch.
+
+    Args:
+        get_collection (Callable[[], pymongo.collection.Collection]): Getter
+            of collection where logs are stored. Called from worker thread.
+        max_queue_size (Optional[int]): Maximum count of queued records.
+        batch_size (Optional[int]): Maximum count of records inserted at
+            once.
+        flush_interval (Optional[float]): Maximum time in seconds records
+            wait in queue.
+    """
+
+    sample_threshold = 0.8
+    debug_sample_rate = 10
+    block_timeout = 1.0
+
+    def __init__(
+        self,
+        get_collection,
+        max_queue_size=10000,
+        batch_size=500,
+        flush_interval=1.0,
+        level=logging.NOTSET
+    ):
+        super(MongoQueueHandler, self).__init__(level)
+        self._get_collection = get_collection
+        self._collection = None
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        # Count of records taken from queue which were not stored yet
+        self._in_progress = 0
+        self._debug_counter = 0
+        self._dropped_count = 0
+        self._reported_dropped = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread = None
+
+    @property
+    def dropped_count(self):
+        """Count of dropped records since handler was created."""
+        return self._dropped_count
+
+    def emit(self, record):
+        with self._condition:
+            if self._closed:
+                return
+
+            queue_size = len(self._queue)
+            if queue_size >= self.max_queue_size * self.sample_threshold:
+                if not self._accept_under_pressure(record):
+                    self._dropped_count += 1
+                    return
+
+                if len(self._queue) >= self.max_queue_size:
+                    self._dropped_count += 1
+                    return
+
+            self._queue.append(record)
+            self._ensure_thread()
+            queue_size = len(self._queue)
+            # Wake up worker to start flush interval or to store full batch
+            if queue_size == 1 or queue_size >= self.batch_size:
+                self._condition.notify_all()
+
+    def _accept_under_pressure(self, record):
+        """Decide if record is queued when queue is almost full.
+
+        Called with acquired condition lock.
+        """
+        if record.levelno >= logging.WARNING:
+            # Wait for space for important records
+            if (
+                len(self._queue) >= self.max_queue_size
+                and threading.current_thread() is not self._thread
+            ):
+                self._condition.notify_all()
+                deadline = time.time() + self.block_timeout
+                while (
+                    len(self._queue) >= self.max_queue_size
+                    and not self._closed
+                ):
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            if len(self._queue) >= self.max_queue_size:
+                # Replace oldest less important record
+                for queued_record in self._queue:
+                    if queued_record.levelno < logging.WARNING:
+                        self._queue.remove(queued_record)
+                        self._dropped_count += 1
+                        break
+            return True
+
+        if len(self._queue) >= self.max_queue_size:
+            return False
+
+        if record.levelno <= logging.DEBUG:
+            self._debug_counter += 1
+            return self._debug_counter % self.debug_sample_rate == 0
+        return True
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._worker,
+            name="MongoLogHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                self._wait_for_batch()
+                records = []
+                while self._queue and len(records) < self.batch_size:
+                    records.append(self._queue.popleft())
+                self._in_progress = len(records)
+                if not self._queue:
+                    self._flush_requested = False
+                dropped_count = self._dropped_count
+                closed = self._closed
+                # Wake up emits waiting for free space
+                self._condition.notify_all()
+
+            if records or dropped_count > self._reported_dropped:
+                self._store(records, dropped_count)
+
+            with self._condition:
+                self._in_progress = 0
+                self._condition.notify_all()
+                if closed and not self._queue:
+                    return
+
+    def _wait_for_batch(self):
+        """Wait until batch should be stored.
+
+        Called with acquired condition lock.
+        """
+        deadline = None
+        while (
+            not self._closed
+            and not self._flush_requested
+            and len(self._queue) < self.batch_size
+        ):
+            if not self._queue:
+                deadline = None
+                self._condition.wait()
+                continue
+
+            if deadline is None:
+                deadline = time.time() + self.flush_interval
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+
+    def _store(self, records, dropped_count):
+        documents = []
+        for record in records:
+            try:
+                documents.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        if dropped_count > self._reported_dropped:
+            documents.append(self._create_dropped_document(
+                dropped_count - self._reported_dropped
+            ))
+            self._reported_dropped = dropped_count
+
+        if not documents:
+            return
+
+        try:
+            if self._collection is None:
+                self._collection = self._get_collection()
+            self._collection.insert_many(documents, ordered=False)
+        except Exception:
+            if logging.raiseExceptions:
+                sys.stderr.write("--- Failed to store logs to mongo ---\n")
+                traceback.print_exc(file=sys.stderr)
+
+    def _create_dropped_document(self, count):
+        record = logging.LogRecord(
+            self.__class__.__name__, logging.WARNING, __file__, 0,
+            "Dropped %s log records because queue was full",
+            (count, ), None
+        )
+        return self.format(record)
+
+    def flush(self, timeout=None):
+        """Wait until queued records are stored.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait.
+        """
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            self._flush_requested = True
+            self._condition.notify_all()
+            deadline = None
+            if timeout is not None:
+                deadline = time.time() + timeout
+            while self._queue or self._in_progress:
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+    def close(self):
+        """Store all queued records and stop worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(max(self.flush_interval * 2, 5.0))
+        super(MongoQueueHandler, self).close()
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -222,6 +461,8 @@ class Logger:
 
     # Data same for all record documents
     process_data = None
+    # Handler shared by all loggers
+    _mongo_handler = None
     # Cached process name or ability to set different process name
     _process_name = None
 
@@ -238,7 +479,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, MongoQueueHandler):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +526,16 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        if cls._mongo_handler is None:
+            handler = MongoQueueHandler(cls._get_log_collection)
+            handler.setFormatter(MongoFormatter())
+            cls._mongo_handler = handler
+        return cls._mongo_handler
 
-        return MongoHandler(**kwargs)
+    @classmethod
+    def _get_log_collection(cls):
+        client = cls.get_log_mongo_connection()
+        return client[cls.log_database_name][cls.log_collection_name]
 
     @classmethod
     def _get_console_handler(cls):
@@ -335,8 +570,7 @@ class Logger:
             use_mongo_logging = False
         else:
             use_mongo_logging = (
-                log4mongo is not None
-                and os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
+                os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
             )
 
         # Set mongo id for process (ONLY ONCE)
@@ -462,13 +696,7 @@ class Logger:
         if not cls.log_database_name:
             raise ValueError("Database name for logs is not set")
 
-        client = log4mongo.handlers._connection
-        if not client:
-            client = cls.get_log_mongo_connection()
-            # Set the client inside log4mongo handlers to not create another
-            # mongo db connection.
-            log4mongo.handlers._connection = client
-
+        client = cls.get_log_mongo_connection()
         logdb = client[cls.log_database_name]
 
         collist = logdb.list_collection_names()
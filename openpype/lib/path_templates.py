@@ -2,14 +2,26 @@ import os
 import re
 import copy
 import numbers
+import functools
 import collections
 
 import six
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+
 KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Keys which values are changing when compiled template is filled
+DEFAULT_DYNAMIC_KEYS = ("frame", "udim")
+# Characters used to mark dynamic keys in compiled template
+DYNAMIC_MARKER = "\x00"
+DYNAMIC_MARKER_SEPARATOR = "\x01"
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -38,6 +50,47 @@ def merge_dict(main_dict, enhance_dict):
     return main_dict
 
 
+class _FrozenDict(Mapping):
+    """Read-only dictionary used as snapshot of formatting data."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+def _freeze_data(value):
+    """Read-only snapshot of formatting data.
+
+    Dictionaries are converted to read-only mappings and lists to tuples.
+    Other values are not copied.
+
+    Args:
+        value (Any): Formatting data.
+
+    Returns:
+        Any: Read-only formatting data.
+    """
+    if isinstance(value, (dict, _FrozenDict)):
+        return _FrozenDict({
+            key: _freeze_data(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze_data(item) for item in value)
+    return value
+
+
 class TemplateMissingKey(Exception):
     """Exception for cases when key does not exist in template."""
 
@@ -182,6 +235,48 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def compile(self, data, dynamic_keys=None):
+        """Compile template for repeated formatting with changing values.
+
+        Template is solved with passed data only once and only values of
+        dynamic keys are substituted on each fill of compiled template. That
+        is useful for sequences where only 'frame' or 'udim' is changing.
+
+        Data must contain values for dynamic keys (e.g. first frame), they
+        are used to validate the template and to fill 'result'.
+
+        Args:
+            data (dict): Data used to fill template.
+            dynamic_keys (Optional[Iterable[str]]): Keys which values are
+                changed on fill. Only top level keys are supported. Default
+                are 'frame' and 'udim'.
+
+        Returns:
+            CompiledStringTemplate: Compiled template.
+        """
+        if dynamic_keys is None:
+            dynamic_keys = DEFAULT_DYNAMIC_KEYS
+        dynamic_keys = tuple(dynamic_keys)
+
+        result = self.format(data)
+
+        marker_data = dict(data)
+        for key in dynamic_keys:
+            if key in marker_data:
+                marker_data[key] = _DynamicKeyMarker(key)
+        marker_result = self.format(marker_data)
+
+        return CompiledStringTemplate(
+            self.template,
+            result,
+            _split_dynamic_markers(str(marker_result), dynamic_keys)
+        )
+
+    def compile_strict(self, *args, **kwargs):
+        compiled = self.compile(*args, **kwargs)
+        compiled.result.validate()
+        return compiled
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -241,6 +336,122 @@ class StringTemplate(object):
         return new_parts
 
 
+class CompiledStringTemplate(object):
+    """Template solved with static data with only dynamic keys to fill.
+
+    Output of 'StringTemplate.compile'. Filling does not validate data again,
+    values of dynamic keys are formatted using format specification from
+    the template (e.g. '{frame:0>4}').
+
+    Args:
+        template (str): Original template.
+        result (TemplateResult): Result of template filled with data passed
+            to compile.
+        segments (list[Union[str, tuple[str, str]]]): Solved parts of
+            template. Dynamic parts are stored as tuple with key and format
+            specification.
+    """
+
+    def __init__(self, template, result, segments):
+        self._template = template
+        self._result = result
+        self._segments = segments
+        self._dynamic_keys = {
+            segment[0]
+            for segment in segments
+            if not isinstance(segment, six.string_types)
+        }
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, self._template)
+
+    @property
+    def template(self):
+        return self._template
+
+    @property
+    def result(self):
+        """Result of template filled with data passed to compile.
+
+        Returns:
+            TemplateResult: Formatting result.
+        """
+        return self._result
+
+    @property
+    def dynamic_keys(self):
+        """Dynamic keys which are used in template.
+
+        Returns:
+            set[str]: Used dynamic keys.
+        """
+        return set(self._dynamic_keys)
+
+    def fill(self, values):
+        """Fill template with values of dynamic keys.
+
+        Args:
+            values (dict[str, Any]): Values of dynamic keys.
+
+        Returns:
+            str: Filled template.
+        """
+        output = []
+        for segment in self._segments:
+            if isinstance(segment, six.string_types):
+                output.append(segment)
+                continue
+            key, format_spec = segment
+            output.append(format(values[key], format_spec))
+        return "".join(output)
+
+    def fill_sequence(self, key, values, padding=0):
+        """Fill template for each value of single dynamic key.
+
+        Args:
+            key (str): Dynamic key e.g. 'frame'.
+            values (Iterable[Any]): Values of the key e.g. frame numbers.
+            padding (int): Minimum padding of numeric values. Formatted
+                values shorter than padding are prefixed with zeros.
+
+        Returns:
+            list[str]: Filled template for each value.
+        """
+        # Concatenate static parts between dynamic parts
+        static_parts = [""]
+        format_specs = []
+        for segment in self._segments:
+            if isinstance(segment, six.string_types):
+                static_parts[-1] += segment
+            elif segment[0] == key:
+                format_specs.append(segment[1])
+                static_parts.append("")
+            else:
+                raise ValueError(
+                    "Template uses dynamic key \"{}\" which is not filled."
+                    .format(segment[0])
+                )
+
+        if not format_specs:
+            return [static_parts[0] for _ in values]
+
+        output = []
+        for value in values:
+            formatted = []
+            for format_spec in format_specs:
+                value_str = format(value, format_spec)
+                if len(value_str) < padding and value_str.isdigit():
+                    value_str = value_str.zfill(padding)
+                formatted.append(value_str)
+
+            parts = [static_parts[0]]
+            for value_str, static_part in zip(formatted, static_parts[1:]):
+                parts.append(value_str)
+                parts.append(static_part)
+            output.append("".join(parts))
+        return output
+
+
 class TemplatesDict(object):
     def __init__(self, templates=None):
         self._raw_templates = None
@@ -354,19 +565,25 @@ class TemplatesDict(object):
                 attribute set to True so accessing unfilled keys in templates
                 will raise exceptions with explaned error.
         """
-        # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        data = in_data
 
         # Add environment variable to data
         if only_keys is False:
+            data = dict(in_data)
             for key, val in os.environ.items():
                 env_key = "$" + key
                 if env_key not in data:
                     data[env_key] = val
 
-        solved = self._solve_dict(self.objected_templates, data)
+        # Templates are solved on first access of their keys. Read-only
+        #   snapshot of data makes sure that changes of passed data made
+        #   after this call don't affect the result.
+        data = _freeze_data(data)
 
-        output = TemplatesResultDict(solved)
+        output = TemplatesResultDict(
+            self.objected_templates,
+            solve_value=functools.partial(self._format_value, data=data)
+        )
         output.strict = strict
         return output
 
@@ -445,29 +662,71 @@ class TemplateResult(str):
         )
 
 
+class _UnsolvedValue(object):
+    """Value of 'TemplatesResultDict' which was not solved yet."""
+
+    __slots__ = ("value", )
+
+    def __init__(self, value):
+        self.value = value
+
+
 class TemplatesResultDict(dict):
-    """Holds and wrap TemplateResults for easy bug report."""
+    """Holds and wrap TemplateResults for easy bug report.
+
+    Values can be solved lazily if 'solve_value' callback is passed. In that
+    case 'in_data' contain templates which are solved on first access of
+    their key and the solved value is memoized.
 
-    def __init__(self, in_data, key=None, parent=None, strict=None):
+    Args:
+        in_data (dict): Solved values or templates if 'solve_value'
+            is passed.
+        key (Optional[str]): Key under which is the dictionary in parent.
+        parent (Optional[TemplatesResultDict]): Parent dictionary.
+        strict (Optional[bool]): Raise exception when accessing
+            unsolved template.
+        solve_value (Optional[Callable[[Any], Any]]): Callback solving
+            template value.
+    """
+
+    def __init__(
+        self, in_data, key=None, parent=None, strict=None, solve_value=None
+    ):
         super(TemplatesResultDict, self).__init__()
         for _key, _value in in_data.items():
             if isinstance(_value, dict):
-                _value = self.__class__(_value, _key, self)
-            self[_key] = _value
+                _value = self.__class__(
+                    _value, _key, self, solve_value=solve_value
+                )
+            elif solve_value is not None:
+                _value = _UnsolvedValue(_value)
+            dict.__setitem__(self, _key, _value)
 
         self.key = key
         self.parent = parent
         self.strict = strict
+        self._solve_value = solve_value
         if self.parent is None and strict is None:
             self.strict = True
 
+    def _get_value(self, key):
+        value = dict.__getitem__(self, key)
+        if not isinstance(value, _UnsolvedValue):
+            return value
+
+        value = self._solve_value(value.value)
+        if isinstance(value, dict):
+            value = self.__class__(value, key, self)
+        dict.__setitem__(self, key, value)
+        return value
+
     def __getitem__(self, key):
         if key not in self.keys():
             hier = self.hierarchy()
             hier.append(key)
             raise TemplateMissingKey(hier)
 
-        value = super(TemplatesResultDict, self).__getitem__(key)
+        value = self._get_value(key)
         if isinstance(value, self.__class__):
             return value
 
@@ -476,6 +735,49 @@ class TemplatesResultDict(dict):
             value.validate()
         return value
 
+    def __iter__(self):
+        # Iteration is used by 'dict(...)' to get values with '__getitem__'
+        #   instead of reading raw values
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key, default=None):
+        if key in self.keys():
+            return self._get_value(key)
+        return default
+
+    def values(self):
+        return [self._get_value(key) for key in self.keys()]
+
+    def items(self):
+        return [(key, self._get_value(key)) for key in self.keys()]
+
+    def pop(self, key, *args):
+        if key in self.keys():
+            self._get_value(key)
+        return super(TemplatesResultDict, self).pop(key, *args)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __deepcopy__(self, memo):
+        # Values are solved so the copy does not need solve callback
+        data = {
+            key: copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+        return self.__class__(
+            data, key=self.key, parent=self.parent, strict=self.strict
+        )
+
     @property
     def raise_on_unsolved(self):
         """To affect this change `strict` attribute."""
@@ -693,6 +995,42 @@ class FormatObject(object):
         return self.__str__()
 
 
+class _DynamicKeyMarker(FormatObject):
+    """Value of dynamic key used to compile template.
+
+    Formatting of the object returns marker containing key and format
+    specification, so it can be found in formatted template.
+    """
+    def __init__(self, key):
+        super(_DynamicKeyMarker, self).__init__()
+        self.key = key
+        self.value = _create_dynamic_marker(key, "")
+
+    def __format__(self, format_spec):
+        return _create_dynamic_marker(self.key, format_spec)
+
+
+def _create_dynamic_marker(key, format_spec):
+    return "{0}{1}{2}{3}{0}".format(
+        DYNAMIC_MARKER, key, DYNAMIC_MARKER_SEPARATOR, format_spec
+    )
+
+
+def _split_dynamic_markers(text, dynamic_keys):
+    segments = []
+    for idx, part in enumerate(text.split(DYNAMIC_MARKER)):
+        # Odd parts are markers
+        if idx % 2 == 0:
+            if part:
+                segments.append(part)
+            continue
+        key, format_spec = part.split(DYNAMIC_MARKER_SEPARATOR, 1)
+        if key not in dynamic_keys:
+            raise ValueError("Unknown dynamic key \"{}\"".format(key))
+        segments.append((key, format_spec))
+    return segments
+
+
 class FormattingPart:
     """String with formatting template.
 
@@ -1,8 +1,17 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Max. number of cached profile matchers
+MATCHERS_CACHE_SIZE = 128
+_matchers_cache = collections.OrderedDict()
+_matchers_cache_lock = threading.Lock()
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +125,332 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class _KeyFilter(object):
+    """Compiled filter of profile for single key.
+
+    Values of filter are split to exact values and regexes, exact values are
+    values which do not contain any regex special characters.
+
+    Args:
+        in_list (Union[list, str, None]): Profile value for the key.
+    """
+
+    def __init__(self, in_list):
+        self.is_any = False
+        self.exact_values = frozenset()
+        self.regexes = []
+        self.profile_value = in_list
+
+        if not in_list:
+            self.is_any = True
+            return
+
+        if not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        if "*" in in_list:
+            self.is_any = True
+            return
+
+        exact_values = set()
+        regex_values = []
+        for item in in_list:
+            if (
+                item
+                and isinstance(item, six.string_types)
+                and re.escape(item) == item
+            ):
+                exact_values.add(item)
+            else:
+                regex_values.append(item)
+        self.exact_values = frozenset(exact_values)
+        self.regexes = compile_list_of_regexes(regex_values)
+
+    @property
+    def exact_only(self):
+        return not self.is_any and not self.regexes
+
+    def match(self, value):
+        """Match value with same output as 'validate_value_by_regexes'."""
+        if self.is_any:
+            return 0
+
+        if not value:
+            return -1
+
+        if (
+            isinstance(value, six.string_types)
+            and value in self.exact_values
+        ):
+            return 1
+
+        for regex in self.regexes:
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                return 1
+        return -1
+
+
+class _KeyIndex(object):
+    """Filters of all profiles for single key.
+
+    Profiles which are filtering the key only by exact values are indexed
+    by the values so profiles which can't match are skipped without
+    validation.
+    """
+
+    def __init__(self, profiles, key):
+        self.filters = []
+        self.by_value = collections.defaultdict(set)
+        self.not_indexed = set()
+        for idx, profile in enumerate(profiles):
+            key_filter = _KeyFilter(profile.get(key))
+            self.filters.append(key_filter)
+            if not key_filter.exact_only:
+                self.not_indexed.add(idx)
+                continue
+            for value in key_filter.exact_values:
+                self.by_value[value].add(idx)
+
+    def get_candidates(self, value):
+        if isinstance(value, str):
+            matching = self.by_value.get(value)
+            if matching:
+                return self.not_indexed | matching
+        return self.not_indexed
+
+
+class ProfileMatcher(object):
+    """Profiles compiled for repeated filtering.
+
+    Regexes of profiles are compiled only once and profiles are indexed by
+    their exact values. Matching has the same output as 'filter_profiles'.
+
+    Matcher expects that profiles are not changed after creation.
+
+    Args:
+        profiles (Iterable[dict]): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles):
+        self._profiles = list(profiles or [])
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self):
+        return list(self._profiles)
+
+    def is_matcher_of(self, profiles):
+        """Check if matcher was created for passed profiles.
+
+        Args:
+            profiles (Iterable[dict]): Profile definitions.
+
+        Returns:
+            bool: Matcher is using same profile objects.
+        """
+        if len(profiles) != len(self._profiles):
+            return False
+        return all(
+            profile is other
+            for profile, other in zip(profiles, self._profiles)
+        )
+
+    def _get_key_index(self, key):
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = _KeyIndex(self._profiles, key)
+                    self._indexes[key] = index
+        return index
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            # Make all keys from `key_values` are passed
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        log_parts = None
+        if debug_enabled:
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        key_indexes = []
+        candidates = None
+        for key in keys_order:
+            value = key_values[key]
+            key_index = self._get_key_index(key)
+            key_indexes.append((key, value, key_index))
+            # Debug log of not matching profiles needs all profiles
+            if debug_enabled:
+                continue
+            key_candidates = key_index.get_candidates(value)
+            if candidates is None:
+                candidates = set(key_candidates)
+            else:
+                candidates &= key_candidates
+
+        if candidates is None:
+            candidates = range(len(self._profiles))
+        else:
+            candidates = sorted(candidates)
+
+        matching_profiles = None
+        highest_profile_points = -1
+        # Each profile get 1 point for each matching filter. Profile with
+        # most points is returned. For cases when more than one profile will
+        # match are also stored ordered lists of matching values.
+        for idx in candidates:
+            profile = self._profiles[idx]
+            profile_points = 0
+            profile_scores = []
+
+            for key, value, key_index in key_indexes:
+                key_filter = key_index.filters[idx]
+                match = key_filter.match(value)
+                if match == -1:
+                    if debug_enabled:
+                        profile_value = key_filter.profile_value or []
+                        logger.debug(
+                            "\"{}\" not found in \"{}\": {}".format(
+                                value, key, profile_value
+                            )
+                        )
+                    profile_points = -1
+                    break
+
+                profile_points += match
+                profile_scores.append(bool(match))
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append((profile, profile_scores))
+
+        if not matching_profiles:
+            if debug_enabled:
+                logger.debug(
+                    "None of profiles match your setup. {}".format(log_parts)
+                )
+            return None
+
+        if len(matching_profiles) > 1 and debug_enabled:
+            logger.debug(
+                "More than one profile match your setup. {}".format(
+                    log_parts
+                )
+            )
+
+        profile = _profile_exclusion(matching_profiles, logger)
+        if profile and debug_enabled:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
+
+
+def _profiles_snapshot(value):
+    """Copy of profiles content which can be compared with current content.
+
+    Lists, tuples and sets are converted to tuples and dictionaries are
+    copied so changes of profiles made in place are not reflected in the
+    snapshot.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _profiles_snapshot(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_profiles_snapshot(item) for item in value)
+    return value
+
+
+def get_profile_matcher(profiles):
+    """Get cached matcher for profiles.
+
+    Cached matcher is used only if profiles are the same objects and their
+    content did not change since the matcher was created, so profiles from
+    the same settings are compiled only once.
+
+    Args:
+        profiles (Iterable[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        ProfileMatcher: Matcher of profiles.
+    """
+    if not isinstance(profiles, (list, tuple)):
+        return ProfileMatcher(profiles)
+
+    # Cached item holds reference to profiles so id can't be reused
+    key = id(profiles)
+    snapshot = _profiles_snapshot(profiles)
+    with _matchers_cache_lock:
+        item = _matchers_cache.pop(key, None)
+        if item is not None:
+            cached_profiles, cached_snapshot, matcher = item
+            if (
+                cached_profiles is profiles
+                and cached_snapshot == snapshot
+                and matcher.is_matcher_of(profiles)
+            ):
+                # Move item to the end as the most recently used
+                _matchers_cache[key] = item
+                return matcher
+
+        matcher = ProfileMatcher(profiles)
+        _matchers_cache[key] = (profiles, snapshot, matcher)
+        while len(_matchers_cache) > MATCHERS_CACHE_SIZE:
+            _matchers_cache.popitem(last=False)
+    return matcher
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +469,8 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Compiled profiles are cached, see 'get_profile_matcher'.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,79 +486,5 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
+    matcher = get_profile_matcher(profiles_data)
+    return matcher.match(key_values, keys_order, logger)
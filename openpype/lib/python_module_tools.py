@@ -297,3 +297,95 @@ def is_func_signature_supported(func, *args, **kwargs):
         except TypeError:
             pass
     return False
+
+
+class LazyAttributesModule(types.ModuleType):
+    """Module which imports exported attributes on first access.
+
+    Attributes are defined by 'set_lazy_module_attributes'.
+    """
+
+    def __getattr__(self, name):
+        import importlib.util
+
+        lazy_attributes = self.__dict__.get("_lazy_attributes") or {}
+        if name in lazy_attributes:
+            submodule_name, attr_name = lazy_attributes[name]
+            submodule = importlib.import_module(submodule_name, self.__name__)
+            value = getattr(submodule, attr_name)
+
+        elif (
+            not name.startswith("__")
+            and importlib.util.find_spec(
+                "{}.{}".format(self.__name__, name)
+            ) is not None
+        ):
+            # Submodules were available as attributes when were imported
+            #   eagerly
+            value = importlib.import_module("." + name, self.__name__)
+
+        else:
+            raise AttributeError("module '{}' has no attribute '{}'".format(
+                self.__name__, name
+            ))
+
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # Import of submodule stores the submodule on parent module.
+        #   Exported attribute with the same name must not be replaced.
+        lazy_attributes = self.__dict__.get("_lazy_attributes") or {}
+        if isinstance(value, types.ModuleType) and name in lazy_attributes:
+            submodule_name, attr_name = lazy_attributes[name]
+            if value.__name__ == "{}.{}".format(
+                self.__name__, submodule_name.lstrip(".")
+            ):
+                value = getattr(value, attr_name)
+        super(LazyAttributesModule, self).__setattr__(name, value)
+
+    def __dir__(self):
+        output = set(super(LazyAttributesModule, self).__dir__())
+        output |= set(self.__dict__.get("_lazy_attributes") or {})
+        return sorted(output)
+
+
+def set_lazy_module_attributes(module_name, attributes_by_submodule):
+    """Import exported attributes of a package when they're used.
+
+    Package does not have to import all its submodules on import. Submodule
+    is imported on first access of any attribute it defines. Attributes are
+    imported eagerly in Python 2.
+
+    Example:
+        >>> set_lazy_module_attributes(__name__, {
+        ...     ".log": ("Logger", ),
+        ...     # Exported under different name
+        ...     ".terminal": (("terminal", "Terminal"), ),
+        ... })
+
+    Args:
+        module_name (str): Name of package module. Must be already imported.
+        attributes_by_submodule (dict[str, Iterable[Union[str, tuple]]]):
+            Attribute names by relative name of submodule. Attribute can be
+            defined as tuple with exported name and name in submodule.
+    """
+
+    module = sys.modules[module_name]
+    lazy_attributes = {}
+    for submodule_name, attributes in attributes_by_submodule.items():
+        for attribute in attributes:
+            if isinstance(attribute, six.string_types):
+                attribute = (attribute, attribute)
+            exported_name, attr_name = attribute
+            lazy_attributes[exported_name] = (submodule_name, attr_name)
+
+    if six.PY2:
+        for exported_name, item in lazy_attributes.items():
+            submodule_name, attr_name = item
+            submodule = importlib.import_module(submodule_name, module_name)
+            setattr(module, exported_name, getattr(submodule, attr_name))
+        return
+
+    module._lazy_attributes = lazy_attributes
+    module.__class__ = LazyAttributesModule
@@ -3,6 +3,9 @@ import re
 import time
 import json
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from .constants import (
     CLOCKIFY_ENDPOINT,
@@ -14,7 +17,23 @@ from openpype.lib import Logger
 
 
 class ClockifyAPI:
+    """Clockify REST API client.
+
+    Requests are sent using single session so connections are reused.
+    Workspaces, projects, tags and tasks are cached for 'cache_ttl' seconds.
+    Cache is invalidated when entities are added or removed using this
+    object, other changes are visible after cache expiration or after
+    'invalidate_cache' call.
+
+    Timers can be started and stopped in background thread using
+    'start_time_entry_async' and 'finish_time_entry_async'.
+    """
+
     log = Logger.get_logger(__name__)
+    # Time in seconds for which are cached entities valid
+    cache_ttl = 300
+    # Timeout of requests in seconds
+    request_timeout = 30
 
     def __init__(self, api_key=None, master_parent=None):
         self.workspace_name = None
@@ -23,6 +42,10 @@ class ClockifyAPI:
         self._workspace_id = None
         self._user_id = None
         self._secure_registry = None
+        self._session = requests.Session()
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._timer_executor = None
 
     @property
     def secure_registry(self):
@@ -42,6 +65,55 @@ class ClockifyAPI:
     def user_id(self):
         return self._user_id
 
+    def _request(self, method, action_url, headers=None, **kwargs):
+        if headers is None:
+            headers = self.headers
+        kwargs.setdefault("timeout", self.request_timeout)
+        return self._session.request(
+            method, CLOCKIFY_ENDPOINT + action_url, headers=headers, **kwargs
+        )
+
+    def _get_cached(self, key, getter):
+        """Get value from cache or from getter if is not cached or expired.
+
+        Value is not cached if getter returns 'None'.
+        """
+        with self._cache_lock:
+            item = self._cache.get(key)
+        if item is not None and item[0] > time.monotonic():
+            return dict(item[1])
+
+        value = getter()
+        if value is not None:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+            value = dict(value)
+        return value
+
+    def invalidate_cache(self, entity_type=None, workspace_id=None):
+        """Remove cached entities.
+
+        Args:
+            entity_type (Optional[str]): Type of entities to invalidate.
+                One of 'workspaces', 'projects', 'tags' or 'tasks'. All
+                entities are invalidated if not passed.
+            workspace_id (Optional[str]): Invalidate only entities of the
+                workspace.
+        """
+        with self._cache_lock:
+            if entity_type is None and workspace_id is None:
+                self._cache.clear()
+                return
+
+            for key in tuple(self._cache.keys()):
+                if entity_type is not None and key[0] != entity_type:
+                    continue
+                if workspace_id is not None and (
+                    len(key) < 2 or key[1] != workspace_id
+                ):
+                    continue
+                self._cache.pop(key)
+
     def verify_api(self):
         for key, value in self.headers.items():
             if value is None or value.strip() == "":
@@ -53,6 +125,8 @@ class ClockifyAPI:
             api_key = self.get_api_key()
 
         if api_key is not None and self.validate_api_key(api_key) is True:
+            if api_key != self.api_key:
+                self.invalidate_cache()
             self.api_key = api_key
             self.set_workspace()
             self.set_user_id()
@@ -64,9 +138,7 @@ class ClockifyAPI:
     def validate_api_key(self, api_key):
         test_headers = {"x-api-key": api_key}
         action_url = "user"
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=test_headers
-        )
+        response = self._request("GET", action_url, headers=test_headers)
         if response.status_code != 200:
             return False
         return True
@@ -78,9 +150,7 @@ class ClockifyAPI:
         if workspace_id is None:
             workspace_id = self.workspace_id
         action_url = f"workspaces/{workspace_id}/users?includeRoles=1"
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
         data = response.json()
         for user in data:
             if user.get("id") == user_id:
@@ -92,9 +162,7 @@ class ClockifyAPI:
 
     def get_user_id(self):
         action_url = "user"
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
         result = response.json()
         user_id = result.get("id", None)
 
@@ -140,10 +208,11 @@ class ClockifyAPI:
         self.secure_registry.set_item("api_key", api_key)
 
     def get_workspaces(self):
+        return self._get_cached(("workspaces", ), self._query_workspaces)
+
+    def _query_workspaces(self):
         action_url = "workspaces/"
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
         return {
             workspace["name"]: workspace["id"] for workspace in response.json()
         }
@@ -151,10 +220,14 @@ class ClockifyAPI:
     def get_projects(self, workspace_id=None):
         if workspace_id is None:
             workspace_id = self.workspace_id
-        action_url = f"workspaces/{workspace_id}/projects"
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
+        return self._get_cached(
+            ("projects", workspace_id),
+            lambda: self._query_projects(workspace_id)
         )
+
+    def _query_projects(self, workspace_id):
+        action_url = f"workspaces/{workspace_id}/projects"
+        response = self._request("GET", action_url)
         if response.status_code != 403:
             result = response.json()
             return {project["name"]: project["id"] for project in result}
@@ -165,31 +238,37 @@ class ClockifyAPI:
         action_url = "workspaces/{}/projects/{}".format(
             workspace_id, project_id
         )
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
 
         return response.json()
 
     def get_tags(self, workspace_id=None):
         if workspace_id is None:
             workspace_id = self.workspace_id
-        action_url = "workspaces/{}/tags".format(workspace_id)
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
+        return self._get_cached(
+            ("tags", workspace_id),
+            lambda: self._query_tags(workspace_id)
         )
 
+    def _query_tags(self, workspace_id):
+        action_url = "workspaces/{}/tags".format(workspace_id)
+        response = self._request("GET", action_url)
+
         return {tag["name"]: tag["id"] for tag in response.json()}
 
     def get_tasks(self, project_id, workspace_id=None):
         if workspace_id is None:
             workspace_id = self.workspace_id
+        return self._get_cached(
+            ("tasks", workspace_id, project_id),
+            lambda: self._query_tasks(project_id, workspace_id)
+        )
+
+    def _query_tasks(self, project_id, workspace_id):
         action_url = "workspaces/{}/projects/{}/tasks".format(
             workspace_id, project_id
         )
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
 
         return {task["name"]: task["id"] for task in response.json()}
 
@@ -282,13 +361,57 @@ class ClockifyAPI:
             "taskId": task_id,
             "tagIds": tag_ids,
         }
-        response = requests.post(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("POST", action_url, json=body)
         if response.status_code < 300:
             return True
         return False
 
+    def _submit_timer_call(self, func, *args, **kwargs):
+        """Call timer function in background thread.
+
+        All timer calls are processed in order of submission in single
+        thread so timer can't be stopped before it was started.
+        """
+        if self._timer_executor is None:
+            self._timer_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ClockifyTimer"
+            )
+        future = self._timer_executor.submit(func, *args, **kwargs)
+        future.add_done_callback(self._on_timer_call_done)
+        return future
+
+    def _on_timer_call_done(self, future):
+        exc = future.exception()
+        if exc is not None:
+            self.log.warning(
+                "Clockify timer request failed.",
+                exc_info=(type(exc), exc, exc.__traceback__)
+            )
+
+    def start_time_entry_async(self, *args, **kwargs):
+        """Start time entry without blocking.
+
+        Arguments are same as for 'start_time_entry'.
+
+        Returns:
+            concurrent.futures.Future: Future with result of
+                'start_time_entry'.
+        """
+        return self._submit_timer_call(self.start_time_entry, *args, **kwargs)
+
+    def finish_time_entry_async(self, *args, **kwargs):
+        """Finish running time entry without blocking.
+
+        Arguments are same as for 'finish_time_entry'.
+
+        Returns:
+            concurrent.futures.Future: Future with result of
+                'finish_time_entry'.
+        """
+        return self._submit_timer_call(
+            self.finish_time_entry, *args, **kwargs
+        )
+
     def _get_current_timer_values(self, response):
         if response is None:
             return
@@ -310,9 +433,7 @@ class ClockifyAPI:
             f"workspaces/{workspace_id}/user/"
             f"{user_id}/time-entries?in-progress=1"
         )
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
         return self._get_current_timer_values(response)
 
     def finish_time_entry(self, workspace_id=None, user_id=None):
@@ -327,9 +448,7 @@ class ClockifyAPI:
             workspace_id, user_id
         )
         body = {"end": self.get_current_time()}
-        response = requests.patch(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("PATCH", action_url, json=body)
         return response.json()
 
     def get_time_entries(self, workspace_id=None, user_id=None, quantity=10):
@@ -340,9 +459,7 @@ class ClockifyAPI:
         action_url = "workspaces/{}/user/{}/time-entries".format(
             workspace_id, user_id
         )
-        response = requests.get(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("GET", action_url)
         return response.json()[:quantity]
 
     def remove_time_entry(self, tid, workspace_id=None, user_id=None):
@@ -351,9 +468,7 @@ class ClockifyAPI:
         action_url = "workspaces/{}/user/{}/time-entries/{}".format(
             workspace_id, user_id, tid
         )
-        response = requests.delete(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers
-        )
+        response = self._request("DELETE", action_url)
         return response.json()
 
     def add_project(self, name, workspace_id=None):
@@ -368,17 +483,15 @@ class ClockifyAPI:
             "color": "#f44336",
             "billable": "true",
         }
-        response = requests.post(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("POST", action_url, json=body)
+        self.invalidate_cache("projects", workspace_id)
         return response.json()
 
     def add_workspace(self, name):
         action_url = "workspaces/"
         body = {"name": name}
-        response = requests.post(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("POST", action_url, json=body)
+        self.invalidate_cache("workspaces")
         return response.json()
 
     def add_task(self, name, project_id, workspace_id=None):
@@ -388,9 +501,8 @@ class ClockifyAPI:
             workspace_id, project_id
         )
         body = {"name": name, "projectId": project_id}
-        response = requests.post(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("POST", action_url, json=body)
+        self.invalidate_cache("tasks", workspace_id)
         return response.json()
 
     def add_tag(self, name, workspace_id=None):
@@ -398,9 +510,8 @@ class ClockifyAPI:
             workspace_id = self.workspace_id
         action_url = "workspaces/{}/tags".format(workspace_id)
         body = {"name": name}
-        response = requests.post(
-            CLOCKIFY_ENDPOINT + action_url, headers=self.headers, json=body
-        )
+        response = self._request("POST", action_url, json=body)
+        self.invalidate_cache("tags", workspace_id)
         return response.json()
 
     def delete_project(self, project_id, workspace_id=None):
@@ -409,10 +520,9 @@ class ClockifyAPI:
         action_url = "/workspaces/{}/projects/{}".format(
             workspace_id, project_id
         )
-        response = requests.delete(
-            CLOCKIFY_ENDPOINT + action_url,
-            headers=self.headers,
-        )
+        response = self._request("DELETE", action_url)
+        self.invalidate_cache("projects", workspace_id)
+        self.invalidate_cache("tasks", workspace_id)
         return response.json()
 
     def convert_input(
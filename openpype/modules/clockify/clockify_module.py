@@ -218,7 +218,7 @@ class ClockifyModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
     def stop_timer(self):
         """Called from TimersManager to stop timer."""
-        self.clockify_api.finish_time_entry()
+        self.clockify_api.finish_time_entry_async()
 
     def _verify_project_exists(self, project_name):
         project_id = self.clockify_api.get_project_id(project_name)
@@ -281,7 +281,7 @@ class ClockifyModule(OpenPypeModule, ITrayModule, IPluginPaths):
             tag_ids.append(task_tag_id)
 
         # Start timer
-        self.clockify_api.start_time_entry(
+        self.clockify_api.start_time_entry_async(
             description,
             project_id,
             tag_ids=tag_ids,
@@ -46,7 +46,7 @@ class ClockifyStart(LauncherAction):
         tag_ids = []
         tag_name = task_type
         tag_ids.append(self.clockify_api.get_tag_id(tag_name, workspace_id))
-        self.clockify_api.start_time_entry(
+        self.clockify_api.start_time_entry_async(
             description,
             project_id,
             tag_ids=tag_ids,
@@ -14,7 +14,6 @@ from collections import OrderedDict
 
 import six
 import attr
-import requests
 
 import pyblish.api
 from openpype.pipeline.publish import (
@@ -27,6 +26,12 @@ from openpype.pipeline.publish.lib import (
 )
 from openpype import AYON_SERVER_ENABLED
 
+from .deadline_client import (
+    get_verify_ssl,
+    get_shared_session,
+    get_deadline_client,
+)
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
@@ -44,11 +49,11 @@ def requests_post(*args, **kwargs):
 
     """
     if 'verify' not in kwargs:
-        kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
-                                              True) else True  # noqa
+        kwargs['verify'] = get_verify_ssl()
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    # use pooled session to reuse connections
+    return get_shared_session().post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -65,11 +70,11 @@ def requests_get(*args, **kwargs):
 
     """
     if 'verify' not in kwargs:
-        kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
-                                              True) else True  # noqa
+        kwargs['verify'] = get_verify_ssl()
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    # use pooled session to reuse connections
+    return get_shared_session().get(*args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -595,6 +600,45 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
         """
         url = "{}/api/jobs".format(self._deadline_url)
         response = requests_post(url, json=payload)
+        result = self._process_submit_response(response, payload)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_many(self, payloads):
+        """Submit multiple independent payloads to Deadline concurrently.
+
+        Payloads must not depend on each other. Connections to Deadline
+        Web Service are pooled and submissions run in parallel.
+
+        Args:
+            payloads (list[dict]): Payloads to submit.
+
+        Returns:
+            list[str]: Deadline job ids in order of passed payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        if not payloads:
+            return []
+
+        client = get_deadline_client(self._deadline_url)
+        responses = client.submit_jobs(payloads)
+        results = [
+            self._process_submit_response(response, payload)
+            for response, payload in zip(responses, payloads)
+        ]
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+
+        return [result["_id"] for result in results]
+
+    def _process_submit_response(self, response, payload):
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
@@ -603,14 +647,9 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             raise KnownPublishError(response.text)
 
         try:
-            result = response.json()
+            return response.json()
         except JSONDecodeError:
             msg = "Broken response {}. ".format(response)
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
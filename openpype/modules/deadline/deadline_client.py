@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""Client for Deadline Web Service.
+
+All requests to Deadline Web Service should go through shared pooled
+sessions so HTTP connections are reused between requests. Failed
+connections and temporary server errors are retried with backoff.
+
+Example:
+    >>> client = get_deadline_client("http://localhost:8082")
+    >>> jobs = client.get_jobs(["<job id 1>", "<job id 2>"])
+    >>> responses = client.submit_jobs([payload_1, payload_2])
+
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .deadline_module import DeadlineWebserviceError
+
+# Default timeout of requests in seconds
+DEFAULT_TIMEOUT = 10
+# Number of retries of failed connections and temporary server errors
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+# Max. number of connections kept open to one server
+DEFAULT_POOL_SIZE = 10
+# Max. number of job ids queried in one request
+JOB_IDS_CHUNK_SIZE = 50
+# Max. number of concurrent submissions
+DEFAULT_SUBMIT_WORKERS = 4
+
+_sessions_lock = threading.Lock()
+_sessions = {}
+_clients = {}
+
+
+def get_verify_ssl():
+    """Get SSL verification value based on environment.
+
+    Disabling SSL certificate validation if ``DONT_VERIFY_SSL`` environment
+    variable is found. This is useful when Deadline server is
+    running with self-signed certificates and its certificate is not
+    added to trusted certificates on client machines.
+
+    Warning:
+        Disabling SSL certificate validation is defeating one line
+        of defense SSL is providing, and it is not recommended.
+
+    Returns:
+        bool: Verify SSL certificates.
+    """
+    return False if os.getenv("OPENPYPE_DONT_VERIFY_SSL", True) else True
+
+
+def create_session(
+    max_retries=DEFAULT_MAX_RETRIES,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    pool_size=DEFAULT_POOL_SIZE
+):
+    """Create requests session with connection pool and retries.
+
+    Only 'GET' requests are retried on server errors. Submissions are
+    retried only when connection to server could not be established so the
+    same job is never submitted twice.
+
+    Args:
+        max_retries (int): Number of retries.
+        backoff_factor (float): Backoff factor between retries.
+        pool_size (int): Max. number of connections kept open to one host.
+
+    Returns:
+        requests.Session: Session with mounted adapters.
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session():
+    """Pooled session shared by all requests of the process.
+
+    Returns:
+        requests.Session: Shared session.
+    """
+    with _sessions_lock:
+        session = _sessions.get(None)
+        if session is None:
+            session = create_session()
+            _sessions[None] = session
+    return session
+
+
+def get_deadline_client(webservice_url):
+    """Get cached client for Deadline Web Service url.
+
+    Args:
+        webservice_url (str): Url of Deadline Web Service.
+
+    Returns:
+        DeadlineClient: Client for the url.
+    """
+    webservice_url = webservice_url.rstrip("/")
+    with _sessions_lock:
+        client = _clients.get(webservice_url)
+        if client is None:
+            client = DeadlineClient(webservice_url)
+            _clients[webservice_url] = client
+    return client
+
+
+class DeadlineClient(object):
+    """Client of Deadline Web Service REST api.
+
+    Args:
+        webservice_url (str): Url of Deadline Web Service.
+        session (Optional[requests.Session]): Session used for requests.
+            Shared pooled session is used if not passed.
+        timeout (Optional[float]): Timeout of requests in seconds.
+        verify (Optional[bool]): Verify SSL certificates. Value is based on
+            environment if not passed.
+    """
+
+    def __init__(
+        self, webservice_url, session=None, timeout=None, verify=None
+    ):
+        if session is None:
+            session = get_shared_session()
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if verify is None:
+            verify = get_verify_ssl()
+
+        self._webservice_url = webservice_url.rstrip("/")
+        self._session = session
+        self._timeout = timeout
+        self._verify = verify
+
+    @property
+    def webservice_url(self):
+        return self._webservice_url
+
+    def get_url(self, endpoint):
+        return "{}/{}".format(self._webservice_url, endpoint.lstrip("/"))
+
+    def request(self, method, endpoint, **kwargs):
+        """Send request to Deadline Web Service.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint e.g. 'api/jobs'.
+            **kwargs: Keyword arguments passed to 'requests.Session.request'.
+
+        Returns:
+            requests.Response: Response from server.
+
+        Raises:
+            DeadlineWebserviceError: When connection to server failed.
+        """
+        kwargs.setdefault("verify", self._verify)
+        kwargs.setdefault("timeout", self._timeout)
+        url = self.get_url(endpoint)
+        try:
+            return self._session.request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError as exc:
+            raise DeadlineWebserviceError(
+                "Cannot connect to DL web service {} - {}".format(
+                    self._webservice_url, exc
+                )
+            )
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request("POST", endpoint, **kwargs)
+
+    def submit_job(self, payload):
+        """Submit job payload.
+
+        Args:
+            payload (dict): Payload with 'JobInfo', 'PluginInfo'
+                and 'AuxFiles'.
+
+        Returns:
+            requests.Response: Response of the submission.
+        """
+        return self.post("api/jobs", json=payload)
+
+    def submit_jobs(self, payloads, max_workers=DEFAULT_SUBMIT_WORKERS):
+        """Submit independent jobs concurrently.
+
+        Jobs must not depend on each other as their submission order is not
+        guaranteed.
+
+        Args:
+            payloads (Iterable[dict]): Payloads of jobs.
+            max_workers (int): Max. number of concurrent submissions.
+
+        Returns:
+            list[requests.Response]: Responses in order of passed payloads.
+        """
+        payloads = list(payloads)
+        if len(payloads) < 2 or max_workers < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.submit_job, payloads))
+
+    def get_jobs(self, job_ids):
+        """Get job information of multiple jobs.
+
+        Jobs are queried in chunks so only a few requests are sent even for
+        many job ids.
+
+        Args:
+            job_ids (Iterable[str]): Deadline job ids.
+
+        Returns:
+            list[dict]: Job information of found jobs.
+
+        Raises:
+            DeadlineWebserviceError: When request failed.
+        """
+        job_ids = list(dict.fromkeys(job_id for job_id in job_ids if job_id))
+        output = []
+        for idx in range(0, len(job_ids), JOB_IDS_CHUNK_SIZE):
+            chunk = job_ids[idx:idx + JOB_IDS_CHUNK_SIZE]
+            response = self.get(
+                "api/jobs", params={"JobID": ",".join(chunk)}
+            )
+            if not response.ok:
+                raise DeadlineWebserviceError(
+                    "Failed to get jobs info: {} {}".format(
+                        response.status_code, response.text
+                    )
+                )
+            output.extend(response.json() or [])
+        return output
+
+    def get_job(self, job_id):
+        """Get job information.
+
+        Args:
+            job_id (str): Deadline job id.
+
+        Returns:
+            Union[dict, None]: Job information or None if not found.
+        """
+        jobs = self.get_jobs([job_id])
+        if jobs:
+            return jobs[0]
+        return None
+
+    def get_pools(self):
+        """Get names of pools.
+
+        Returns:
+            list[str]: Pool names.
+
+        Raises:
+            DeadlineWebserviceError: When request failed.
+        """
+        response = self.get("api/pools", params={"NamesOnly": "true"})
+        if not response.ok:
+            raise DeadlineWebserviceError(
+                "Failed to get pools: {} {}".format(
+                    response.status_code, response.text
+                )
+            )
+        return response.json()
@@ -1,10 +1,10 @@
 import os
-import requests
 
 import pyblish.api
 
 from openpype.lib import collect_frames
-from openpype_modules.deadline.abstract_submit_deadline import requests_get
+from openpype_modules.deadline.deadline_module import DeadlineWebserviceError
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class ValidateExpectedFiles(pyblish.api.InstancePlugin):
@@ -129,8 +129,7 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         """
         all_frame_lists = []
 
-        for job_id in dependent_job_ids:
-            job_info = self._get_job_info(instance, job_id)
+        for job_info in self._get_jobs_info(instance, dependent_job_ids):
             frame_list = job_info["Props"].get("Frames")
             if frame_list:
                 all_frame_lists.extend(frame_list.split(','))
@@ -185,18 +184,18 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
 
         return file_name_template, frame_placeholder
 
-    def _get_job_info(self, instance, job_id):
-        """Calls DL for actual job info for 'job_id'
+    def _get_jobs_info(self, instance, job_ids):
+        """Calls DL for actual job info of all 'job_ids' at once
 
         Might be different than job info saved in metadata.json if user
         manually changes job pre/during rendering.
 
         Args:
             instance (pyblish.api.Instance): pyblish instance
-            job_id (str): Deadline job id
+            job_ids (list[str]): Deadline job ids
 
         Returns:
-            (dict): Job info from Deadline
+            (list[dict]): Job info from Deadline
 
         """
         # get default deadline webservice url from deadline module
@@ -206,24 +205,13 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             deadline_url = instance.data.get("deadlineUrl")
         assert deadline_url, "Requires Deadline Webservice URL"
 
-        url = "{}/api/jobs?JobID={}".format(deadline_url, job_id)
+        client = get_deadline_client(deadline_url)
         try:
-            response = requests_get(url)
-        except requests.exceptions.ConnectionError:
+            return client.get_jobs(job_ids)
+        except DeadlineWebserviceError as exc:
             self.log.error("Deadline is not accessible at "
                            "{}".format(deadline_url))
-            return {}
-
-        if not response.ok:
-            self.log.error("Submission failed!")
-            self.log.error(response.status_code)
-            self.log.error(response.content)
-            raise RuntimeError(response.text)
-
-        json_content = response.json()
-        if json_content:
-            return json_content.pop()
-        return {}
+            raise RuntimeError(str(exc))
 
     def _get_existing_files(self, staging_dir):
         """Returns set of existing file names from 'staging_dir'"""
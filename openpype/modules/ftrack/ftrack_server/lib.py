@@ -7,6 +7,7 @@ import threading
 import datetime
 import time
 import queue
+import functools
 import collections
 import appdirs
 import socket
@@ -43,6 +44,157 @@ def get_host_ip():
     return None
 
 
+def get_event_partition_key(event):
+    """Key of partition in which event must be processed in order.
+
+    Events related to one project are partitioned by ftrack project id.
+    Action events without project information are partitioned by id of
+    first selected entity.
+
+    Args:
+        event (ftrack_api.event.base.Event): Processed event.
+
+    Returns:
+        Union[str, None]: Partition key or None if event can't be related
+            to any entity.
+    """
+    data = event.get("data") or {}
+    for entity_info in data.get("entities") or []:
+        if entity_info.get("entityType") == "show":
+            return entity_info.get("entityId")
+        for parent_info in entity_info.get("parents") or []:
+            if parent_info.get("entityType") == "show":
+                return parent_info.get("entityId")
+
+    for selection_item in data.get("selection") or []:
+        entity_id = selection_item.get("entityId")
+        if entity_id:
+            return entity_id
+    return None
+
+
+class PartitionedEventExecutor(object):
+    """Execute events on worker threads with strict order per partition.
+
+    Events of one partition are processed one after another in order in
+    which they were submitted. Different partitions are processed
+    concurrently by a pool of worker threads.
+
+    Args:
+        worker_count (int): Number of worker threads.
+        callback (Callable[[ftrack_api.event.base.Event], None]): Function
+            processing single event.
+        log (logging.Logger): Logger used to log callback crashes.
+    """
+
+    _stop_item = object()
+
+    def __init__(self, worker_count, callback, log):
+        self._callback = callback
+        self._log = log
+        self._lock = threading.Lock()
+        self._idle_condition = threading.Condition(self._lock)
+        # Partition is available in the mapping until all its events are
+        # processed. Currently processed event is the first item.
+        self._partitions = {}
+        self._ready_partitions = queue.Queue()
+        self._pending_count = 0
+        self._workers = []
+        for idx in range(worker_count):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name="FtrackEventWorker{}".format(idx)
+            )
+            thread.daemon = True
+            thread.start()
+            self._workers.append(thread)
+
+    @property
+    def worker_count(self):
+        return len(self._workers)
+
+    @property
+    def pending_count(self):
+        """Number of submitted events which were not processed yet."""
+        return self._pending_count
+
+    def get_partition_depths(self):
+        """Number of pending events per partition.
+
+        Returns:
+            dict[Union[str, None], int]: Pending events count by partition.
+        """
+        with self._lock:
+            return {
+                key: len(partition)
+                for key, partition in self._partitions.items()
+            }
+
+    def submit(self, partition_key, event):
+        with self._lock:
+            self._pending_count += 1
+            partition = self._partitions.get(partition_key)
+            if partition is not None:
+                partition.append(event)
+                return
+            self._partitions[partition_key] = collections.deque([event])
+        self._ready_partitions.put(partition_key)
+
+    def wait_until_idle(self, timeout=None):
+        """Wait until all submitted events are processed.
+
+        Returns:
+            bool: All events were processed before timeout.
+        """
+        with self._idle_condition:
+            return self._idle_condition.wait_for(
+                lambda: self._pending_count == 0, timeout
+            )
+
+    def shutdown(self, wait=True):
+        """Stop workers after all pending events are processed."""
+        if wait:
+            self.wait_until_idle()
+
+        for _ in self._workers:
+            self._ready_partitions.put(self._stop_item)
+
+        if wait:
+            for thread in self._workers:
+                thread.join()
+
+    def _worker_loop(self):
+        while True:
+            partition_key = self._ready_partitions.get()
+            if partition_key is self._stop_item:
+                break
+
+            with self._lock:
+                event = self._partitions[partition_key][0]
+
+            try:
+                self._callback(event)
+            except Exception:
+                self._log.error(
+                    "Processing of event failed", exc_info=True
+                )
+
+            with self._lock:
+                self._pending_count -= 1
+                partition = self._partitions[partition_key]
+                partition.popleft()
+                has_more = bool(partition)
+                if not has_more:
+                    self._partitions.pop(partition_key)
+                if self._pending_count == 0:
+                    self._idle_condition.notify_all()
+
+            if has_more:
+                # Put partition at the end of queue so other partitions
+                # are not starving
+                self._ready_partitions.put(partition_key)
+
+
 class SocketBaseEventHub(ftrack_api.event.hub.EventHub):
 
     hearbeat_msg = b"hearbeat"
@@ -112,15 +264,91 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by the storer.
+
+    Handled events are acknowledged in bulk. Ids of processed events are
+    buffered and written with single 'update_many' once the buffer is full,
+    flush interval passed or before next events are loaded from database.
+
+    New events are loaded when the queue is empty. If Mongo server supports
+    change streams (replica set) a background thread watches the events
+    collection and wakes up the processing loop as soon as storer stores
+    new event, otherwise the collection is polled.
+
+    Events are handled one by one by default. When
+    'OPENPYPE_FTRACK_EVENT_WORKERS' is set to a positive number, events are
+    partitioned by ftrack project (or selected entity) and partitions are
+    handled concurrently by a pool of worker threads. Events of one
+    partition are always handled in the order in which they were stored.
+
+    Ftrack session is not thread safe and most of handlers keep state of
+    processed event on the instance. Each worker creates own session with
+    own handler instances using factory set by 'set_worker_session_factory'.
+    Without the factory all workers use handlers of processor session and
+    callbacks are serialized unless the handler is marked with
+    'concurrent_safe'.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Maximum number of events loaded from database at once
+    load_limit = 500
+    # Poll interval when change streams are not available
+    poll_interval = 0.5
+    # Bulk acknowledgment of processed events
+    ack_buffer_size = 100
+    ack_flush_interval = 1.0
+    # Cleanup of old processed events
+    cleanup_interval = 600
+    cleanup_older_than_days = 3
+    # Time window used to calculate events per second
+    metrics_window = 60
+    # Number of worker threads handling partitions of events (0 is serial)
+    worker_count = int(os.environ.get("OPENPYPE_FTRACK_EVENT_WORKERS") or 0)
+    # Handlers running longer than budget (in seconds) are reported
+    handler_time_budget = float(
+        os.environ.get("OPENPYPE_FTRACK_HANDLER_TIME_BUDGET") or 10
+    )
+    # Number of slow handler warnings kept for status
+    slow_handler_warnings_limit = 10
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._ack_lock = threading.Lock()
+        self._processed_ids = []
+        # Ids of events loaded from database which were not acknowledged yet
+        self._dispatched_ids = set()
+        self._last_ack_flush = time.time()
+        self._last_cleanup = None
+
+        self._new_events_signal = threading.Event()
+        self._change_stream_thread = None
+        self._change_stream_enabled = False
+
+        self._executor = None
+        self._worker_session_factory = None
+        self._worker_data = threading.local()
+        self._worker_sessions_lock = threading.Lock()
+        self._worker_sessions = []
+
+        self._event_stored_times = {}
+        self._handled_timestamps = collections.deque()
+        self._handled_count = 0
+        self._last_queue_lag = None
+
+        self._handler_stats_lock = threading.Lock()
+        # Callbacks which are not safe to run concurrently
+        self._serial_callbacks_lock = threading.RLock()
+        self._handler_stats = {}
+        self._slow_handler_warnings = collections.deque(
+            maxlen=self.slow_handler_warnings_limit
+        )
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -145,61 +373,353 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def set_worker_session_factory(self, factory):
+        """Set factory creating session of event worker.
+
+        Factory is called once in each worker thread and must return session
+        with 'WorkerEventHub' (e.g. 'WorkerSession') which has registered
+        all event handlers.
+
+        Args:
+            factory (Callable[[], ftrack_api.Session]): Session factory.
+        """
+        self._worker_session_factory = factory
+
+    def subscribe(self, subscription, callback, *args, **kwargs):
+        """Subscribe callback wrapped to measure its execution time."""
+        return super(ProcessEventHub, self).subscribe(
+            subscription, self._wrap_timed_callback(callback), *args, **kwargs
+        )
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events are
+        set as processed in Mongo DB in bulks.
         """
         started = time.time()
         self.prepare_dbcon()
-        while True:
-            try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+        self._start_change_stream()
+        self._start_executor()
+
+        try:
+            while True:
                 try:
-                    self._handle(event)
-
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
-
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self._flush_processed()
+                    self._cleanup_processed_events()
+                    if not self._can_load_events() or not self.load_events():
+                        self._wait_for_new_events()
+                else:
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        self._stop_executor()
+                        self._process_event(event)
+                        break
+
+                    if self._executor is None:
+                        self._process_event(event)
+                    else:
+                        self._executor.submit(
+                            get_event_partition_key(event), event
+                        )
+                    self._flush_processed()
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        break
+            self._stop_executor()
+            self._flush_processed(force=True)
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(os.environ["OPENPYPE_MONGO"]))
+            sys.exit(0)
+
+    def _process_event(self, event):
+        self._handle(event)
+        self._mark_processed(event)
+
+    def _process_worker_event(self, event):
+        """Handle event by handlers of session owned by current worker."""
+        session = getattr(self._worker_data, "session", None)
+        if session is None:
+            session = self._worker_session_factory()
+            self._worker_data.session = session
+            with self._worker_sessions_lock:
+                self._worker_sessions.append(session)
+        session.event_hub._handle(event)
+        self._mark_processed(event)
+
+    def _start_executor(self):
+        if self.worker_count < 1 or self._executor is not None:
+            return
+
+        callback = self._process_event
+        if self._worker_session_factory is not None:
+            callback = self._process_worker_event
+        else:
+            self.pypelog.warning((
+                "Worker session factory is not set. Handlers share"
+                " processor session and are not handled concurrently."
+            ))
+
+        self.pypelog.info((
+            "Handling events concurrently with {} workers."
+        ).format(self.worker_count))
+        self._executor = PartitionedEventExecutor(
+            self.worker_count, callback, self.pypelog
+        )
+
+    def _stop_executor(self):
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+        with self._worker_sessions_lock:
+            worker_sessions = self._worker_sessions
+            self._worker_sessions = []
+        for session in worker_sessions:
+            try:
+                session.close()
+            except Exception:
+                self.pypelog.warning(
+                    "Failed to close worker session", exc_info=True
+                )
+
+    def _get_pending_count(self):
+        pending_count = self._event_queue.qsize()
+        if self._executor is not None:
+            pending_count += self._executor.pending_count
+        return pending_count
+
+    def _can_load_events(self):
+        """Don't load more events when workers are not keeping up."""
+        if self._executor is None:
+            return True
+        return self._executor.pending_count < self.load_limit
+
+    def _wait_for_new_events(self):
+        """Wait until storer stores new events or poll interval passes.
+
+        Change stream thread sets the signal when new event is stored. When
+        change streams are not available the signal is never set and this
+        works as regular poll sleep.
+        """
+        timeout = self.poll_interval
+        if self._change_stream_enabled and self._executor is None:
+            # Keep a fallback poll in case a notification is missed
+            timeout = self.poll_interval * 10
+        self._new_events_signal.wait(timeout)
+        self._new_events_signal.clear()
+
+    def _start_change_stream(self):
+        if self._change_stream_thread is not None:
+            return
+        thread = threading.Thread(
+            target=self._watch_new_events,
+            name="ProcessEventHubChangeStream"
+        )
+        thread.daemon = True
+        self._change_stream_thread = thread
+        thread.start()
+
+    def _watch_new_events(self):
+        """Wake up processing loop when storer stores new events.
+
+        Change streams are available only on replica sets and sharded
+        clusters. On standalone Mongo server the thread ends and events are
+        loaded by polling.
+        """
+        pipeline = [{
+            "$match": {
+                "operationType": {"$in": ["insert", "replace"]}
+            }
+        }]
+        try:
+            with self.dbcon.watch(pipeline) as stream:
+                self._change_stream_enabled = True
+                self.pypelog.debug(
+                    "Watching Mongo change stream for new events."
+                )
+                for _ in stream:
+                    self._new_events_signal.set()
+
+        except pymongo.errors.PyMongoError as exc:
+            self.pypelog.debug((
+                "Mongo change streams are not available ({}),"
+                " falling back to polling."
+            ).format(str(exc)))
+
+        finally:
+            self._change_stream_enabled = False
+
+    def _wrap_timed_callback(self, callback, serialize=True):
+        """Wrap callback to measure its execution time.
+
+        Args:
+            callback (Callable[[ftrack_api.event.base.Event], Any]): Event
+                callback.
+            serialize (bool): Callback uses processor session and must not
+                run concurrently with other callbacks (unless handler is
+                marked as 'concurrent_safe').
+        """
+        callback_self = getattr(callback, "__self__", None)
+        if callback_self is not None:
+            label = "{}.{}".format(
+                callback_self.__class__.__name__, callback.__name__
+            )
+        else:
+            label = getattr(callback, "__name__", None) or str(callback)
+        concurrent_safe = (
+            not serialize
+            or getattr(callback_self, "concurrent_safe", False)
+        )
+
+        def _call_timed(event):
+            start = time.time()
+            try:
+                return callback(event)
+            finally:
+                self._record_handler_time(label, time.time() - start, event)
+
+        @functools.wraps(callback)
+        def timed_callback(event):
+            if concurrent_safe:
+                return _call_timed(event)
+            # Wait time for other callbacks is not part of measured time
+            with self._serial_callbacks_lock:
+                return _call_timed(event)
+        return timed_callback
+
+    def _record_handler_time(self, label, duration, event):
+        with self._handler_stats_lock:
+            stats = self._handler_stats.get(label)
+            if stats is None:
+                stats = {"count": 0, "total": 0.0, "max": 0.0, "slow": 0}
+                self._handler_stats[label] = stats
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+            if duration <= self.handler_time_budget:
+                return
+            stats["slow"] += 1
+
+            message = (
+                "{} took {:.2f}s (budget {:.2f}s) on \"{}\" [{}]"
+            ).format(
+                label,
+                duration,
+                self.handler_time_budget,
+                event.get("topic"),
+                get_event_partition_key(event) or "N/A"
+            )
+            self._slow_handler_warnings.append("{} {}".format(
+                datetime.datetime.now().strftime("%Y.%m.%d %H:%M:%S"),
+                message
+            ))
+        self.pypelog.warning("Slow event handler: {}".format(message))
+
+    def _mark_processed(self, event):
+        """Buffer acknowledgment of handled event."""
+        now = time.time()
+        mongo_id = event["data"].get("_event_mongo_id")
+        with self._ack_lock:
+            self._handled_count += 1
+            self._handled_timestamps.append(now)
+            window_start = now - self.metrics_window
+            while (
+                self._handled_timestamps
+                and self._handled_timestamps[0] < window_start
+            ):
+                self._handled_timestamps.popleft()
+
+            if mongo_id is None:
+                return
+
+            stored = self._event_stored_times.pop(mongo_id, None)
+            if stored is not None:
+                self._last_queue_lag = (
+                    datetime.datetime.utcnow() - stored
+                ).total_seconds()
+
+            self._processed_ids.append(mongo_id)
+
+        if self._executor is None:
+            self._flush_processed()
+
+    def _flush_processed(self, force=False):
+        """Set buffered events as processed with single bulk update.
+
+        Args:
+            force (bool): Flush buffer even if it is not full and flush
+                interval did not pass yet.
+        """
+        with self._ack_lock:
+            if not self._processed_ids:
+                return
+
+            if (
+                not force
+                and len(self._processed_ids) < self.ack_buffer_size
+                and (
+                    (time.time() - self._last_ack_flush)
+                    < self.ack_flush_interval
+                )
+                and self._get_pending_count() > 0
+            ):
+                return
+
+            processed_ids = self._processed_ids
+            self._processed_ids = []
+            self._last_ack_flush = time.time()
+
+        self.dbcon.update_many(
+            {"_id": {"$in": processed_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+        with self._ack_lock:
+            self._dispatched_ids.difference_update(processed_ids)
+
+    def _cleanup_processed_events(self):
+        """Remove old processed events from database on a timer."""
+        now = time.time()
+        if (
+            self._last_cleanup is not None
+            and (now - self._last_cleanup) < self.cleanup_interval
+        ):
+            return
+        self._last_cleanup = now
+
+        ago_date = datetime.datetime.now() - datetime.timedelta(
+            days=self.cleanup_older_than_days
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
+        # Make sure already handled events are not loaded again
+        self._flush_processed(force=True)
+
+        with self._ack_lock:
+            dispatched_ids = set(self._dispatched_ids)
+
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+        ).limit(self.load_limit + len(dispatched_ids))
 
         found = False
         for event_data in not_processed_events:
+            # Skip events which are still processed by workers
+            if event_data["_id"] in dispatched_ids:
+                continue
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -214,10 +734,102 @@ class ProcessEventHub(SocketBaseEventHub):
                 ))
                 continue
             found = True
+            stored = (event_data.get("pype_data") or {}).get("stored")
+            with self._ack_lock:
+                self._dispatched_ids.add(event_data["_id"])
+                if stored is not None:
+                    self._event_stored_times[event_data["_id"]] = stored
             self._event_queue.put(event)
 
         return found
 
+    def get_status_info(self):
+        """Processing metrics shown in event server status.
+
+        Returns:
+            list[list[str]]: Pairs of label and value.
+        """
+        now = time.time()
+        window_start = now - self.metrics_window
+        with self._ack_lock:
+            recent_count = len([
+                timestamp
+                for timestamp in self._handled_timestamps
+                if timestamp >= window_start
+            ])
+            pending_acks = len(self._processed_ids)
+
+        queue_lag = "N/A"
+        if self._last_queue_lag is not None:
+            queue_lag = "{:.2f}s".format(self._last_queue_lag)
+
+        if self._change_stream_enabled:
+            load_mode = "Change stream"
+        else:
+            load_mode = "Polling ({}s)".format(self.poll_interval)
+
+        events_per_second = recent_count / float(self.metrics_window)
+        output = [
+            ["Events handled", str(self._handled_count)],
+            [
+                "Events/s (last {}s)".format(self.metrics_window),
+                "{:.2f}".format(events_per_second)
+            ],
+            ["Queue lag", queue_lag],
+            ["Queued events", str(self._get_pending_count())],
+            ["Pending acknowledgments", str(pending_acks)],
+            ["Events loading", load_mode]
+        ]
+
+        executor = self._executor
+        if executor is None:
+            output.append(["Execution mode", "Serial"])
+        else:
+            partition_depths = executor.get_partition_depths()
+            max_depth = 0
+            if partition_depths:
+                max_depth = max(partition_depths.values())
+            if self._worker_session_factory is not None:
+                sessions_label = "session per worker"
+            else:
+                sessions_label = "shared session"
+            output.append([
+                "Execution mode",
+                "Concurrent ({} workers, {})".format(
+                    executor.worker_count, sessions_label
+                )
+            ])
+            output.append(["Active partitions", str(len(partition_depths))])
+            output.append(["Deepest partition queue", str(max_depth)])
+
+        output.append([
+            "Handler time budget", "{:.2f}s".format(self.handler_time_budget)
+        ])
+        with self._handler_stats_lock:
+            slowest = sorted(
+                self._handler_stats.items(),
+                key=lambda item: item[1]["max"],
+                reverse=True
+            )[:5]
+            slow_warnings = list(self._slow_handler_warnings)
+
+        if slowest:
+            output.append(["Slowest handlers", "<br/>".join(
+                "{}: max {:.2f}s, avg {:.2f}s, over budget {}x".format(
+                    label,
+                    stats["max"],
+                    stats["total"] / stats["count"],
+                    stats["slow"]
+                )
+                for label, stats in slowest
+            )])
+
+        if slow_warnings:
+            output.append([
+                "Slow handler warnings", "<br/>".join(reversed(slow_warnings))
+            ])
+        return output
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -227,6 +839,43 @@ class ProcessEventHub(SocketBaseEventHub):
         return super()._handle_packet(code, packet_identifier, path, data)
 
 
+class WorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of session used by one event worker of processor.
+
+    Hub is never connected to ftrack server. Handlers registered to worker
+    session subscribe to the hub and events are passed to them by
+    'ProcessEventHub'. Published events are sent by connected hub of
+    processor session.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._main_hub = kwargs.pop("main_hub")
+        super(WorkerEventHub, self).__init__(*args, **kwargs)
+
+    def subscribe(self, subscription, callback, *args, **kwargs):
+        """Subscribe callback wrapped to measure its execution time."""
+        callback = self._main_hub._wrap_timed_callback(
+            callback, serialize=False
+        )
+        return super(WorkerEventHub, self).subscribe(
+            subscription, callback, *args, **kwargs
+        )
+
+    def _notify_server_about_subscriber(self, subscriber):
+        # Events are passed by processor, server must not know subscribers
+        pass
+
+    def _publish(self, event, synchronous=False, callback=None, on_reply=None):
+        if synchronous:
+            # Synchronous events are handled only by local subscribers
+            return super(WorkerEventHub, self)._publish(
+                event, synchronous=synchronous
+            )
+        return self._main_hub._publish(
+            event, callback=callback, on_reply=on_reply
+        )
+
+
 class CustomEventHubSession(ftrack_api.session.Session):
     '''An isolated session for interaction with an ftrack server.'''
     def __init__(
@@ -406,3 +1055,18 @@ class SocketSession(CustomEventHubSession):
             self._api_key,
             sock=self.sock
         )
+
+
+class WorkerSession(CustomEventHubSession):
+    """Session of event worker with 'WorkerEventHub'.
+
+    Expects 'main_hub' keyword argument with event hub of processor session.
+    """
+
+    def _create_event_hub(self):
+        return WorkerEventHub(
+            self._server_url,
+            self._api_user,
+            self._api_key,
+            main_hub=self.kwargs["main_hub"]
+        )
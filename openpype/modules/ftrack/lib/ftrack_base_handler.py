@@ -44,6 +44,10 @@ class BaseHandler(object):
     type = 'No-type'
     ignore_me = False
     preactions = []
+    # Event processor running with workers creates handler instances with
+    #   own session for each worker. When handlers share processor session
+    #   only handlers marked as safe are called from more threads at once.
+    concurrent_safe = False
 
     @staticmethod
     def join_query_keys(keys):
@@ -9,6 +9,7 @@ import ftrack_api
 from openpype_modules.ftrack.ftrack_server.ftrack_server import FtrackServer
 from openpype_modules.ftrack.ftrack_server.lib import (
     SocketSession,
+    WorkerSession,
     ProcessEventHub,
     TOPIC_STATUS_SERVER
 )
@@ -39,14 +40,18 @@ def send_status(event):
     if not session:
         return
 
+    status_info = [
+        ["created_at", subprocess_started.strftime("%Y.%m.%d %H:%M:%S")],
+        ["OpenPype version", get_openpype_version() or "N/A"],
+        ["OpenPype build version", get_build_version() or "N/A"]
+    ]
+    # Queue lag and throughput of event processing
+    status_info.extend(session.event_hub.get_status_info())
+
     new_event_data = {
         "subprocess_id": subprocess_id,
         "source": "processor",
-        "status_info": [
-            ["created_at", subprocess_started.strftime("%Y.%m.%d %H:%M:%S")],
-            ["OpenPype version", get_openpype_version() or "N/A"],
-            ["OpenPype build version", get_build_version() or "N/A"]
-        ]
+        "status_info": status_info
     }
 
     new_event = ftrack_api.event.base.Event(
@@ -91,6 +96,15 @@ def main(args):
         server = FtrackServer(
             ftrack_module.server_event_handlers_paths
         )
+
+        def create_worker_session():
+            # Each event worker has own session and handler instances
+            worker_session = WorkerSession(main_hub=session.event_hub)
+            register(worker_session)
+            server.set_files(server.handler_paths, worker_session)
+            return worker_session
+
+        session.event_hub.set_worker_session_factory(create_worker_session)
         log.debug("Launched Ftrack Event processor")
         server.run_server(session)
 
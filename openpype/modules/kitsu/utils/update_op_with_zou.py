@@ -1,9 +1,12 @@
 """Functions to update OpenPype data using Kitsu DB (a.k.a Zou)."""
 from copy import deepcopy
 import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pymongo import DeleteOne, UpdateOne
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from requests.adapters import HTTPAdapter
 import gazu
 
 from openpype.client import (
@@ -23,6 +26,9 @@ log = Logger.get_logger(__name__)
 # Accepted namin pattern for OP
 naming_pattern = re.compile("^[a-zA-Z0-9_.]*$")
 
+# Maximum number of concurrent requests to Kitsu
+MAX_REQUEST_WORKERS = 8
+
 
 def create_op_asset(gazu_entity: dict) -> dict:
     """Create OP asset dict from gazu entity.
@@ -37,6 +43,150 @@ def create_op_asset(gazu_entity: dict) -> dict:
     }
 
 
+def set_gazu_pool_size(pool_size: int):
+    """Make sure gazu session can keep connections for concurrent requests.
+
+    Requests session keeps only 10 connections per host by default, other
+    connections are closed after each request.
+
+    Args:
+        pool_size (int): Number of pooled connections.
+    """
+    client = getattr(gazu.client, "default_client", None)
+    session = getattr(client, "session", None)
+    if session is None:
+        return
+
+    host = gazu.client.get_host()
+    current_adapter = session.get_adapter(host)
+    if getattr(current_adapter, "_pool_maxsize", 0) >= pool_size:
+        return
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def fetch_concurrently(
+    calls: Dict[str, Tuple[Callable, tuple]],
+    max_workers: int = MAX_REQUEST_WORKERS,
+) -> Dict[str, Any]:
+    """Run independent gazu requests concurrently.
+
+    Args:
+        calls (Dict[str, Tuple[Callable, tuple]]): Function with arguments
+            by key of result.
+        max_workers (int): Maximum number of concurrent requests.
+
+    Returns:
+        Dict[str, Any]: Results of calls by their keys.
+    """
+    set_gazu_pool_size(max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            key: executor.submit(func, *args)
+            for key, (func, args) in calls.items()
+        }
+    return {key: future.result() for key, future in futures.items()}
+
+
+def fetch_kitsu_project_data(
+    project: dict, max_workers: int = MAX_REQUEST_WORKERS
+) -> Dict[str, List[dict]]:
+    """Fetch entities and tasks of project from Kitsu in bulk.
+
+    Number of requests does not depend on number of entities in project.
+
+    Args:
+        project (dict): Gazu project.
+        max_workers (int): Maximum number of concurrent requests.
+
+    Returns:
+        Dict[str, List[dict]]: Lists of gazu entities by their type.
+    """
+    return fetch_concurrently(
+        {
+            "assets": (gazu.asset.all_assets_for_project, (project,)),
+            "asset_types": (
+                gazu.asset.all_asset_types_for_project, (project,)
+            ),
+            "episodes": (gazu.shot.all_episodes_for_project, (project,)),
+            "sequences": (gazu.shot.all_sequences_for_project, (project,)),
+            "shots": (gazu.shot.all_shots_for_project, (project,)),
+            "tasks": (
+                gazu.client.fetch_all,
+                ("tasks", {"project_id": project["id"]}),
+            ),
+            "task_types": (gazu.task.all_task_types, ()),
+            "task_statuses": (gazu.task.all_task_statuses, ()),
+            "entity_types": (gazu.entity.all_entity_types, ()),
+            "persons": (gazu.person.all_persons, ()),
+        },
+        max_workers,
+    )
+
+
+def get_full_tasks_by_entity_id(
+    project: dict, project_data: Dict[str, List[dict]]
+) -> Dict[str, List[dict]]:
+    """Join tasks of project with related entities in memory.
+
+    Tasks have same structure as tasks returned by 'gazu.task.get_task'.
+
+    Args:
+        project (dict): Gazu project.
+        project_data (Dict[str, List[dict]]): Output of
+            'fetch_kitsu_project_data'.
+
+    Returns:
+        Dict[str, List[dict]]: Tasks sorted by name by entity id.
+    """
+    entities_by_id = {
+        entity["id"]: entity
+        for key in ("assets", "episodes", "sequences", "shots")
+        for entity in project_data[key]
+    }
+    task_types_by_id = {t["id"]: t for t in project_data["task_types"]}
+    statuses_by_id = {s["id"]: s for s in project_data["task_statuses"]}
+    entity_types_by_id = {t["id"]: t for t in project_data["entity_types"]}
+    persons_by_id = {p["id"]: p for p in project_data["persons"]}
+
+    tasks_by_entity_id = {}
+    for task in sorted(project_data["tasks"], key=lambda t: t["name"]):
+        entity = entities_by_id.get(task["entity_id"])
+        if entity is None:
+            continue
+
+        assignees = [
+            persons_by_id[person_id]
+            for person_id in task.get("assignees") or []
+            if person_id in persons_by_id
+        ]
+        full_task = dict(task)
+        full_task.update(
+            {
+                "type": "Task",
+                "project": project,
+                "entity": entity,
+                "entity_type": entity_types_by_id.get(
+                    entity.get("entity_type_id")
+                ),
+                "task_type": task_types_by_id.get(task["task_type_id"]),
+                "task_status": statuses_by_id.get(task["task_status_id"]),
+                "persons": assignees,
+                "assignees": assignees,
+            }
+        )
+        sequence = entities_by_id.get(entity.get("parent_id"))
+        if sequence is not None:
+            full_task["sequence"] = sequence
+            episode = entities_by_id.get(sequence.get("parent_id"))
+            if episode is not None:
+                full_task["episode"] = episode
+        tasks_by_entity_id.setdefault(entity["id"], []).append(full_task)
+    return tasks_by_entity_id
+
+
 def get_kitsu_project_name(project_id: str) -> str:
     """Get project name based on project id in kitsu.
 
@@ -68,6 +218,8 @@ def update_op_assets(
     project_doc: dict,
     entities_list: List[dict],
     asset_doc_ids: Dict[str, dict],
+    tasks_by_entity_id: Optional[Dict[str, List[dict]]] = None,
+    root_folder_ids: Optional[Dict[str, ObjectId]] = None,
 ) -> List[Dict[str, dict]]:
     """Update OpenPype assets.
     Set 'data' and 'parent' fields.
@@ -78,6 +230,11 @@ def update_op_assets(
         project_doc (dict): Dict of project,
         entities_list (List[dict]): List of zou entities to update
         asset_doc_ids (Dict[str, dict]): Dicts of [{zou_id: asset_doc}, ...]
+        tasks_by_entity_id (Optional[Dict[str, List[dict]]]): Prefetched
+            full tasks by zou entity id. Tasks are requested for each
+            entity if not passed.
+        root_folder_ids (Optional[Dict[str, ObjectId]]): Ids of root folder
+            assets by name. Queried from DB if not passed.
 
     Returns:
         List[Dict[str, dict]]: List of (doc_id, update_dict) tuples
@@ -86,6 +243,8 @@ def update_op_assets(
         return
 
     project_name = project_doc["name"]
+    if root_folder_ids is None:
+        root_folder_ids = {}
 
     assets_with_update = []
     for item in entities_list:
@@ -179,19 +338,30 @@ def update_op_assets(
         )
 
         # Tasks
-        tasks_list = []
         item_type = item["type"]
-        if item_type == "Asset":
-            tasks_list = gazu.task.all_tasks_for_asset(item)
-        elif item_type == "Shot":
-            tasks_list = gazu.task.all_tasks_for_shot(item)
-        item_data["tasks"] = {
-            t["task_type_name"]: {
-                "type": t["task_type_name"],
-                "zou": gazu.task.get_task(t["id"]),
+        if tasks_by_entity_id is not None:
+            item_data["tasks"] = {}
+            if item_type in ("Asset", "Shot"):
+                item_data["tasks"] = {
+                    t["task_type"]["name"]: {
+                        "type": t["task_type"]["name"],
+                        "zou": t,
+                    }
+                    for t in tasks_by_entity_id.get(item["id"], [])
+                }
+        else:
+            tasks_list = []
+            if item_type == "Asset":
+                tasks_list = gazu.task.all_tasks_for_asset(item)
+            elif item_type == "Shot":
+                tasks_list = gazu.task.all_tasks_for_shot(item)
+            item_data["tasks"] = {
+                t["task_type_name"]: {
+                    "type": t["task_type_name"],
+                    "zou": gazu.task.get_task(t["id"]),
+                }
+                for t in tasks_list
             }
-            for t in tasks_list
-        }
 
         # Get zou parent id for correct hierarchy
         # Use parent substitutes if existing
@@ -233,14 +403,16 @@ def update_op_assets(
 
         if visual_parent_doc_id is None:
             # Find root folder doc ("Assets" or "Shots")
-            root_folder_doc = get_asset_by_name(
-                project_name,
-                asset_name=entity_root_asset_name,
-                fields=["_id", "data.root_of"],
-            )
-
-            if root_folder_doc:
-                visual_parent_doc_id = root_folder_doc["_id"]
+            if entity_root_asset_name not in root_folder_ids:
+                root_folder_doc = get_asset_by_name(
+                    project_name,
+                    asset_name=entity_root_asset_name,
+                    fields=["_id", "data.root_of"],
+                )
+                root_folder_ids[entity_root_asset_name] = (
+                    root_folder_doc["_id"] if root_folder_doc else None
+                )
+            visual_parent_doc_id = root_folder_ids[entity_root_asset_name]
 
         # Visual parent for hierarchy
         item_data["visualParent"] = visual_parent_doc_id
@@ -439,21 +611,15 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
 
     log.info(f"Synchronizing {project['name']}...")
 
-    # Get all assets from zou
-    all_assets = gazu.asset.all_assets_for_project(project)
-    all_asset_types = gazu.asset.all_asset_types_for_project(project)
-    all_episodes = gazu.shot.all_episodes_for_project(project)
-    all_seqs = gazu.shot.all_sequences_for_project(project)
-    all_shots = gazu.shot.all_shots_for_project(project)
+    # Get all entities and tasks from zou
+    project_data = fetch_kitsu_project_data(project)
     all_entities = [
         item
-        for item in all_assets
-        + all_asset_types
-        + all_episodes
-        + all_seqs
-        + all_shots
+        for key in ("assets", "asset_types", "episodes", "sequences", "shots")
+        for item in project_data[key]
         if naming_pattern.match(item["name"])
     ]
+    tasks_by_entity_id = get_full_tasks_by_entity_id(project, project_data)
 
     # Sync project. Create if doesn't exist
     project_name = project["name"]
@@ -471,16 +637,23 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     dbcon.Session["AVALON_PROJECT"] = project_name
 
     # Query all assets of the local project
+    asset_docs = list(get_assets(project_name))
     zou_ids_and_asset_docs = {
         asset_doc["data"]["zou"]["id"]: asset_doc
-        for asset_doc in get_assets(project_name)
+        for asset_doc in asset_docs
         if asset_doc["data"].get("zou", {}).get("id")
     }
     zou_ids_and_asset_docs[project["id"]] = project_dict
 
     # Create entities root folders
+    root_folder_ids = {
+        asset_doc["name"]: asset_doc["_id"]
+        for asset_doc in asset_docs
+        if asset_doc["name"] in ("Assets", "Shots")
+    }
     to_insert = [
         {
+            "_id": ObjectId(),
             "name": r,
             "type": "asset",
             "schema": "openpype:asset-3.0",
@@ -492,31 +665,21 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
             },
         }
         for r in ["Assets", "Shots"]
-        if not get_asset_by_name(
-            project_name, r, fields=["_id", "data.root_of"]
-        )
+        if r not in root_folder_ids
     ]
+    for asset_doc in to_insert:
+        root_folder_ids[asset_doc["name"]] = asset_doc["_id"]
 
     # Create
-    to_insert.extend(
-        [
-            create_op_asset(item)
-            for item in all_entities
-            if item["id"] not in zou_ids_and_asset_docs.keys()
-        ]
-    )
-    if to_insert:
-        # Insert doc in DB
-        dbcon.insert_many(to_insert)
+    for item in all_entities:
+        if item["id"] not in zou_ids_and_asset_docs:
+            asset_doc = create_op_asset(item)
+            asset_doc["_id"] = ObjectId()
+            to_insert.append(asset_doc)
+            zou_ids_and_asset_docs[item["id"]] = deepcopy(asset_doc)
 
-        # Update existing docs
-        zou_ids_and_asset_docs.update(
-            {
-                asset_doc["data"]["zou"]["id"]: asset_doc
-                for asset_doc in get_assets(project_name)
-                if asset_doc["data"].get("zou")
-            }
-        )
+    # New documents are inserted with the same bulk write before updates
+    bulk_writes.extend([InsertOne(asset_doc) for asset_doc in to_insert])
 
     # Update
     bulk_writes.extend(
@@ -528,6 +691,8 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
                 project_dict,
                 all_entities,
                 zou_ids_and_asset_docs,
+                tasks_by_entity_id,
+                root_folder_ids,
             )
         ]
     )
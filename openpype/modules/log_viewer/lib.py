@@ -0,0 +1,170 @@
+"""Queries of mongo logs used by Log Viewer.
+
+Processes are listed with aggregation grouped by 'process_id' so records are
+not transferred to client. Records of a process are queried only when are
+needed.
+"""
+import pymongo
+
+PROCESS_KEYS = (
+    "process_id",
+    "hostname",
+    "hostip",
+    "username",
+    "system_name",
+    "process_name",
+)
+LOG_KEYS = (
+    "timestamp",
+    "level",
+    "thread",
+    "threadName",
+    "message",
+    "loggerName",
+    "fileName",
+    "module",
+    "method",
+    "lineNumber",
+    "exception",
+)
+# Indexes used by process listing and by query of process records
+LOG_INDEXES = (
+    ("process_id_timestamp", [("process_id", 1), ("timestamp", 1)]),
+    ("timestamp", [("timestamp", 1)]),
+    ("username_timestamp", [("username", 1), ("timestamp", 1)]),
+    ("hostname_timestamp", [("hostname", 1), ("timestamp", 1)]),
+)
+
+
+def ensure_log_indexes(collection):
+    """Create indexes used by Log Viewer queries.
+
+    Existing indexes are kept untouched.
+
+    Args:
+        collection (pymongo.collection.Collection): Logs collection.
+    """
+    existing_names = set(collection.index_information().keys())
+    for name, keys in LOG_INDEXES:
+        if name not in existing_names:
+            collection.create_index(keys, name=name, background=True)
+
+
+def get_logs_filter(
+    started_from=None, started_to=None, usernames=None, hostnames=None
+):
+    """Query filter of log records.
+
+    Records without process id are skipped (backwards compatibility).
+
+    Args:
+        started_from (Optional[datetime.datetime]): Skip records created
+            before the time.
+        started_to (Optional[datetime.datetime]): Skip records created after
+            the time.
+        usernames (Optional[Iterable[str]]): Records of the users.
+        hostnames (Optional[Iterable[str]]): Records of the hosts.
+
+    Returns:
+        dict[str, Any]: Filter for mongo query.
+    """
+    query_filter = {"process_id": {"$nin": [None, ""]}}
+    timestamp_filter = {}
+    if started_from is not None:
+        timestamp_filter["$gte"] = started_from
+    if started_to is not None:
+        timestamp_filter["$lte"] = started_to
+    if timestamp_filter:
+        query_filter["timestamp"] = timestamp_filter
+
+    if usernames is not None:
+        query_filter["username"] = {"$in": list(usernames)}
+
+    if hostnames is not None:
+        query_filter["hostname"] = {"$in": list(hostnames)}
+    return query_filter
+
+
+def get_processes_pipeline(query_filter, skip=0, limit=None):
+    """Aggregation pipeline listing processes of log records.
+
+    Processes are sorted from the newest.
+
+    Args:
+        query_filter (dict[str, Any]): Filter of log records. Output of
+            'get_logs_filter'.
+        skip (int): Skip number of processes.
+        limit (Optional[int]): Maximum number of processes.
+
+    Returns:
+        list[dict[str, Any]]: Aggregation pipeline.
+    """
+    group_stage = {
+        "_id": "$process_id",
+        "started": {"$min": "$timestamp"},
+        "last_timestamp": {"$max": "$timestamp"},
+        "logs_count": {"$sum": 1},
+    }
+    for key in PROCESS_KEYS:
+        if key != "process_id":
+            group_stage[key] = {"$first": "${}".format(key)}
+
+    pipeline = [
+        {"$match": query_filter},
+        {"$group": group_stage},
+        {"$sort": {"started": pymongo.DESCENDING}},
+    ]
+    if skip:
+        pipeline.append({"$skip": skip})
+    if limit:
+        pipeline.append({"$limit": limit})
+    return pipeline
+
+
+def query_processes(collection, query_filter=None, skip=0, limit=None):
+    """Query processes of log records.
+
+    Args:
+        collection (pymongo.collection.Collection): Logs collection.
+        query_filter (Optional[dict[str, Any]]): Filter of log records. All
+            records with process id are used if not passed.
+        skip (int): Skip number of processes.
+        limit (Optional[int]): Maximum number of processes.
+
+    Returns:
+        list[dict[str, Any]]: Process information with 'started',
+            'last_timestamp' and 'logs_count'.
+    """
+    if query_filter is None:
+        query_filter = get_logs_filter()
+    pipeline = get_processes_pipeline(query_filter, skip, limit)
+    output = []
+    for process in collection.aggregate(pipeline, allowDiskUse=True):
+        process["process_id"] = process.pop("_id")
+        output.append(process)
+    return output
+
+
+def query_process_logs(collection, process_id, skip=0, limit=None):
+    """Query log records of a process sorted by time.
+
+    Args:
+        collection (pymongo.collection.Collection): Logs collection.
+        process_id (str): Id of process.
+        skip (int): Skip number of records.
+        limit (Optional[int]): Maximum number of records.
+
+    Returns:
+        list[dict[str, Any]]: Log records.
+    """
+    projection = {key: True for key in LOG_KEYS}
+    projection["_id"] = False
+    cursor = collection.find(
+        {"process_id": process_id},
+        projection
+    ).sort("timestamp", pymongo.ASCENDING)
+    if skip:
+        cursor = cursor.skip(skip)
+    if limit:
+        cursor = cursor.limit(limit)
+    return list(cursor)
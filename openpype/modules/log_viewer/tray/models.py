@@ -1,6 +1,11 @@
-import collections
 from qtpy import QtCore, QtGui
 from openpype.lib import Logger
+from openpype.modules.log_viewer.lib import (
+    ensure_log_indexes,
+    get_logs_filter,
+    query_processes,
+    query_process_logs,
+)
 
 
 class LogModel(QtGui.QStandardItemModel):
@@ -30,15 +35,19 @@ class LogModel(QtGui.QStandardItemModel):
         "fileName", "module", "method", "lineNumber"
     )
     default_value = "- Not set -"
+    # Number of processes queried at once
+    page_size = 500
 
-    ROLE_LOGS = QtCore.Qt.UserRole + 2
     ROLE_PROCESS_ID = QtCore.Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super(LogModel, self).__init__(parent)
 
-        self.log_by_process = None
         self.dbcon = None
+        self._query_filter = get_logs_filter()
+        self._logs_by_process_id = {}
+        self._processes_offset = 0
+        self._has_more_processes = False
 
         # Crash if connection is not possible to skip this module
         if not Logger.initialized:
@@ -49,6 +58,7 @@ class LogModel(QtGui.QStandardItemModel):
             Logger.bootstrap_mongo_log()
             database = connection[Logger.log_database_name]
             self.dbcon = database[Logger.log_collection_name]
+            ensure_log_indexes(self.dbcon)
 
     def headerData(self, section, orientation, role):
         if (
@@ -69,70 +79,84 @@ class LogModel(QtGui.QStandardItemModel):
             item = QtGui.QStandardItem(display_value)
             if first_item:
                 first_item = False
-                item.setData(process_logs["_logs"], self.ROLE_LOGS)
                 item.setData(process_logs["process_id"], self.ROLE_PROCESS_ID)
             items.append(item)
         self.appendRow(items)
 
+    def set_filters(
+        self, started_from=None, usernames=None, hostnames=None
+    ):
+        """Change filters applied on query of processes.
+
+        Filters are used on next refresh.
+        """
+        self._query_filter = get_logs_filter(
+            started_from=started_from,
+            usernames=usernames,
+            hostnames=hostnames
+        )
+
     def refresh(self):
-        self.log_by_process = collections.defaultdict(list)
-        self.process_info = {}
+        self._logs_by_process_id = {}
+        self._processes_offset = 0
+        self._has_more_processes = False
 
         self.clear()
         self.beginResetModel()
-        if self.dbcon:
-            result = self.dbcon.find({})
-            for item in result:
-                process_id = item.get("process_id")
-                # backwards (in)compatibility
-                if not process_id:
-                    continue
-
-                if process_id not in self.process_info:
-                    proc_dict = {"_logs": []}
-                    for key in self.process_keys:
-                        proc_dict[key] = (
-                            item.get(key) or self.default_value
-                        )
-                    self.process_info[process_id] = proc_dict
+        self._fetch_processes()
+        self.endResetModel()
 
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return self._has_more_processes
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            self._fetch_processes()
+
+    def _fetch_processes(self):
+        if not self.dbcon:
+            return
+
+        processes = query_processes(
+            self.dbcon,
+            self._query_filter,
+            skip=self._processes_offset,
+            limit=self.page_size
+        )
+        self._processes_offset += len(processes)
+        self._has_more_processes = len(processes) == self.page_size
+        for process in processes:
+            for key in self.process_keys:
+                if not process.get(key):
+                    process[key] = self.default_value
+            self.add_process_logs(process)
+
+    def get_process_logs(self, process_id):
+        """Log records of a process.
+
+        Records are queried on first request and cached until refresh.
+        """
+        if process_id in self._logs_by_process_id:
+            return self._logs_by_process_id[process_id]
+
+        logs = []
+        if self.dbcon:
+            for item in query_process_logs(self.dbcon, process_id):
                 log_item = {}
                 for key in self.log_keys:
                     log_item[key] = item.get(key) or self.default_value
 
                 if "exception" in item:
                     log_item["exception"] = item["exception"]
-
-                self.process_info[process_id]["_logs"].append(log_item)
-
-        for item in self.process_info.values():
-            item["_logs"] = sorted(
-                item["_logs"], key=lambda item: item["timestamp"]
-            )
-            item["started"] = item["_logs"][0]["timestamp"]
-            self.add_process_logs(item)
-
-        self.endResetModel()
+                logs.append(log_item)
+        self._logs_by_process_id[process_id] = logs
+        return logs
 
 
 class LogsFilterProxy(QtCore.QSortFilterProxyModel):
-    def __init__(self, *args, **kwargs):
-        super(LogsFilterProxy, self).__init__(*args, **kwargs)
-        self.col_usernames = None
-        self.filter_usernames = set()
-
-    def update_users_filter(self, users):
-        self.filter_usernames = set()
-        for user in users or tuple():
-            self.filter_usernames.add(user)
-        self.invalidateFilter()
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        if self.col_usernames is not None:
-            index = self.sourceModel().index(
-                source_row, self.col_usernames, source_parent
-            )
-            user = index.data(QtCore.Qt.DisplayRole)
-            if user not in self.filter_usernames:
-                return False
-        return True
+    """Sort proxy of processes.
+
+    Processes are filtered by query of 'LogModel'.
+    """
@@ -1,4 +1,5 @@
 import html
+import datetime
 from qtpy import QtCore, QtWidgets
 import qtawesome
 from .models import LogModel, LogsFilterProxy
@@ -107,25 +108,41 @@ class CustomCombo(QtWidgets.QWidget):
 class LogsWidget(QtWidgets.QWidget):
     """A widget that lists the published subsets for an asset"""
 
+    # Label and number of days of time range filter
+    time_ranges = (
+        ("Last 24 hours", 1),
+        ("Last 7 days", 7),
+        ("Last 30 days", 30),
+        ("All", None),
+    )
+
     def __init__(self, detail_widget, parent=None):
         super(LogsWidget, self).__init__(parent=parent)
 
         model = LogModel()
         proxy_model = LogsFilterProxy()
         proxy_model.setSourceModel(model)
-        proxy_model.col_usernames = model.COLUMNS.index("username")
 
         filter_layout = QtWidgets.QHBoxLayout()
 
-        user_filter = CustomCombo("Users", self)
-        users = model.dbcon.distinct("username")
-        user_filter.populate(users)
-        user_filter.selection_changed.connect(self._user_changed)
+        time_range_filter = QtWidgets.QComboBox(self)
+        for label, days in self.time_ranges:
+            time_range_filter.addItem(label, days)
+        time_range_filter.setCurrentIndex(1)
+        time_range_filter.currentIndexChanged.connect(self._filters_changed)
 
-        proxy_model.update_users_filter(users)
+        user_filter = CustomCombo("Users", self)
+        host_filter = CustomCombo("Hosts", self)
+        if model.dbcon:
+            user_filter.populate(model.dbcon.distinct("username"))
+            host_filter.populate(model.dbcon.distinct("hostname"))
+        user_filter.selection_changed.connect(self._filters_changed)
+        host_filter.selection_changed.connect(self._filters_changed)
 
         level_filter = CustomCombo("Levels", self)
-        levels = model.dbcon.distinct("level")
+        levels = []
+        if model.dbcon:
+            levels = model.dbcon.distinct("level")
         level_filter.addItems(levels)
         level_filter.selection_changed.connect(self._level_changed)
 
@@ -134,7 +151,9 @@ class LogsWidget(QtWidgets.QWidget):
         icon = qtawesome.icon("fa.refresh", color="white")
         refresh_btn = QtWidgets.QPushButton(icon, "")
 
+        filter_layout.addWidget(time_range_filter)
         filter_layout.addWidget(user_filter)
+        filter_layout.addWidget(host_filter)
         filter_layout.addWidget(level_filter)
         filter_layout.addStretch(1)
         filter_layout.addWidget(refresh_btn)
@@ -169,7 +188,9 @@ class LogsWidget(QtWidgets.QWidget):
         self.proxy_model = proxy_model
         self.view = view
 
+        self.time_range_filter = time_range_filter
         self.user_filter = user_filter
+        self.host_filter = host_filter
         self.level_filter = level_filter
 
         self.detail_widget = detail_widget
@@ -181,6 +202,8 @@ class LogsWidget(QtWidgets.QWidget):
         self._refresh_triggered_timer.start()
 
     def _on_refresh_timeout(self):
+        # Time range is relative to time of refresh
+        self._update_model_filters()
         self.model.refresh()
         self.detail_widget.refresh()
 
@@ -189,24 +212,45 @@ class LogsWidget(QtWidgets.QWidget):
 
     def _on_index_change(self, to_index, from_index):
         index = self._selected_log()
+        logs = []
         if index:
-            logs = index.data(self.model.ROLE_LOGS)
-        else:
-            logs = []
+            process_id = index.data(self.model.ROLE_PROCESS_ID)
+            if process_id:
+                logs = self.model.get_process_logs(process_id)
         self.detail_widget.set_detail(logs)
 
-    def _user_changed(self):
+    def _get_checked_values(self, combo):
         checked_values = set()
-        for action in self.user_filter.items():
+        for action in combo.items():
             if action.isChecked():
                 checked_values.add(action.text())
-        self.proxy_model.update_users_filter(checked_values)
+        return checked_values
+
+    def _get_query_values(self, combo):
+        """Checked values or 'None' if all values are checked."""
+        checked_values = self._get_checked_values(combo)
+        if all(action.isChecked() for action in combo.items()):
+            return None
+        return checked_values
+
+    def _update_model_filters(self):
+        started_from = None
+        days = self.time_range_filter.currentData()
+        if days:
+            started_from = (
+                datetime.datetime.now() - datetime.timedelta(days=days)
+            )
+        self.model.set_filters(
+            started_from=started_from,
+            usernames=self._get_query_values(self.user_filter),
+            hostnames=self._get_query_values(self.host_filter)
+        )
+
+    def _filters_changed(self):
+        self.refresh()
 
     def _level_changed(self):
-        checked_values = set()
-        for action in self.level_filter.items():
-            if action.isChecked():
-                checked_values.add(action.text())
+        checked_values = self._get_checked_values(self.level_filter)
         self.detail_widget.update_level_filter(checked_values)
 
     def on_context_menu(self, point):
@@ -73,17 +73,23 @@ class BaseAnatomy(object):
     def __getitem__(self, key):
         return copy.deepcopy(self._data[key])
 
+    # - only requested values are copied
     def get(self, key, default=None):
-        return copy.deepcopy(self._data).get(key, default)
+        if key not in self._data:
+            return default
+        return copy.deepcopy(self._data[key])
 
     def keys(self):
-        return copy.deepcopy(self._data).keys()
+        return list(self._data.keys())
 
     def values(self):
-        return copy.deepcopy(self._data).values()
+        return [copy.deepcopy(value) for value in self._data.values()]
 
     def items(self):
-        return copy.deepcopy(self._data).items()
+        return [
+            (key, copy.deepcopy(value))
+            for key, value in self._data.items()
+        ]
 
     def _prepare_anatomy_data(self, project_doc, root_overrides):
         """Prepare anatomy data for further processing.
@@ -634,7 +640,8 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            # Shallow copy is enough as data are only read
+            data = dict(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
@@ -986,7 +993,20 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        """Format templates with data.
+
+        Templates are solved lazily on first access of their keys using
+        read-only snapshot of data.
+
+        Args:
+            data (dict[str, Any]): Formatting data.
+            strict (bool): Raise exception on access of unsolved template.
+
+        Returns:
+            TemplatesResultDict: Lazily solved templates.
+        """
+        # Shallow copy to add roots without modifying passed data
+        copy_data = dict(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
@@ -34,6 +34,15 @@ from .utils import (
     loaders_from_representation,
     filter_repre_contexts_by_loader,
 
+    REPRESENTATION_STATUS_LATEST,
+    REPRESENTATION_STATUS_OUTDATED,
+    REPRESENTATION_STATUS_NOT_FOUND,
+    RepresentationsStatusCache,
+    get_representations_status_cache,
+    invalidate_representations_status_cache,
+    get_representations_status,
+    get_representations_path,
+
     any_outdated_containers,
     get_outdated_containers,
     filter_containers,
@@ -88,6 +97,15 @@ __all__ = (
     "loaders_from_representation",
     "filter_repre_contexts_by_loader",
 
+    "REPRESENTATION_STATUS_LATEST",
+    "REPRESENTATION_STATUS_OUTDATED",
+    "REPRESENTATION_STATUS_NOT_FOUND",
+    "RepresentationsStatusCache",
+    "get_representations_status_cache",
+    "invalidate_representations_status_cache",
+    "get_representations_status",
+    "get_representations_path",
+
     "any_outdated_containers",
     "get_outdated_containers",
     "filter_containers",
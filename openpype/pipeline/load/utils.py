@@ -4,9 +4,12 @@ import copy
 import getpass
 import logging
 import inspect
+import threading
 import collections
 import numbers
 
+import pyblish.api
+
 from openpype.host import ILoadHost
 from openpype.client import (
     get_project,
@@ -21,11 +24,13 @@ from openpype.client import (
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_parents,
 )
 from openpype.lib import (
     StringTemplate,
     TemplateUnsolved,
+    register_event_callback,
 )
 from openpype.pipeline import (
     legacy_io,
@@ -39,6 +44,10 @@ ContainersFilterResult = collections.namedtuple(
     ["latest", "outdated", "not_found", "invalid"]
 )
 
+REPRESENTATION_STATUS_LATEST = "latest"
+REPRESENTATION_STATUS_OUTDATED = "outdated"
+REPRESENTATION_STATUS_NOT_FOUND = "not_found"
+
 
 class HeroVersionType(object):
     def __init__(self, version):
@@ -611,6 +620,121 @@ def get_representation_path_with_anatomy(repre_doc, anatomy):
     return path.normalized()
 
 
+def _get_path_from_repre_template(representation, root):
+    try:
+        template = representation["data"]["template"]
+    except KeyError:
+        return None
+
+    try:
+        context = representation["context"]
+        context["root"] = root
+        path = StringTemplate.format_strict_template(
+            template, context
+        )
+        # Force replacing backslashes with forward slashed if not on
+        #   windows
+        if platform.system().lower() != "windows":
+            path = path.replace("\\", "/")
+    except (TemplateUnsolved, KeyError):
+        # Template references unavailable data
+        return None
+
+    if not path:
+        return path
+
+    normalized_path = os.path.normpath(path)
+    if os.path.exists(normalized_path):
+        return normalized_path
+    return path
+
+
+def _get_path_from_project_config(representation, parents, root, session):
+    version_, subset, asset, project = parents
+    try:
+        template = project["config"]["template"]["publish"]
+    except KeyError:
+        log.debug(
+            "No template in project %s, "
+            "likely a bug" % project["name"]
+        )
+        return None
+
+    # default list() in get would not discover missing parents on asset
+    parents = asset.get("data", {}).get("parents")
+    if parents is not None:
+        hierarchy = "/".join(parents)
+
+    # Cannot fail, required members only
+    data = {
+        "root": root,
+        "project": {
+            "name": project["name"],
+            "code": project.get("data", {}).get("code")
+        },
+        "asset": asset["name"],
+        "hierarchy": hierarchy,
+        "subset": subset["name"],
+        "version": version_["name"],
+        "representation": representation["name"],
+        "family": representation.get("context", {}).get("family"),
+        "user": session.get("AVALON_USER", getpass.getuser()),
+        "app": session.get("AVALON_APP", ""),
+        "task": session.get("AVALON_TASK", "")
+    }
+
+    try:
+        template_obj = StringTemplate(template)
+        path = str(template_obj.format(data))
+        # Force replacing backslashes with forward slashed if not on
+        #   windows
+        if platform.system().lower() != "windows":
+            path = path.replace("\\", "/")
+
+    except KeyError as e:
+        log.debug("Template references unavailable data: %s" % e)
+        return None
+
+    normalized_path = os.path.normpath(path)
+    if os.path.exists(normalized_path):
+        return normalized_path
+    return path
+
+
+def _get_path_from_repre_data(representation):
+    if "path" not in representation["data"]:
+        return None
+
+    path = representation["data"]["path"]
+    # Force replacing backslashes with forward slashed if not on
+    #   windows
+    if platform.system().lower() != "windows":
+        path = path.replace("\\", "/")
+
+    if os.path.exists(path):
+        return os.path.normpath(path)
+
+    dir_path, file_name = os.path.split(path)
+    if not os.path.exists(dir_path):
+        return
+
+    base_name, ext = os.path.splitext(file_name)
+    file_name_items = None
+    if "#" in base_name:
+        file_name_items = [part for part in base_name.split("#") if part]
+    elif "%" in base_name:
+        file_name_items = base_name.split("%")
+
+    if not file_name_items:
+        return
+
+    filename_start = file_name_items[0]
+
+    for _file in os.listdir(dir_path):
+        if _file.startswith(filename_start) and _file.endswith(ext):
+            return os.path.normpath(path)
+
+
 def get_representation_path(representation, root=None, dbcon=None):
     """Get filename from representation document
 
@@ -637,38 +761,10 @@ def get_representation_path(representation, root=None, dbcon=None):
 
         root = registered_root()
 
-    def path_from_representation():
-        try:
-            template = representation["data"]["template"]
-        except KeyError:
-            return None
-
-        try:
-            context = representation["context"]
-            context["root"] = root
-            path = StringTemplate.format_strict_template(
-                template, context
-            )
-            # Force replacing backslashes with forward slashed if not on
-            #   windows
-            if platform.system().lower() != "windows":
-                path = path.replace("\\", "/")
-        except (TemplateUnsolved, KeyError):
-            # Template references unavailable data
-            return None
-
-        if not path:
-            return path
-
-        normalized_path = os.path.normpath(path)
-        if os.path.exists(normalized_path):
-            return normalized_path
-        return path
-
     def path_from_config():
         try:
             project_name = dbcon.active_project()
-            version_, subset, asset, project = get_representation_parents(
+            parents = get_representation_parents(
                 project_name, representation
             )
         except ValueError:
@@ -678,92 +774,14 @@ def get_representation_path(representation, root=None, dbcon=None):
             )
             return None
 
-        try:
-            template = project["config"]["template"]["publish"]
-        except KeyError:
-            log.debug(
-                "No template in project %s, "
-                "likely a bug" % project["name"]
-            )
-            return None
-
-        # default list() in get would not discover missing parents on asset
-        parents = asset.get("data", {}).get("parents")
-        if parents is not None:
-            hierarchy = "/".join(parents)
-
-        # Cannot fail, required members only
-        data = {
-            "root": root,
-            "project": {
-                "name": project["name"],
-                "code": project.get("data", {}).get("code")
-            },
-            "asset": asset["name"],
-            "hierarchy": hierarchy,
-            "subset": subset["name"],
-            "version": version_["name"],
-            "representation": representation["name"],
-            "family": representation.get("context", {}).get("family"),
-            "user": dbcon.Session.get("AVALON_USER", getpass.getuser()),
-            "app": dbcon.Session.get("AVALON_APP", ""),
-            "task": dbcon.Session.get("AVALON_TASK", "")
-        }
-
-        try:
-            template_obj = StringTemplate(template)
-            path = str(template_obj.format(data))
-            # Force replacing backslashes with forward slashed if not on
-            #   windows
-            if platform.system().lower() != "windows":
-                path = path.replace("\\", "/")
-
-        except KeyError as e:
-            log.debug("Template references unavailable data: %s" % e)
-            return None
-
-        normalized_path = os.path.normpath(path)
-        if os.path.exists(normalized_path):
-            return normalized_path
-        return path
-
-    def path_from_data():
-        if "path" not in representation["data"]:
-            return None
-
-        path = representation["data"]["path"]
-        # Force replacing backslashes with forward slashed if not on
-        #   windows
-        if platform.system().lower() != "windows":
-            path = path.replace("\\", "/")
-
-        if os.path.exists(path):
-            return os.path.normpath(path)
-
-        dir_path, file_name = os.path.split(path)
-        if not os.path.exists(dir_path):
-            return
-
-        base_name, ext = os.path.splitext(file_name)
-        file_name_items = None
-        if "#" in base_name:
-            file_name_items = [part for part in base_name.split("#") if part]
-        elif "%" in base_name:
-            file_name_items = base_name.split("%")
-
-        if not file_name_items:
-            return
-
-        filename_start = file_name_items[0]
-
-        for _file in os.listdir(dir_path):
-            if _file.startswith(filename_start) and _file.endswith(ext):
-                return os.path.normpath(path)
+        return _get_path_from_project_config(
+            representation, parents, root, dbcon.Session
+        )
 
     return (
-        path_from_representation() or
+        _get_path_from_repre_template(representation, root) or
         path_from_config() or
-        path_from_data()
+        _get_path_from_repre_data(representation)
     )
 
 
@@ -815,6 +833,247 @@ def loaders_from_representation(loaders, representation):
     return loaders_from_repre_context(loaders, context)
 
 
+class RepresentationsStatusCache(object):
+    """Status and paths of representations loaded in scene.
+
+    Status of any number of representations is resolved with fixed number of
+    queries. Paths are resolved only when requested and parents of
+    representations are queried only for representations which don't have
+    path template.
+
+    Results are cached until the cache is invalidated. Cache is invalidated
+    when publishing finished and when workfile is opened or created, or
+    context task changed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses_by_project = collections.defaultdict(dict)
+        self._repre_docs_by_project = collections.defaultdict(dict)
+        self._paths_by_project = collections.defaultdict(dict)
+
+    def invalidate(self, project_name=None):
+        with self._lock:
+            if project_name is None:
+                self._statuses_by_project.clear()
+                self._repre_docs_by_project.clear()
+                self._paths_by_project.clear()
+                return
+            self._statuses_by_project.pop(project_name, None)
+            self._repre_docs_by_project.pop(project_name, None)
+            self._paths_by_project.pop(project_name, None)
+
+    def get_statuses(self, project_name, representation_ids):
+        """Status of representations.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+                representations.
+
+        Returns:
+            dict[str, str]: Status by stringified representation id.
+        """
+        repre_ids = {str(repre_id) for repre_id in representation_ids}
+        with self._lock:
+            statuses = self._statuses_by_project[project_name]
+            missing_ids = repre_ids - set(statuses.keys())
+            if missing_ids:
+                self._query_statuses(project_name, missing_ids)
+            return {repre_id: statuses[repre_id] for repre_id in repre_ids}
+
+    def get_paths(self, project_name, representation_ids):
+        """Paths of representations.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+                representations.
+
+        Returns:
+            dict[str, Union[str, None]]: Path by stringified representation
+                id. Path is 'None' when could not be resolved.
+        """
+        repre_ids = {str(repre_id) for repre_id in representation_ids}
+        self.get_statuses(project_name, repre_ids)
+        with self._lock:
+            paths = self._paths_by_project[project_name]
+            missing_ids = repre_ids - set(paths.keys())
+            if missing_ids:
+                self._resolve_paths(project_name, missing_ids)
+            return {repre_id: paths[repre_id] for repre_id in repre_ids}
+
+    def _query_statuses(self, project_name, repre_ids):
+        statuses = self._statuses_by_project[project_name]
+        repre_docs_by_id = self._repre_docs_by_project[project_name]
+        for repre_id in repre_ids:
+            statuses[repre_id] = REPRESENTATION_STATUS_NOT_FOUND
+            repre_docs_by_id[repre_id] = None
+
+        repre_docs = get_representations(
+            project_name,
+            representation_ids=repre_ids,
+            fields=["_id", "parent", "name", "context", "data"]
+        )
+        repre_ids_by_version_id = collections.defaultdict(list)
+        for repre_doc in repre_docs:
+            repre_id = str(repre_doc["_id"])
+            repre_docs_by_id[repre_id] = repre_doc
+            repre_ids_by_version_id[repre_doc["parent"]].append(repre_id)
+
+        if not repre_ids_by_version_id:
+            return
+
+        version_docs = get_versions(
+            project_name,
+            version_ids=repre_ids_by_version_id.keys(),
+            hero=True,
+            fields=["_id", "parent", "type"]
+        )
+        version_ids_by_subset_id = collections.defaultdict(set)
+        for version_doc in version_docs:
+            version_id = version_doc["_id"]
+            # Hero versions are considered as latest
+            if version_doc["type"] == "hero_version":
+                for repre_id in repre_ids_by_version_id[version_id]:
+                    statuses[repre_id] = REPRESENTATION_STATUS_LATEST
+                continue
+            version_ids_by_subset_id[version_doc["parent"]].add(version_id)
+
+        last_versions = get_last_versions(
+            project_name,
+            subset_ids=version_ids_by_subset_id.keys(),
+            fields=["_id"]
+        )
+        for subset_id, version_ids in version_ids_by_subset_id.items():
+            last_version_doc = last_versions.get(subset_id)
+            last_version_id = None
+            if last_version_doc:
+                last_version_id = last_version_doc["_id"]
+            for version_id in version_ids:
+                status = REPRESENTATION_STATUS_LATEST
+                if (
+                    last_version_id is not None
+                    and version_id != last_version_id
+                ):
+                    status = REPRESENTATION_STATUS_OUTDATED
+                for repre_id in repre_ids_by_version_id[version_id]:
+                    statuses[repre_id] = status
+
+    def _get_root(self, project_name):
+        if project_name == legacy_io.active_project():
+            from openpype.pipeline import registered_root
+
+            return registered_root()
+        return Anatomy(project_name).roots
+
+    def _resolve_paths(self, project_name, repre_ids):
+        paths = self._paths_by_project[project_name]
+        repre_docs_by_id = self._repre_docs_by_project[project_name]
+        root = self._get_root(project_name)
+        # Representations without path from template
+        unresolved_docs = []
+        for repre_id in repre_ids:
+            repre_doc = repre_docs_by_id.get(repre_id)
+            path = None
+            if repre_doc is not None:
+                path = _get_path_from_repre_template(repre_doc, root)
+                if not path:
+                    unresolved_docs.append(repre_doc)
+            paths[repre_id] = path
+
+        if not unresolved_docs:
+            return
+
+        parents_by_repre_id = get_representations_parents(
+            project_name, unresolved_docs
+        )
+        for repre_doc in unresolved_docs:
+            path = None
+            parents = parents_by_repre_id.get(repre_doc["_id"])
+            if parents and all(parents):
+                path = _get_path_from_project_config(
+                    repre_doc, parents, root, legacy_io.Session
+                )
+            paths[str(repre_doc["_id"])] = (
+                path or _get_path_from_repre_data(repre_doc)
+            )
+
+
+_REPRESENTATIONS_STATUS_CACHE = None
+
+
+def _invalidate_on_event(*args, **kwargs):
+    invalidate_representations_status_cache()
+
+
+def get_representations_status_cache():
+    """Representations status cache shared in current process.
+
+    Cache is created on first call and callbacks which invalidate the cache
+    are registered.
+
+    Returns:
+        RepresentationsStatusCache: Shared cache object.
+    """
+    global _REPRESENTATIONS_STATUS_CACHE
+    if _REPRESENTATIONS_STATUS_CACHE is None:
+        _REPRESENTATIONS_STATUS_CACHE = RepresentationsStatusCache()
+        pyblish.api.register_callback("published", _invalidate_on_event)
+        for topic in ("open", "new", "taskChanged"):
+            register_event_callback(topic, _invalidate_on_event)
+    return _REPRESENTATIONS_STATUS_CACHE
+
+
+def invalidate_representations_status_cache(project_name=None):
+    """Invalidate cached status and paths of representations.
+
+    Args:
+        project_name (Optional[str]): Invalidate only representations of
+            the project.
+    """
+    if _REPRESENTATIONS_STATUS_CACHE is not None:
+        _REPRESENTATIONS_STATUS_CACHE.invalidate(project_name)
+
+
+def get_representations_status(project_name, representation_ids):
+    """Status of representations based on their versions.
+
+    Status is one of 'latest', 'outdated' or 'not_found'. Hero versions are
+    considered as latest.
+
+    Args:
+        project_name (str): Project name.
+        representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+            representations.
+
+    Returns:
+        dict[str, str]: Status by stringified representation id.
+    """
+    return get_representations_status_cache().get_statuses(
+        project_name, representation_ids
+    )
+
+
+def get_representations_path(project_name, representation_ids):
+    """Paths of representations resolved in batch.
+
+    Paths are resolved in the same way as in 'get_representation_path'.
+
+    Args:
+        project_name (str): Project name.
+        representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+            representations.
+
+    Returns:
+        dict[str, Union[str, None]]: Path by stringified representation
+            id.
+    """
+    return get_representations_status_cache().get_paths(
+        project_name, representation_ids
+    )
+
+
 def any_outdated_containers(host=None, project_name=None):
     """Check if there are any outdated containers in scene."""
 
@@ -880,7 +1139,6 @@ def filter_containers(containers, project_name):
         not_found_containers,
         invalid_containers
     )
-    # Query representation docs to get it's version ids
     repre_ids = {
         container["representation"]
         for container in containers
@@ -891,59 +1149,7 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
-
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
-
-    # Based on all collected data figure out which containers are outdated
-    #   - log out if there are missing representation or version documents
+    statuses = get_representations_status(project_name, repre_ids)
     for container in containers:
         container_name = container["objectName"]
         repre_id = container["representation"]
@@ -951,23 +1157,14 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
-            log.debug((
-                "Container '{}' has an invalid representation."
-                " It is missing in the database."
-            ).format(container_name))
-            not_found_containers.append(container)
-            continue
-
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
+        status = statuses[str(repre_id)]
+        if status == REPRESENTATION_STATUS_OUTDATED:
             outdated_containers.append(container)
 
-        elif version_id not in verisons_by_id:
+        elif status == REPRESENTATION_STATUS_NOT_FOUND:
             log.debug((
-                "Representation on container '{}' has an invalid version."
-                " It is missing in the database."
+                "Container '{}' has an invalid representation."
+                " Representation or its version is missing in the database."
             ).format(container_name))
             not_found_containers.append(container)
 
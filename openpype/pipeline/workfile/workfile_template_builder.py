@@ -49,6 +49,21 @@ from openpype.pipeline.create import (
     CreateContext,
 )
 
+# Maximum number of representation queries running at the same time while
+#   load placeholders are prepared
+MAX_QUERY_WORKERS = 8
+# Placeholder data keys defining representations query of load placeholder
+LOAD_QUERY_KEYS = (
+    "builder_type",
+    "asset",
+    "subset",
+    "hierarchy",
+    "folder_path",
+    "product_name",
+    "family",
+    "representation",
+)
+
 
 class TemplateNotFound(Exception):
     """Exception raised when template does not exist."""
@@ -620,6 +635,10 @@ class AbstractTemplateBuilder(object):
         for identifier, placeholders in placeholders_by_plugin_id.items():
             plugin = plugins_by_identifier[identifier]
             plugin.prepare_placeholders(placeholders)
+            # Query representations of all load placeholders before
+            #   any of them is populated
+            if isinstance(plugin, PlaceholderLoadMixin):
+                plugin.prepare_load_placeholders(placeholders)
 
     def populate_scene_placeholders(
         self, level_limit=None, keep_placeholders=None
@@ -685,6 +704,8 @@ class AbstractTemplateBuilder(object):
 
                 filtered_placeholders.append(placeholder)
 
+            # Placeholders collected in previous loop are appended
+            filtered_placeholders.sort(key=lambda i: i.order)
             self._prepare_placeholders(filtered_placeholders)
 
             for placeholder in filtered_placeholders:
@@ -1683,6 +1704,147 @@ class PlaceholderLoadMixin(object):
                 output.extend(version_mapping[last_version])
         return output
 
+    def _get_representations_query_key(self, placeholder):
+        """Key of representations query defined by placeholder data.
+
+        Placeholders with the same key are loading the same representations.
+        """
+
+        return tuple(
+            str(placeholder.data.get(key))
+            for key in LOAD_QUERY_KEYS
+        )
+
+    def _query_placeholders_representations(self, placeholders_by_query_key):
+        """Query representations of placeholders concurrently.
+
+        Each unique query is made only once. Queries are made one after
+        another if 'concurrent.futures' is not available.
+
+        Args:
+            placeholders_by_query_key (Dict[tuple, List[PlaceholderItem]]):
+                Placeholders by their query key.
+
+        Returns:
+            Dict[tuple, Union[List[Dict[str, Any]], Exception]]:
+                Representation documents by query key or exception if
+                query failed.
+        """
+
+        # Builder properties are cached on first access so they're resolved
+        #   before the queries run in threads
+        self.builder.current_asset_doc
+        if any(
+            placeholder.data.get("builder_type") == "linked_asset"
+            for placeholders in placeholders_by_query_key.values()
+            for placeholder in placeholders
+        ):
+            self.builder.linked_asset_docs
+
+        def _query(placeholder):
+            try:
+                return self._get_representations(placeholder)
+            except Exception as exc:
+                # Error is raised on populate of placeholder
+                return exc
+
+        query_keys = list(placeholders_by_query_key.keys())
+        first_placeholders = [
+            placeholders_by_query_key[query_key][0]
+            for query_key in query_keys
+        ]
+        try:
+            # 'concurrent.futures' is not available in python 2 hosts
+            from concurrent.futures import ThreadPoolExecutor
+        except ImportError:
+            ThreadPoolExecutor = None
+
+        if len(query_keys) == 1 or ThreadPoolExecutor is None:
+            results = [
+                _query(placeholder)
+                for placeholder in first_placeholders
+            ]
+        else:
+            max_workers = min(MAX_QUERY_WORKERS, len(query_keys))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_query, first_placeholders))
+        return dict(zip(query_keys, results))
+
+    def prepare_load_placeholders(self, placeholders):
+        """Prepare load of placeholders before any of them is populated.
+
+        Representations of all placeholders are queried at once, placeholders
+        with the same filters share the query and load contexts of all
+        representations are received with single batch of queries. Loader of
+        placeholder is resolved only once.
+
+        Prepared data are used by 'populate_load_placeholder' and are
+        cleared with shared populate data.
+
+        Args:
+            placeholders (List[PlaceholderItem]): Placeholders that will be
+                populated.
+        """
+
+        placeholders_by_query_key = collections.defaultdict(list)
+        for placeholder in placeholders:
+            query_key = self._get_representations_query_key(placeholder)
+            placeholders_by_query_key[query_key].append(placeholder)
+
+        if not placeholders_by_query_key:
+            return
+
+        repre_docs_by_query_key = self._query_placeholders_representations(
+            placeholders_by_query_key
+        )
+
+        errors_by_query_key = {}
+        repre_docs_by_id = {}
+        for query_key, repre_docs in tuple(repre_docs_by_query_key.items()):
+            if isinstance(repre_docs, Exception):
+                errors_by_query_key[query_key] = repre_docs
+                repre_docs = []
+            repre_docs = self._reduce_last_version_repre_docs(repre_docs)
+            repre_docs_by_query_key[query_key] = repre_docs
+            for repre_doc in repre_docs:
+                repre_docs_by_id[repre_doc["_id"]] = repre_doc
+
+        repre_load_contexts = get_contexts_for_repre_docs(
+            self.project_name, list(repre_docs_by_id.values())
+        )
+        loaders_by_name = self.builder.get_loaders_by_name()
+
+        load_plans = self.get_plugin_shared_populate_data("load_plans")
+        if load_plans is None:
+            load_plans = {}
+            self.set_plugin_shared_populate_data("load_plans", load_plans)
+
+        for query_key, placeholders in placeholders_by_query_key.items():
+            contexts = [
+                repre_load_contexts[repre_doc["_id"]]
+                for repre_doc in repre_docs_by_query_key[query_key]
+                if repre_doc["_id"] in repre_load_contexts
+            ]
+            for placeholder in placeholders:
+                load_plans[placeholder.scene_identifier] = {
+                    "error": errors_by_query_key.get(query_key),
+                    "loader": loaders_by_name.get(
+                        placeholder.data["loader"]
+                    ),
+                    "repre_load_contexts": contexts,
+                }
+
+    def _get_load_plan(self, placeholder):
+        load_plans = self.get_plugin_shared_populate_data("load_plans")
+        if (
+            load_plans is None
+            or placeholder.scene_identifier not in load_plans
+        ):
+            # Placeholder was not prepared by builder
+            self.prepare_load_placeholders([placeholder])
+            load_plans = self.get_plugin_shared_populate_data("load_plans")
+        return load_plans[placeholder.scene_identifier]
+
     def populate_load_placeholder(self, placeholder, ignore_repre_ids=None):
         """Load placeholder is going to load matching representations.
 
@@ -1704,36 +1866,37 @@ class PlaceholderLoadMixin(object):
         if ignore_repre_ids is None:
             ignore_repre_ids = set()
 
-        # TODO check loader existence
         loader_name = placeholder.data["loader"]
         loader_args = self.parse_loader_args(placeholder.data["loader_args"])
 
-        placeholder_representations = self._get_representations(placeholder)
+        load_plan = self._get_load_plan(placeholder)
+        if load_plan["error"] is not None:
+            raise load_plan["error"]
 
-        filtered_representations = []
-        for representation in self._reduce_last_version_repre_docs(
-            placeholder_representations
-        ):
-            repre_id = str(representation["_id"])
+        repre_load_contexts = []
+        for repre_load_context in load_plan["repre_load_contexts"]:
+            repre_id = str(repre_load_context["representation"]["_id"])
             if repre_id not in ignore_repre_ids:
-                filtered_representations.append(representation)
+                repre_load_contexts.append(repre_load_context)
 
-        if not filtered_representations:
+        if not repre_load_contexts:
             self.log.info((
                 "There's no representation for this placeholder: {}"
             ).format(placeholder.scene_identifier))
             return
 
-        repre_load_contexts = get_contexts_for_repre_docs(
-            self.project_name, filtered_representations
-        )
-        loaders_by_name = self.builder.get_loaders_by_name()
+        loader = load_plan["loader"]
+        if loader is None:
+            self.log.warning((
+                "Loader '{}' of placeholder {} is not available."
+            ).format(loader_name, placeholder.scene_identifier))
+
         self._before_placeholder_load(
             placeholder
         )
 
         failed = False
-        for repre_load_context in repre_load_contexts.values():
+        for repre_load_context in repre_load_contexts:
             representation = repre_load_context["representation"]
             repre_context = representation["context"]
             self._before_repre_load(
@@ -1748,9 +1911,14 @@ class PlaceholderLoadMixin(object):
                     placeholder.data["loader_args"],
                 )
             )
+            if loader is None:
+                self.load_failed(placeholder, representation)
+                failed = True
+                continue
+
             try:
                 container = load_with_repre_context(
-                    loaders_by_name[loader_name],
+                    loader,
                     repre_load_context,
                     options=loader_args
                 )
@@ -676,17 +676,24 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
-            for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
-
-                dst = path_template_obj.format_strict(template_data)
-                src = os.path.join(stagingdir, src_file_name)
-                transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
+            # Solve template only once and fill only 'originalBasename'
+            #   for each file
+            basenames = [
+                os.path.splitext(src_file_name)[0]
+                for src_file_name in files
+            ]
+            template_data["originalBasename"] = basenames[0]
+            compiled_template = path_template_obj.compile_strict(
+                template_data, dynamic_keys=["originalBasename"]
+            )
+            repre_context = compiled_template.result.used_values
+            dst_filepaths = compiled_template.fill_sequence(
+                "originalBasename", basenames
+            )
+            transfers = [
+                (os.path.join(stagingdir, src_file_name), dst)
+                for src_file_name, dst in zip(files, dst_filepaths)
+            ]
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -735,22 +742,21 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            # - template is solved only once with first index and only
+            #   the index is filled for each destination file
+            index_key = "udim" if is_udim else "frame"
+            template_data[index_key] = destination_indexes[0]
+            compiled_template = path_template_obj.compile_strict(
+                template_data, dynamic_keys=[index_key]
+            )
+            template_filled = compiled_template.result
+            self.log.debug(
+                "Template filled: {}".format(str(template_filled))
+            )
+            repre_context = template_filled.used_values
+            dst_filepaths = compiled_template.fill_sequence(
+                index_key, destination_indexes, destination_padding
+            )
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -758,10 +764,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_udim:
                 repre_context["frame"] = first_index_padded
 
-            # Update the destination indexes and padding
-            dst_collection = clique.assemble(dst_filepaths)[0][0]
-            dst_collection.padding = destination_padding
-            if len(src_collection.indexes) != len(dst_collection.indexes):
+            if len(src_collection.indexes) != len(set(dst_filepaths)):
                 raise KnownPublishError((
                     "This is a bug. Source sequence frames length"
                     " does not match integration frames length"
@@ -769,7 +772,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             # Multiple file transfers
             transfers = []
-            for src_file_name, dst in zip(src_collection, dst_collection):
+            for src_file_name, dst in zip(src_collection, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
 
@@ -898,6 +901,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if key in instance.data:
                 version_data[key] = instance.data[key]
 
+        # Store source hashes also as list of entries which can be indexed
+        #   and queried for multiple hashes at once
+        source_hashes = instance.data.get("sourceHashes")
+        if source_hashes:
+            version_data["sourceHashEntries"] = [
+                {"hash": texture_hash, "path": path}
+                for texture_hash, path in source_hashes.items()
+            ]
+
         # Include instance.data[versionData] directly
         version_data_instance = instance.data.get("versionData")
         if version_data_instance:
@@ -309,3 +309,21 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def create_project_indexes(self, project_name=None):
+        from openpype.client import get_projects
+        from openpype.client.operations import create_project_indexes
+
+        if project_name:
+            project_names = [project_name]
+        else:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for name in project_names:
+            print(">>> Creating indexes of project \"{}\"".format(name))
+            create_project_indexes(name)
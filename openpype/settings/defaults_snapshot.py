@@ -0,0 +1,174 @@
+"""Precompiled snapshot of default settings.
+
+Default settings are stored in many json files which are parsed on each
+process start. Snapshot stores loaded defaults in a single binary file
+created at build time. Snapshot is memory mapped and unmarshalled at once.
+
+Snapshot is used only if it matches the json sources. Sources are validated
+by modification times and if any source is newer than the snapshot, digest
+of sources content is compared with digest stored in the snapshot.
+
+Snapshot file layout:
+- magic bytes
+- format version (1 byte)
+- digest of json sources (20 bytes)
+- marshalled data
+"""
+import os
+import mmap
+import marshal
+import hashlib
+import logging
+import tempfile
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"OPDEFS"
+SNAPSHOT_FORMAT_VERSION = 1
+# Marshal format version 4 is readable by all Python 3 versions
+MARSHAL_VERSION = 4
+_DIGEST_SIZE = hashlib.sha1().digest_size
+_HEADER_SIZE = len(SNAPSHOT_MAGIC) + 1 + _DIGEST_SIZE
+
+
+def _get_source_paths(sources_dir):
+    """Json source files and directories.
+
+    Returns:
+        tuple[list[str], list[str]]: Sorted relative paths of json files
+            and full paths of directories.
+    """
+    filepaths = []
+    dirpaths = []
+    base_len = len(sources_dir) + 1
+    for base, _directories, filenames in os.walk(sources_dir):
+        dirpaths.append(base)
+        for filename in filenames:
+            if filename.endswith(".json"):
+                filepaths.append(os.path.join(base, filename)[base_len:])
+    filepaths.sort()
+    return filepaths, dirpaths
+
+
+def get_sources_digest(sources_dir):
+    """Digest of json files content and their relative paths.
+
+    Args:
+        sources_dir (str): Directory with json files.
+
+    Returns:
+        bytes: Digest of sources.
+    """
+    sources_dir = os.path.normpath(sources_dir)
+    filepaths, _ = _get_source_paths(sources_dir)
+    hasher = hashlib.sha1()
+    for filepath in filepaths:
+        # Use the same separator on all platforms
+        hasher.update(filepath.replace("\\", "/").encode("utf-8"))
+        with open(os.path.join(sources_dir, filepath), "rb") as stream:
+            hasher.update(stream.read())
+    return hasher.digest()
+
+
+def _sources_are_newer(sources_dir, snapshot_path):
+    snapshot_mtime = os.path.getmtime(snapshot_path)
+    filepaths, dirpaths = _get_source_paths(sources_dir)
+    # Directories are changed when a file is added or removed
+    for path in dirpaths:
+        if os.path.getmtime(path) > snapshot_mtime:
+            return True
+
+    for filepath in filepaths:
+        path = os.path.join(sources_dir, filepath)
+        if os.path.getmtime(path) > snapshot_mtime:
+            return True
+    return False
+
+
+def load_snapshot(snapshot_path, sources_dir):
+    """Load data from snapshot if it matches json sources.
+
+    Args:
+        snapshot_path (str): Path to snapshot file.
+        sources_dir (str): Directory with json files used to create the
+            snapshot.
+
+    Returns:
+        Union[dict[str, Any], None]: Snapshot data or 'None' if snapshot is
+            not available or does not match sources.
+    """
+    sources_dir = os.path.normpath(sources_dir)
+    if not os.path.isfile(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as stream:
+            with mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                return _load_mapped_snapshot(
+                    mapped, snapshot_path, sources_dir
+                )
+
+    except Exception:
+        # JSON sources are used as fallback
+        log.debug(
+            "Failed to load defaults snapshot \"{}\"".format(snapshot_path),
+            exc_info=True
+        )
+    return None
+
+
+def _load_mapped_snapshot(mapped, snapshot_path, sources_dir):
+    magic_size = len(SNAPSHOT_MAGIC)
+    if (
+        len(mapped) < _HEADER_SIZE
+        or mapped[:magic_size] != SNAPSHOT_MAGIC
+        or mapped[magic_size] != SNAPSHOT_FORMAT_VERSION
+    ):
+        return None
+
+    if _sources_are_newer(sources_dir, snapshot_path):
+        digest = mapped[magic_size + 1:_HEADER_SIZE]
+        if digest != get_sources_digest(sources_dir):
+            log.debug("Defaults snapshot is outdated.")
+            return None
+
+    # Views must be released before the map is closed
+    view = memoryview(mapped)
+    data_view = view[_HEADER_SIZE:]
+    try:
+        return marshal.loads(data_view)
+    finally:
+        data_view.release()
+        view.release()
+
+
+def save_snapshot(snapshot_path, sources_dir, data):
+    """Store data loaded from json sources to snapshot file.
+
+    File is replaced atomically so running processes never read partially
+    written snapshot.
+
+    Args:
+        snapshot_path (str): Path to snapshot file.
+        sources_dir (str): Directory with json files used to load the data.
+        data (dict[str, Any]): Loaded data.
+    """
+    content = b"".join((
+        SNAPSHOT_MAGIC,
+        bytes(bytearray([SNAPSHOT_FORMAT_VERSION])),
+        get_sources_digest(sources_dir),
+        marshal.dumps(data, MARSHAL_VERSION),
+    ))
+    dirpath = os.path.dirname(os.path.abspath(snapshot_path))
+    fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(content)
+        os.replace(tmp_path, snapshot_path)
+
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -532,6 +532,30 @@ class SettingsHandler(object):
 
         pass
 
+    def get_system_settings_stamp(self):
+        """Stamp of studio overrides used to resolve system settings.
+
+        Stamp changes when any of overrides change. Resolved settings can be
+        cached until the stamp changes.
+
+        Returns:
+            Union[Hashable, None]: Stamp or None if handler can't tell when
+                overrides changed.
+        """
+        return None
+
+    def get_project_settings_stamp(self, project_name):
+        """Stamp of overrides used to resolve project settings.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+
+        Returns:
+            Union[Hashable, None]: Stamp or None if handler can't tell when
+                overrides changed.
+        """
+        return None
+
 
 @six.add_metaclass(ABCMeta)
 class LocalSettingsHandler:
@@ -554,6 +578,15 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    def get_local_settings_stamp(self):
+        """Stamp of local settings which changes when local settings change.
+
+        Returns:
+            Union[Hashable, None]: Stamp or None if handler can't tell when
+                local settings changed.
+        """
+        return None
+
 
 class CacheValues:
     cache_lifetime = 10
@@ -563,14 +596,25 @@ class CacheValues:
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        # Increased each time data are changed
+        self.revision = 0
+
+    @property
+    def stamp(self):
+        return self.version, self.revision
 
     def data_copy(self):
         if not self.data:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data, version):
+    def _set_data(self, data):
+        if data != self.data:
+            self.revision += 1
         self.data = data
+
+    def update_data(self, data, version):
+        self._set_data(data)
         self.creation_time = datetime.datetime.now()
         self.version = version
 
@@ -587,7 +631,7 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
+        self._set_data(data)
         self.version = version
 
     def to_json_string(self):
@@ -1346,6 +1390,18 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
+        self._update_system_settings_cache()
+        cache = self.system_settings_cache
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def get_system_settings_stamp(self):
+        self._update_system_settings_cache()
+        return self.system_settings_cache.stamp
+
+    def _update_system_settings_cache(self):
         if self.system_settings_cache.is_outdated:
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
@@ -1364,12 +1420,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.system_settings_cache
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_system_settings_overrides_doc(self):
         document = (
             self._get_studio_system_settings_overrides_for_version()
@@ -1394,6 +1444,23 @@ class MongoSettingsHandler(SettingsHandler):
         return self.system_settings_cache.last_saved_info.copy()
 
     def _get_project_settings_overrides(self, project_name, return_version):
+        self._update_project_settings_cache(project_name)
+        cache = self.project_settings_cache[project_name]
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def get_project_settings_stamp(self, project_name):
+        self._update_project_settings_cache(None)
+        studio_stamp = self.project_settings_cache[None].stamp
+        if not project_name:
+            return studio_stamp, None
+
+        self._update_project_settings_cache(project_name)
+        return studio_stamp, self.project_settings_cache[project_name].stamp
+
+    def _update_project_settings_cache(self, project_name):
         if self.project_settings_cache[project_name].is_outdated:
             document, version = self._get_project_settings_overrides_doc(
                 project_name
@@ -1408,12 +1475,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.project_settings_cache[project_name]
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_project_settings_overrides_doc(self, project_name):
         document = self._get_project_settings_overrides_for_version(
             project_name
@@ -1852,6 +1913,14 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
     def get_local_settings(self):
         """Local settings for local site id."""
+        self._update_local_settings_cache()
+        return self.local_settings_cache.data_copy()
+
+    def get_local_settings_stamp(self):
+        self._update_local_settings_cache()
+        return self.local_settings_cache.stamp
+
+    def _update_local_settings_cache(self):
         if self.local_settings_cache.is_outdated:
             document = self.collection.find_one({
                 "type": LOCAL_SETTING_KEY,
@@ -1859,5 +1928,3 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             })
 
             self.local_settings_cache.update_from_document(document, None)
-
-        return self.local_settings_cache.data_copy()
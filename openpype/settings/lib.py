@@ -4,6 +4,7 @@ import functools
 import logging
 import platform
 import copy
+import types
 
 from openpype import AYON_SERVER_ENABLED
 
@@ -25,6 +26,10 @@ from .ayon_settings import (
     get_ayon_project_settings,
     get_ayon_system_settings
 )
+from .defaults_snapshot import (
+    load_snapshot,
+    save_snapshot,
+)
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +42,11 @@ DEFAULTS_DIR = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     "defaults"
 )
+# Precompiled snapshot of default settings created at build time
+DEFAULTS_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "defaults_snapshot.bin"
+)
 
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
@@ -47,6 +57,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cache of resolved settings by settings type and arguments
+_RESOLVED_SETTINGS_CACHE = {}
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -531,14 +544,42 @@ def get_local_settings():
 
 
 def load_openpype_default_settings():
-    """Load openpype default settings."""
-    return load_jsons_from_dir(DEFAULTS_DIR)
+    """Load openpype default settings.
+
+    Precompiled snapshot is used if is available and matches json files.
+    """
+    defaults = load_snapshot(DEFAULTS_SNAPSHOT_PATH, DEFAULTS_DIR)
+    if defaults is None:
+        defaults = load_jsons_from_dir(DEFAULTS_DIR)
+    return defaults
+
+
+def create_default_settings_snapshot(snapshot_path=None):
+    """Create precompiled snapshot of openpype default settings.
+
+    Should be called at build time. Defaults of addons are not part of
+    the snapshot as they depend on available addons.
+
+    Args:
+        snapshot_path (Optional[str]): Output path. Snapshot next to
+            defaults directory is created if not passed.
+
+    Returns:
+        str: Path to created snapshot.
+    """
+    if snapshot_path is None:
+        snapshot_path = DEFAULTS_SNAPSHOT_PATH
+    save_snapshot(
+        snapshot_path, DEFAULTS_DIR, load_jsons_from_dir(DEFAULTS_DIR)
+    )
+    return snapshot_path
 
 
 def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    reset_resolved_settings_cache()
 
 
 def _get_default_settings():
@@ -922,7 +963,175 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
+class ResolvedSettingsItem(object):
+    """Resolved settings cached for a stamp of their sources.
+
+    Args:
+        stamp (Hashable): Stamp of sources used to resolve settings.
+        data (dict[str, Any]): Resolved settings. Must not be modified.
+    """
+
+    def __init__(self, stamp, data):
+        self.stamp = stamp
+        self.data = data
+        self._view = None
+
+    @property
+    def view(self):
+        """Immutable view of resolved settings.
+
+        Returns:
+            types.MappingProxyType: Read-only settings.
+        """
+        if self._view is None:
+            self._view = freeze_settings(self.data)
+        return self._view
+
+
+def freeze_settings(value):
+    """Convert settings to read-only structure.
+
+    Dictionaries are converted to 'MappingProxyType' and lists to tuples.
+
+    Args:
+        value (Any): Settings value.
+
+    Returns:
+        Any: Read-only settings value.
+    """
+    if isinstance(value, dict):
+        return types.MappingProxyType({
+            key: freeze_settings(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(freeze_settings(item) for item in value)
+    return value
+
+
+def _copy_settings(value):
+    """Deep copy of settings data.
+
+    Faster than 'copy.deepcopy' as settings contain only json
+    serializable values.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _copy_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_settings(item) for item in value]
+    return value
+
+
+def reset_resolved_settings_cache():
+    """Clear process cache of resolved settings."""
+    _RESOLVED_SETTINGS_CACHE.clear()
+
+
+@require_handler
+def _get_system_settings_stamp():
+    return _SETTINGS_HANDLER.get_system_settings_stamp()
+
+
+@require_handler
+def _get_project_settings_stamp(project_name):
+    return _SETTINGS_HANDLER.get_project_settings_stamp(project_name)
+
+
+@require_local_handler
+def _get_local_settings_stamp():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_stamp()
+
+
+def _get_resolved_settings(cache_key, stamp, resolve_func):
+    """Get resolved settings from cache or resolve them.
+
+    Args:
+        cache_key (tuple): Key of settings in cache.
+        stamp (Union[Hashable, None]): Stamp of sources used to resolve
+            settings. Settings are not cached if is 'None'.
+        resolve_func (Callable[[], dict]): Function resolving settings.
+
+    Returns:
+        ResolvedSettingsItem: Resolved settings.
+    """
+    if stamp is None:
+        return ResolvedSettingsItem(None, resolve_func())
+
+    item = _RESOLVED_SETTINGS_CACHE.get(cache_key)
+    if item is None or item.stamp != stamp:
+        item = ResolvedSettingsItem(stamp, resolve_func())
+        _RESOLVED_SETTINGS_CACHE[cache_key] = item
+    return item
+
+
+def _get_settings_stamp(studio_stamp, exclude_locals):
+    if studio_stamp is None:
+        return None
+
+    if exclude_locals:
+        return studio_stamp, None
+
+    local_stamp = _get_local_settings_stamp()
+    if local_stamp is None:
+        return None
+    return studio_stamp, local_stamp
+
+
+def _get_resolved_system_settings(clear_metadata=True, exclude_locals=None):
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    stamp = _get_settings_stamp(_get_system_settings_stamp(), exclude_locals)
+    return _get_resolved_settings(
+        (SYSTEM_SETTINGS_KEY, clear_metadata, exclude_locals),
+        stamp,
+        functools.partial(
+            _resolve_system_settings, clear_metadata, exclude_locals
+        )
+    )
+
+
+def _get_resolved_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    if not project_name:
+        raise ValueError(
+            "Must enter project name."
+            " Call `get_default_project_settings` to get project defaults."
+        )
+
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    stamp = _get_settings_stamp(
+        _get_project_settings_stamp(project_name), exclude_locals
+    )
+    return _get_resolved_settings(
+        (PROJECT_SETTINGS_KEY, project_name, clear_metadata, exclude_locals),
+        stamp,
+        functools.partial(
+            _resolve_project_settings,
+            project_name,
+            clear_metadata,
+            exclude_locals
+        )
+    )
+
+
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
+    """System settings with applied studio overrides.
+
+    Resolved settings are cached until studio overrides or local settings
+    change, output is a copy which can be modified.
+    """
+    item = _get_resolved_system_settings(clear_metadata, exclude_locals)
+    return _copy_settings(item.data)
+
+
+def _resolve_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
@@ -1027,13 +1236,21 @@ def get_anatomy_settings(
 def _get_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
-    """Project settings with applied studio and project overrides."""
-    if not project_name:
-        raise ValueError(
-            "Must enter project name."
-            " Call `get_default_project_settings` to get project defaults."
-        )
+    """Project settings with applied studio and project overrides.
 
+    Resolved settings are cached until studio overrides, project overrides
+    or local settings change, output is a copy which can be modified.
+    """
+    item = _get_resolved_project_settings(
+        project_name, clear_metadata, exclude_locals
+    )
+    return _copy_settings(item.data)
+
+
+def _resolve_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    """Project settings with applied studio and project overrides."""
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
@@ -1142,3 +1359,36 @@ def get_project_settings(project_name, *args, **kwargs):
 
     default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
     return get_ayon_project_settings(default_settings, project_name)
+
+
+def get_system_settings_view(*args, **kwargs):
+    """Read-only system settings.
+
+    View is shared with other callers so it is not copied on each call.
+    Use 'get_system_settings' to get settings which can be modified.
+
+    Returns:
+        types.MappingProxyType: Read-only system settings.
+    """
+    if not AYON_SERVER_ENABLED:
+        return _get_resolved_system_settings(*args, **kwargs).view
+    return freeze_settings(get_system_settings(*args, **kwargs))
+
+
+def get_project_settings_view(project_name, *args, **kwargs):
+    """Read-only project settings.
+
+    View is shared with other callers so it is not copied on each call.
+    Use 'get_project_settings' to get settings which can be modified.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        types.MappingProxyType: Read-only project settings.
+    """
+    if not AYON_SERVER_ENABLED:
+        return _get_resolved_project_settings(
+            project_name, *args, **kwargs
+        ).view
+    return freeze_settings(get_project_settings(project_name))
@@ -2511,6 +2511,8 @@ class PublisherController(BasePublisherController):
         # Cleanup of publishing process
         self.publish_has_finished = True
         self.publish_progress = self.publish_max_progress
+        # Same signal as emitted by 'pyblish.util.publish'
+        pyblish.api.emit("published", context=self._publish_context)
         yield MainThreadItem(self.stop_publish)
 
     def _add_validation_error(self, result):
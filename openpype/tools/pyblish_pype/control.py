@@ -313,6 +313,7 @@ class Controller(QtCore.QObject):
         self._current_state = (
             "Published" if not self.errored else "Published, with errors"
         )
+        pyblish.api.emit("published", context=self.context)
         self.was_finished.emit()
         self._main_thread_processor.stop()
 
@@ -8,11 +8,11 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
+    get_assets,
+    get_subsets,
+    get_versions,
+    get_last_versions,
+    get_representations,
 )
 from openpype.pipeline import (
     get_current_project_name,
@@ -334,50 +334,26 @@ class InventoryModel(TreeModel):
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
+        entities_by_repre_id = self._query_entities(
+            project_name, grouped.keys()
+        )
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
-            # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
-            )
-            if not representation:
-                not_found["representation"].extend(group_items)
-                not_found_ids.append(repre_id)
-                continue
-
-            version = get_version_by_id(
-                project_name, representation["parent"]
+            entities = entities_by_repre_id[repre_id]
+            missing = next(
+                (
+                    key
+                    for key in ("representation", "version", "subset", "asset")
+                    if not entities[key]
+                ),
+                None
             )
-            if not version:
-                not_found["version"].extend(group_items)
-                not_found_ids.append(repre_id)
-                continue
-
-            elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
-                version["name"] = HeroVersionType(_version["name"])
-                version["data"] = _version["data"]
-
-            subset = get_subset_by_id(project_name, version["parent"])
-            if not subset:
-                not_found["subset"].extend(group_items)
-                not_found_ids.append(repre_id)
-                continue
-
-            asset = get_asset_by_id(project_name, subset["parent"])
-            if not asset:
-                not_found["asset"].extend(group_items)
+            if missing:
+                not_found[missing].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            grouped[repre_id].update({
-                "representation": representation,
-                "version": version,
-                "subset": subset,
-                "asset": asset
-            })
+            grouped[repre_id].update(entities)
 
         for id in not_found_ids:
             grouped.pop(id)
@@ -427,9 +403,7 @@ class InventoryModel(TreeModel):
 
             # Store the highest available version so the model can know
             # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
+            highest_version = grouped[repre_id]["highest_version"]
 
             # create the group header
             group_node = Item()
@@ -476,6 +450,128 @@ class InventoryModel(TreeModel):
 
         return self._root_item
 
+    def _query_entities(self, project_name, repre_ids):
+        """Query parents of representations with constant number of queries.
+
+        Args:
+            project_name (str): Project name.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, dict[str, Union[dict[str, Any], None]]]: Representation,
+                version, subset, asset and highest version documents by
+                representation id. Value of entity is 'None' if was not found
+                and all following entities are 'None' too.
+        """
+
+        output = {
+            repre_id: {
+                "representation": None,
+                "version": None,
+                "subset": None,
+                "asset": None,
+                "highest_version": None,
+            }
+            for repre_id in repre_ids
+        }
+        if not output:
+            return output
+
+        repre_docs_by_id = {
+            str(repre_doc["_id"]): repre_doc
+            for repre_doc in get_representations(
+                project_name,
+                representation_ids=output.keys(),
+                archived=True
+            )
+        }
+        version_docs_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in get_versions(
+                project_name,
+                version_ids={
+                    repre_doc["parent"]
+                    for repre_doc in repre_docs_by_id.values()
+                },
+                hero=True
+            )
+        }
+        # Hero versions are showing name and data of source version
+        hero_version_docs = [
+            version_doc
+            for version_doc in version_docs_by_id.values()
+            if version_doc["type"] == "hero_version"
+        ]
+        if hero_version_docs:
+            src_version_docs_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name,
+                    version_ids={
+                        version_doc["version_id"]
+                        for version_doc in hero_version_docs
+                    },
+                    fields=["name", "data"]
+                )
+            }
+            for version_doc in hero_version_docs:
+                src_version_doc = src_version_docs_by_id.get(
+                    version_doc["version_id"]
+                )
+                if src_version_doc is None:
+                    version_docs_by_id.pop(version_doc["_id"])
+                    continue
+                version_doc["name"] = HeroVersionType(
+                    src_version_doc["name"]
+                )
+                version_doc["data"] = src_version_doc["data"]
+
+        subset_ids = {
+            version_doc["parent"]
+            for version_doc in version_docs_by_id.values()
+        }
+        subset_docs_by_id = {
+            subset_doc["_id"]: subset_doc
+            for subset_doc in get_subsets(project_name, subset_ids=subset_ids)
+        }
+        asset_docs_by_id = {
+            asset_doc["_id"]: asset_doc
+            for asset_doc in get_assets(
+                project_name,
+                asset_ids={
+                    subset_doc["parent"]
+                    for subset_doc in subset_docs_by_id.values()
+                }
+            )
+        }
+        last_versions_by_subset_id = get_last_versions(
+            project_name,
+            subset_docs_by_id.keys(),
+            fields=["_id", "parent", "name"]
+        )
+
+        for repre_id, entities in output.items():
+            repre_doc = repre_docs_by_id.get(str(repre_id))
+            if not repre_doc:
+                continue
+            entities["representation"] = repre_doc
+
+            version_doc = version_docs_by_id.get(repre_doc["parent"])
+            if not version_doc:
+                continue
+            entities["version"] = version_doc
+
+            subset_doc = subset_docs_by_id.get(version_doc["parent"])
+            if not subset_doc:
+                continue
+            entities["subset"] = subset_doc
+            entities["highest_version"] = last_versions_by_subset_id.get(
+                subset_doc["_id"]
+            )
+
+            entities["asset"] = asset_docs_by_id.get(subset_doc["parent"])
+        return output
+
 
 class FilterProxyModel(QtCore.QSortFilterProxyModel):
     """Filter model to where key column's value is in the filtered tags"""
@@ -12,6 +12,7 @@ from openpype.client import (
     get_hero_versions,
     get_representation_by_id,
     get_representations,
+    entity_cache,
 )
 from openpype import style
 from openpype.pipeline import (
@@ -845,13 +846,27 @@ class SceneInventoryView(QtWidgets.QTreeView):
             versions = itertools.repeat(version)
 
         # Trigger update to latest
+        project_name = legacy_io.active_project()
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
-                    self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+            with entity_cache() as cache:
+                # Representations of all containers are queried at once
+                #   when the first container is updated
+                if cache is not None:
+                    for item in items:
+                        cache.load(
+                            project_name,
+                            "representation",
+                            item["representation"]
+                        )
+
+                for item, item_version in zip(items, versions):
+                    try:
+                        update_container(item, item_version)
+                    except AssertionError:
+                        self._show_version_error_dialog(
+                            item_version, [item]
+                        )
+                        log.warning("Update failed", exc_info=True)
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
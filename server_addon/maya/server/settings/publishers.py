@@ -356,6 +356,12 @@ class ExtractLookArgsModel(BaseSettingsModel):
 
 
 class ExtractLookModel(BaseSettingsModel):
+    max_concurrent_conversions: int = SettingsField(
+        0,
+        ge=0,
+        le=256,
+        title="Max concurrent texture conversions (0 = CPU count)"
+    )
     maketx_arguments: list[ExtractLookArgsModel] = SettingsField(
         default_factory=list,
         title="Extra arguments for maketx command line"
@@ -1344,6 +1350,7 @@ DEFAULT_PUBLISH_SETTINGS = {
         "ogsfx_path": "/maya2glTF/PBR/shaders/glTF_PBR.ogsfx"
     },
     "ExtractLook": {
+        "max_concurrent_conversions": 0,
         "maketx_arguments": []
     },
     "ExtractGPUCache": {
@@ -57,10 +57,19 @@ def validate_thirdparty_binaries():
             raise RuntimeError(error_msg.format("OpenImageIO"))
 
 
+def create_settings_defaults_snapshot():
+    """Precompile default settings so they're not parsed on each start."""
+    from openpype.settings.lib import create_default_settings_snapshot
+
+    create_default_settings_snapshot()
+
+
 # Give ability to skip vaidation
 if not os.getenv("SKIP_THIRD_PARTY_VALIDATION"):
     validate_thirdparty_binaries()
 
+create_settings_defaults_snapshot()
+
 version = {}
 
 with open(openpype_root / "openpype" / "version.py") as fp:
@@ -100,6 +100,7 @@ import platform
 import traceback
 import subprocess
 import site
+import importlib.util
 import distutils.spawn
 from pathlib import Path
 
@@ -263,6 +264,25 @@ if "--use-staging" in sys.argv:
     sys.argv.remove("--use-staging")
     os.environ["OPENPYPE_USE_STAGING"] = "1"
 
+# Profile imports when "--import-profile" is passed, path to report can be
+#   passed with "--import-profile=<path>"
+for _arg in tuple(sys.argv):
+    if _arg == "--import-profile" or _arg.startswith("--import-profile="):
+        sys.argv.remove(_arg)
+        _, _, import_profile_path = _arg.partition("=")
+        # Profiler is imported from file to not import OpenPype package
+        #   before version is resolved
+        _profiler_spec = importlib.util.spec_from_file_location(
+            "openpype_import_profiler",
+            os.path.join(
+                OPENPYPE_ROOT, "openpype", "lib", "import_profiler.py"
+            )
+        )
+        import_profiler = importlib.util.module_from_spec(_profiler_spec)
+        _profiler_spec.loader.exec_module(import_profiler)
+        import_profiler.start_import_profiler(import_profile_path)
+        break
+
 import igniter  # noqa: E402
 from igniter import BootstrapRepos  # noqa: E402
 from igniter.tools import (
@@ -0,0 +1,163 @@
+"""Local fake of Deadline Web Service for offline tests.
+
+Implements small subset of Deadline REST api which is used by OpenPype:
+    - GET /api/jobs?JobID=<comma separated ids>
+    - POST /api/jobs
+    - GET /api/pools
+
+Example:
+    >>> with FakeDeadlineWebService() as webservice:
+    ...     client = DeadlineClient(webservice.url)
+    ...     client.get_jobs(["job_id"])
+"""
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class _FakeDeadlineHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections are supported only with HTTP/1.1
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self, method):
+        webservice = self.server.webservice
+        parsed = urlparse(self.path)
+        body = None
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = json.loads(self.rfile.read(length).decode("utf-8"))
+
+        status, data = webservice.handle_request(
+            method,
+            parsed.path,
+            parse_qs(parsed.query),
+            body,
+            self.client_address
+        )
+        self._send_json(status, data)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+
+class FakeDeadlineWebService(object):
+    """Fake Deadline Web Service running in a thread on localhost.
+
+    Attributes:
+        jobs (dict[str, dict]): Stored jobs by id.
+        pools (list[str]): Pool names.
+        requests (list[dict]): Log of received requests.
+        failures (list[int]): Status codes returned for next requests
+            instead of processing them.
+    """
+
+    def __init__(self, pools=None):
+        self.jobs = {}
+        self.pools = list(pools or ["none"])
+        self.requests = []
+        self.failures = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    @property
+    def client_addresses(self):
+        """Addresses of clients used for requests.
+
+        Each new connection has a different port so number of addresses
+        is number of opened connections.
+        """
+        return {request["client_address"] for request in self.requests}
+
+    def add_job(self, job_id=None, frames="1-10", **props):
+        """Add job to fake server.
+
+        Returns:
+            str: Job id.
+        """
+        if job_id is None:
+            job_id = uuid.uuid4().hex
+        job_props = {"Frames": frames}
+        job_props.update(props)
+        with self._lock:
+            self.jobs[job_id] = {"_id": job_id, "Props": job_props}
+        return job_id
+
+    def handle_request(self, method, path, query, body, client_address):
+        with self._lock:
+            self.requests.append({
+                "method": method,
+                "path": path,
+                "query": query,
+                "body": body,
+                "client_address": client_address,
+            })
+            if self.failures:
+                return self.failures.pop(0), {"error": "Fake failure"}
+
+            if path == "/api/jobs" and method == "GET":
+                job_ids = []
+                for value in query.get("JobID", []):
+                    job_ids.extend(value.split(","))
+                return 200, [
+                    self.jobs[job_id]
+                    for job_id in job_ids
+                    if job_id in self.jobs
+                ]
+
+            if path == "/api/jobs" and method == "POST":
+                job_id = uuid.uuid4().hex
+                job_info = body.get("JobInfo") or {}
+                props = {"Frames": job_info.get("Frames")}
+                job = {"_id": job_id, "Props": props, "Payload": body}
+                self.jobs[job_id] = job
+                return 200, job
+
+            if path == "/api/pools" and method == "GET":
+                return 200, list(self.pools)
+
+        return 404, {"error": "Unknown endpoint {}".format(path)}
+
+    def start(self):
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _FakeDeadlineHandler
+        )
+        self._server.daemon_threads = True
+        self._server.webservice = self
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
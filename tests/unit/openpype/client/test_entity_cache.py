@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Test scoped entity cache.
+
+Project collection is replaced by in-memory fake so tests are running
+without database.
+"""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities, entity_cache as cache_module
+from openpype.client.mongo.entity_cache import (
+    entity_cache,
+    get_active_entity_cache,
+    invalidate_entity_cache,
+)
+
+PROJECT_NAME = "test_project"
+
+
+def _match_value(value, condition):
+    if isinstance(condition, dict) and "$in" in condition:
+        return value in condition["$in"]
+    return value == condition
+
+
+def _match(doc, query_filter):
+    for key, condition in query_filter.items():
+        if key == "$or":
+            if not any(_match(doc, item) for item in condition):
+                return False
+        elif not _match_value(doc.get(key), condition):
+            return False
+    return True
+
+
+class FakeCollection(object):
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query_filter, projection=None):
+        self.queries.append(query_filter)
+        return [doc for doc in self.docs if _match(doc, query_filter)]
+
+    def find_one(self, query_filter, projection=None):
+        docs = self.find(query_filter, projection)
+        if docs:
+            return docs[0]
+        return None
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    docs = [{"_id": ObjectId(), "type": "project", "name": PROJECT_NAME}]
+    for idx in range(10):
+        docs.append({
+            "_id": ObjectId(),
+            "type": "asset",
+            "name": "asset{}".format(idx),
+        })
+    collection = FakeCollection(docs)
+
+    def _get_project_connection(project_name):
+        return collection
+
+    monkeypatch.setattr(
+        entities, "get_project_connection", _get_project_connection
+    )
+    monkeypatch.setattr(
+        cache_module, "get_project_connection", _get_project_connection
+    )
+    return collection
+
+
+def _asset_docs(collection):
+    return [doc for doc in collection.docs if doc["type"] == "asset"]
+
+
+def test_getters_use_cache(collection):
+    asset_doc = _asset_docs(collection)[0]
+    with entity_cache():
+        for _ in range(3):
+            assert entities.get_project(PROJECT_NAME)["name"] == PROJECT_NAME
+            assert entities.get_asset_by_id(
+                PROJECT_NAME, str(asset_doc["_id"])
+            ) == asset_doc
+            assert entities.get_asset_by_name(
+                PROJECT_NAME, asset_doc["name"]
+            ) == asset_doc
+        assert entities.get_asset_by_name(PROJECT_NAME, "missing") is None
+        assert entities.get_asset_by_name(PROJECT_NAME, "missing") is None
+        # Asset found by id is found by name too
+        assert len(collection.queries) == 3
+
+        # Queries with fields are not cached
+        entities.get_asset_by_id(
+            PROJECT_NAME, asset_doc["_id"], fields=["name"]
+        )
+        assert len(collection.queries) == 4
+
+    assert get_active_entity_cache() is None
+    entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+    assert len(collection.queries) == 5
+
+
+def test_batched_loading(collection):
+    asset_docs = _asset_docs(collection)
+    with entity_cache() as cache:
+        handles = [
+            cache.load(PROJECT_NAME, "asset", asset_doc["_id"])
+            for asset_doc in asset_docs
+        ]
+        handles.append(cache.load_by_name(PROJECT_NAME, "asset", "asset0"))
+        docs = [handle.get() for handle in handles]
+
+    assert docs == asset_docs + [asset_docs[0]]
+    assert len(collection.queries) == 1
+
+
+def test_queued_lookups_resolved_by_getter(collection):
+    asset_docs = _asset_docs(collection)
+    with entity_cache() as cache:
+        for asset_doc in asset_docs:
+            cache.load(PROJECT_NAME, "asset", str(asset_doc["_id"]))
+
+        docs = [
+            entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+            for asset_doc in asset_docs
+        ]
+
+    assert docs == asset_docs
+    assert len(collection.queries) == 1
+
+
+def test_cached_documents_are_copies(collection):
+    asset_doc = _asset_docs(collection)[0]
+    with entity_cache() as cache:
+        cached_doc = entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert cached_doc == asset_doc
+        assert cached_doc is not asset_doc
+        cached_doc["name"] = "modified"
+
+        handle = cache.load(PROJECT_NAME, "asset", asset_doc["_id"])
+        assert handle.get()["name"] == asset_doc["name"]
+
+        project_doc = entities.get_project(PROJECT_NAME)
+        project_doc["name"] = "modified"
+        assert entities.get_project(PROJECT_NAME)["name"] == PROJECT_NAME
+
+    assert len(collection.queries) == 2
+
+
+def test_invalidation(collection):
+    asset_doc = _asset_docs(collection)[0]
+    with entity_cache():
+        entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        with entity_cache():
+            entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert len(collection.queries) == 1
+
+        invalidate_entity_cache("other_project")
+        entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert len(collection.queries) == 1
+
+        invalidate_entity_cache(PROJECT_NAME)
+        entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert len(collection.queries) == 2
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Test mongo query instrumentation.
+
+Pymongo command events are simulated so tests are running without database.
+"""
+import itertools
+
+import pytest
+
+from openpype.client.mongo import (
+    QueryStats,
+    get_mongo_client_options,
+)
+from openpype.client.mongo.instrumentation import (
+    QueryCommandListener,
+    get_query_shape,
+)
+
+_REQUEST_IDS = itertools.count()
+
+
+class _Event(object):
+    def __init__(self, command_name, **kwargs):
+        self.command_name = command_name
+        self.database_name = "avalon"
+        self.connection_id = ("localhost", 27017)
+        self.duration_micros = 1000
+        self.__dict__.update(kwargs)
+
+
+def _run_command(listener, command_name, command, reply):
+    request_id = next(_REQUEST_IDS)
+    listener.started(_Event(
+        command_name, command=command, request_id=request_id
+    ))
+    listener.succeeded(_Event(
+        command_name, reply=reply, request_id=request_id
+    ))
+
+
+def _find(listener, filter_data, documents, cursor_id=0):
+    _run_command(
+        listener,
+        "find",
+        {"find": "test_project", "filter": filter_data},
+        {"cursor": {"id": cursor_id, "firstBatch": documents}},
+    )
+
+
+@pytest.fixture
+def stats():
+    listener = QueryCommandListener()
+    stats = QueryStats(keep_records=True)
+    listener.add_recorder(stats)
+    stats.listener = listener
+    return stats
+
+
+def test_query_stats(stats):
+    listener = stats.listener
+    for idx in range(6):
+        _find(listener, {"type": "asset", "_id": idx}, [{"_id": idx}])
+    _find(listener, {"type": "subset", "parent": {"$in": [1, 2]}}, [{}, {}])
+
+    assert stats.query_count == 7
+    assert stats.document_count == 8
+    assert stats.duration == pytest.approx(0.007)
+
+    record = stats.records[0]
+    assert record.caller.startswith(__name__)
+    assert record.function is None
+
+    report = stats.get_n_plus_one_report()
+    assert len(report) == 1
+    assert report[0]["count"] == 6
+    assert report[0]["shape"] == get_query_shape(
+        {"filter": {"_id": 0, "type": ""}}
+    )
+    assert "Possible N+1 queries" in stats.format_report()
+
+
+def test_cursor_batches_are_aggregated(stats):
+    listener = stats.listener
+    _find(listener, {}, [{}] * 101, cursor_id=10)
+    # Query is recorded when cursor is exhausted
+    assert stats.query_count == 0
+
+    _run_command(
+        listener,
+        "getMore",
+        {"getMore": 10, "collection": "test_project"},
+        {"cursor": {"id": 0, "nextBatch": [{}] * 50}},
+    )
+    assert stats.query_count == 1
+    assert stats.document_count == 151
+    assert stats.duration == pytest.approx(0.002)
+
+
+def test_ignored_without_recorder():
+    listener = QueryCommandListener()
+    _find(listener, {}, [{}])
+    assert not listener._pending
+
+    stats = QueryStats()
+    listener.add_recorder(stats)
+    _run_command(listener, "ping", {"ping": 1}, {"ok": 1})
+    assert stats.query_count == 0
+
+
+def test_query_shape():
+    assert get_query_shape(
+        {"filter": {"_id": {"$in": [1, 2, 3]}, "name": "a"}}
+    ) == get_query_shape(
+        {"filter": {"name": "b", "_id": {"$in": [4]}}}
+    )
+
+
+def test_client_options(monkeypatch):
+    monkeypatch.setenv("OPENPYPE_MONGO_READ_PREFERENCE", "secondaryPreferred")
+    monkeypatch.delenv("OPENPYPE_MONGO_MAX_POOL_SIZE", raising=False)
+
+    options = get_mongo_client_options("mongodb://localhost:27017", "farm")
+    assert options["maxPoolSize"] == 5
+    assert options["readPreference"] == "secondaryPreferred"
+
+    # Options from url have priority
+    options = get_mongo_client_options(
+        "mongodb://localhost:27017/?maxpoolsize=100", "farm"
+    )
+    assert "maxPoolSize" not in options
+
+    monkeypatch.setenv("OPENPYPE_MONGO_MAX_POOL_SIZE", "3")
+    options = get_mongo_client_options("mongodb://localhost", "tray")
+    assert options["maxPoolSize"] == 3
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Test lookup of published files by source hashes and project indexes.
+
+Project collection is replaced by in-memory fake so tests are running
+without database.
+"""
+import pytest
+
+from openpype.client.mongo import entities, operations
+
+PROJECT_NAME = "test_project"
+
+
+def _get_value(doc, key):
+    value = doc
+    for part in key.split("."):
+        if isinstance(value, list):
+            # Multikey field, e.g. list of entries
+            return [
+                item.get(part)
+                for item in value
+                if isinstance(item, dict)
+            ]
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def _match(doc, query_filter):
+    for key, condition in query_filter.items():
+        if key == "$or":
+            if not any(_match(doc, item) for item in condition):
+                return False
+            continue
+
+        value = _get_value(doc, key)
+        if isinstance(condition, dict) and "$exists" in condition:
+            if (value is not None) != condition["$exists"]:
+                return False
+        elif isinstance(condition, dict) and "$in" in condition:
+            values = value if isinstance(value, list) else [value]
+            if not set(values) & set(condition["$in"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCollection(object):
+    def __init__(self, docs=None):
+        self.docs = docs or []
+        self.queries = []
+        self.indexes = {"_id_": {"key": [("_id", 1)]}}
+        self.created_indexes = []
+
+    def find(self, query_filter, projection=None):
+        self.queries.append(query_filter)
+        return [doc for doc in self.docs if _match(doc, query_filter)]
+
+    def index_information(self):
+        return dict(self.indexes)
+
+    def create_index(self, keys, name, **kwargs):
+        self.created_indexes.append((keys, name, kwargs))
+        self.indexes[name] = {"key": keys}
+        return name
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = FakeCollection([
+        {
+            "type": "version",
+            "data": {
+                "sourceHashes": {
+                    "diffuse,png|1|10": "/publish/v001/diffuse.png",
+                },
+                "sourceHashEntries": [
+                    {
+                        "hash": "diffuse,png|1|10",
+                        "path": "/publish/v001/diffuse.png"
+                    },
+                ],
+            },
+        },
+        {
+            "type": "version",
+            "data": {
+                "sourceHashEntries": [
+                    {
+                        "hash": "diffuse,png|1|10",
+                        "path": "/publish/v002/diffuse.png"
+                    },
+                    {
+                        "hash": "specular,png|1|10",
+                        "path": "/publish/v002/specular.png"
+                    },
+                ],
+            },
+        },
+        # Version published before hash entries were stored
+        {
+            "type": "version",
+            "data": {
+                "sourceHashes": {
+                    "normal,png|1|10": "/publish/v000/normal.png",
+                },
+            },
+        },
+    ])
+    for module in (entities, operations):
+        monkeypatch.setattr(
+            module, "get_project_connection", lambda name: collection
+        )
+    return collection
+
+
+def test_hashes_resolved_with_one_query(collection):
+    paths_by_hash = entities.get_source_hash_paths(
+        PROJECT_NAME,
+        ["diffuse,png|1|10", "specular,png|1|10", "missing,png|1|10"]
+    )
+
+    assert paths_by_hash == {
+        "diffuse,png|1|10": [
+            "/publish/v001/diffuse.png",
+            "/publish/v002/diffuse.png",
+        ],
+        "specular,png|1|10": ["/publish/v002/specular.png"],
+    }
+    assert len(collection.queries) == 1
+    query_filter = collection.queries[0]
+    assert query_filter["type"] == "version"
+    assert set(query_filter["data.sourceHashEntries.hash"]["$in"]) == {
+        "diffuse,png|1|10", "specular,png|1|10", "missing,png|1|10"
+    }
+    # Nothing is created on read
+    assert collection.created_indexes == []
+
+
+def test_legacy_hashes_are_opt_in(collection):
+    paths_by_hash = entities.get_source_hash_paths(
+        PROJECT_NAME, ["normal,png|1|10"]
+    )
+    assert paths_by_hash == {}
+    assert len(collection.queries) == 1
+
+    paths_by_hash = entities.get_source_hash_paths(
+        PROJECT_NAME,
+        ["diffuse,png|1|10", "normal,png|1|10"],
+        include_legacy=True
+    )
+    assert paths_by_hash == {
+        "diffuse,png|1|10": [
+            "/publish/v001/diffuse.png",
+            "/publish/v002/diffuse.png",
+        ],
+        "normal,png|1|10": ["/publish/v000/normal.png"],
+    }
+    # Legacy keys are queried only for hashes not found in entries
+    assert len(collection.queries) == 3
+    assert collection.queries[-1]["$or"] == [
+        {"data.sourceHashes.normal,png|1|10": {"$exists": True}}
+    ]
+
+
+def test_no_hashes_no_query(collection):
+    assert entities.get_source_hash_paths(PROJECT_NAME, []) == {}
+    assert collection.queries == []
+
+
+def test_create_project_indexes(collection):
+    operations.create_project_indexes(PROJECT_NAME)
+    assert collection.created_indexes == [(
+        "data.sourceHashEntries.hash",
+        "version_source_hash",
+        {
+            "background": True,
+            "partialFilterExpression": {"type": "version"},
+        }
+    )]
+
+    # Existing indexes are not created again
+    operations.create_project_indexes(PROJECT_NAME)
+    assert len(collection.created_indexes) == 1
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Test containers index.
+
+Host scene is replaced by in-memory fake so tests are running without host.
+"""
+import pytest
+
+from openpype.host import ContainersIndex
+
+
+class FakeScene(object):
+    def __init__(self):
+        # Node data by node name
+        self.nodes = {}
+        self.parsed_nodes = []
+
+    def list_nodes(self):
+        return list(self.nodes.keys())
+
+    def parse_node(self, node):
+        self.parsed_nodes.append(node)
+        data = self.nodes.get(node)
+        if not data or data.get("id") != "container":
+            return None
+        container = dict(data)
+        container["objectName"] = node
+        return container
+
+
+def _names(containers):
+    return sorted(container["objectName"] for container in containers)
+
+
+@pytest.fixture
+def scene():
+    scene = FakeScene()
+    for idx in range(5):
+        scene.nodes["container{}".format(idx)] = {"id": "container"}
+    scene.nodes["mesh"] = {}
+    return scene
+
+
+@pytest.fixture
+def index(scene):
+    return ContainersIndex(scene.list_nodes, scene.parse_node)
+
+
+def test_scene_is_scanned_once(scene, index):
+    for _ in range(3):
+        assert _names(index.get_containers()) == [
+            "container{}".format(idx) for idx in range(5)
+        ]
+    assert len(scene.parsed_nodes) == 6
+
+
+def test_incremental_updates(scene, index):
+    index.get_containers()
+    del scene.parsed_nodes[:]
+
+    scene.nodes["added"] = {"id": "container"}
+    index.node_added("added")
+    del scene.nodes["container0"]
+    index.node_removed("container0")
+    scene.nodes["renamed"] = scene.nodes.pop("container1")
+    index.node_renamed("renamed", "container1")
+    scene.nodes["container2"]["id"] = "other"
+    index.node_changed("container2")
+    scene.nodes["mesh"]["id"] = "container"
+    index.node_changed("mesh")
+
+    assert _names(index.get_containers()) == [
+        "added", "container3", "container4", "mesh", "renamed"
+    ]
+    assert sorted(scene.parsed_nodes) == [
+        "added", "container2", "mesh", "renamed"
+    ]
+
+
+def test_changes_before_scan_are_ignored(scene, index):
+    index.node_changed("container0")
+    index.node_removed("container1")
+    index.get_containers()
+    assert len(scene.parsed_nodes) == 6
+
+
+def test_suspend_and_reset(scene, index):
+    index.get_containers()
+    index.suspend()
+    assert index.is_suspended
+
+    scene.nodes = {"new": {"id": "container"}}
+    index.node_added("new")
+    # Scene is scanned on each request while suspended
+    assert _names(index.get_containers()) == ["new"]
+    assert _names(index.get_containers()) == ["new"]
+    assert scene.parsed_nodes.count("new") == 2
+
+    index.reset()
+    assert not index.is_suspended
+    index.get_containers()
+    index.get_containers()
+    assert scene.parsed_nodes.count("new") == 3
+
+
+def test_containers_are_copies(index):
+    container = index.get_containers()[0]
+    container["representation"] = "changed"
+    assert all(
+        "representation" not in item
+        for item in index.get_containers()
+    )
+
+
+class FakeNode(object):
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+
+def test_key_recomputed_for_renamed_nodes():
+    nodes = [FakeNode("Gizmo1", {"id": "container"})]
+
+    def parse_node(node):
+        if node.data.get("id") != "container":
+            return None
+        container = dict(node.data)
+        container["objectName"] = node.name
+        return container
+
+    index = ContainersIndex(
+        lambda: list(nodes), parse_node, lambda node: node.name
+    )
+    assert _names(index.get_containers()) == ["Gizmo1"]
+
+    # Loader replaces node with new node which takes name of the old node
+    new_node = FakeNode("Gizmo2", {"id": "container"})
+    nodes.append(new_node)
+    index.node_added(new_node)
+    old_node = nodes.pop(0)
+    index.node_removed(old_node)
+    new_node.name = "Gizmo1"
+    index.node_changed(new_node)
+
+    containers = index.get_containers()
+    assert _names(containers) == ["Gizmo1"]
+
+    nodes.remove(new_node)
+    index.node_removed(new_node)
+    assert index.get_containers() == []
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Test incremental archiving of Harmony scene folders."""
+import os
+import zipfile
+
+from openpype.hosts.harmony import lib
+from openpype.hosts.harmony.lib import (
+    create_scene_archive,
+    load_archive_manifest,
+    save_archive_manifest,
+)
+
+
+def _create_scene(root):
+    scene_dir = root / "scene"
+    (scene_dir / "elements" / "Drawing").mkdir(parents=True)
+    (scene_dir / "frames").mkdir()
+    (scene_dir / "scene.xstage").write_text("<project>v1</project>")
+    for idx in range(10):
+        path = scene_dir / "elements" / "Drawing" / "Drawing-{}.tvg".format(
+            idx
+        )
+        path.write_bytes(os.urandom(1024) * 4)
+    return scene_dir
+
+
+def _read_members(archive_path):
+    with zipfile.ZipFile(archive_path) as zip_file:
+        assert zip_file.testzip() is None
+        return {
+            zinfo.filename: zip_file.read(zinfo)
+            for zinfo in zip_file.infolist()
+        }
+
+
+def _archive(scene_dir, destination, monkeypatch):
+    compressed = []
+    orig_compress = lib._compress
+
+    def _compress(data):
+        compressed.append(data)
+        return orig_compress(data)
+
+    monkeypatch.setattr(lib, "_compress", _compress)
+
+    archive_path = str(scene_dir) + ".zip"
+    manifest_path = str(scene_dir) + ".manifest.json"
+    previous_manifest = load_archive_manifest(manifest_path, destination)
+    manifest = create_scene_archive(
+        str(scene_dir), archive_path, destination, previous_manifest,
+        max_workers=2
+    )
+    os.replace(archive_path, destination)
+    save_archive_manifest(manifest_path, destination, manifest)
+    return len(compressed)
+
+
+def test_incremental_archive(tmp_path, monkeypatch):
+    scene_dir = _create_scene(tmp_path)
+    destination = str(tmp_path / "workfile.zip")
+
+    assert _archive(scene_dir, destination, monkeypatch) == 11
+    first_members = _read_members(destination)
+    assert "frames/" in first_members
+    assert "scene.xstage" in first_members
+
+    # Scene is saved again, all files are rewritten but only xstage changed
+    drawing_path = scene_dir / "elements" / "Drawing" / "Drawing-0.tvg"
+    drawing_path.write_bytes(drawing_path.read_bytes())
+    (scene_dir / "scene.xstage").write_text("<project>v2</project>")
+
+    assert _archive(scene_dir, destination, monkeypatch) == 1
+    members = _read_members(destination)
+    assert members.pop("scene.xstage") == b"<project>v2</project>"
+    first_members.pop("scene.xstage")
+    assert members == first_members
+
+
+def test_changed_archive_is_not_reused(tmp_path, monkeypatch):
+    scene_dir = _create_scene(tmp_path)
+    destination = str(tmp_path / "workfile.zip")
+    _archive(scene_dir, destination, monkeypatch)
+
+    # Workfile was overridden by other process
+    with zipfile.ZipFile(destination, "w") as zip_file:
+        zip_file.writestr("scene.xstage", "other")
+
+    assert _archive(scene_dir, destination, monkeypatch) == 11
+    assert len(_read_members(destination)) == 14
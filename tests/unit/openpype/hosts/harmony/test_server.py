@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Test matching of Harmony replies to requests in communication server.
+
+Harmony is replaced by fake socket peer. Harmony api package is replaced by
+empty package so Qt is not required.
+"""
+import os
+import sys
+import json
+import time
+import types
+import socket
+import struct
+import importlib
+import threading
+
+import pytest
+
+import openpype.hosts.harmony
+
+SERVER_MODULE_NAME = "openpype.hosts.harmony.api.server"
+
+
+class FakeHarmony(object):
+    """Socket peer sending messages in the format of Harmony client."""
+
+    def __init__(self, port):
+        self.socket = socket.create_connection(("127.0.0.1", port))
+        self.requests = []
+        self._buffer = b""
+        self._thread = threading.Thread(target=self._read_requests)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @staticmethod
+    def encode(message):
+        encoded = json.dumps(message).encode("utf-8")
+        return b"AH" + "{:08x}".format(len(encoded)).encode() + encoded
+
+    def send_raw(self, data, chunk_size=None):
+        if chunk_size is None:
+            self.socket.sendall(data)
+            return
+        for idx in range(0, len(data), chunk_size):
+            self.socket.sendall(data[idx:idx + chunk_size])
+            time.sleep(0.001)
+
+    def wait_for_requests(self, count, timeout=5):
+        started = time.time()
+        while len(self.requests) < count:
+            if time.time() - started > timeout:
+                raise AssertionError("Requests were not received")
+            time.sleep(0.01)
+
+    def close(self):
+        # Shutdown wakes up threads waiting for data on both sides
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._thread.join(5)
+        self.socket.close()
+
+    def _read_requests(self):
+        while True:
+            try:
+                chunk = self.socket.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            self._buffer += chunk
+            # Server sends 'AH' with length packed to 4 bytes
+            while len(self._buffer) >= 6:
+                length = struct.unpack(">I", self._buffer[2:6])[0]
+                if len(self._buffer) < 6 + length:
+                    break
+                body = self._buffer[6:6 + length]
+                self._buffer = self._buffer[6 + length:]
+                self.requests.append(json.loads(body.decode("utf-8")))
+
+
+@pytest.fixture
+def server_module(monkeypatch):
+    harmony_api = types.ModuleType("openpype.hosts.harmony.api")
+    harmony_api.__path__ = [
+        os.path.join(os.path.dirname(openpype.hosts.harmony.__file__), "api")
+    ]
+    harmony_lib = types.ModuleType("openpype.hosts.harmony.api.lib")
+    harmony_api.lib = harmony_lib
+    for module in (harmony_api, harmony_lib):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    monkeypatch.delitem(sys.modules, SERVER_MODULE_NAME, raising=False)
+    module = importlib.import_module(SERVER_MODULE_NAME)
+    # Server module imported with fake api package is removed after test
+    monkeypatch.setitem(sys.modules, SERVER_MODULE_NAME, module)
+    return module
+
+
+@pytest.fixture
+def connection(server_module):
+    server = server_module.Server(0)
+    server.port = server.socket.getsockname()[1]
+    server.start()
+    harmony = FakeHarmony(server.port)
+    yield server, harmony
+
+    harmony.close()
+    server.stop()
+    server.join(5)
+
+
+def _reply(request, result):
+    reply = dict(request)
+    reply["reply"] = True
+    reply["result"] = result
+    return reply
+
+
+@pytest.mark.parametrize("chunk_size", [None, 3])
+def test_long_reply_followed_by_short(connection, chunk_size):
+    server, harmony = connection
+    long_future = server.send_async({"function": "long"})
+    short_future = server.send_async({"function": "short"})
+    harmony.wait_for_requests(2)
+    long_request, short_request = harmony.requests
+
+    # Both replies are received at once, the first is longer
+    harmony.send_raw(
+        harmony.encode(_reply(long_request, "x" * 5000))
+        + harmony.encode(_reply(short_request, "y")),
+        chunk_size
+    )
+
+    assert long_future.result(5)["result"] == "x" * 5000
+    assert short_future.result(5)["result"] == "y"
+    assert server._waiters == {}
+
+
+def test_batch_replies_out_of_order(connection):
+    server, harmony = connection
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(
+        server.send_batch([{"function": str(idx)} for idx in range(5)])
+    ))
+    thread.start()
+    harmony.wait_for_requests(5)
+
+    replies = b"".join(
+        harmony.encode(_reply(request, request["function"]))
+        for request in reversed(harmony.requests)
+    )
+    harmony.send_raw(replies)
+    thread.join(5)
+
+    assert [reply["result"] for reply in results] == [
+        "0", "1", "2", "3", "4"
+    ]
+
+
+def test_pending_requests_fail_on_close(connection):
+    server, harmony = connection
+    future = server.send_async({"function": "never_replied"})
+    harmony.wait_for_requests(1)
+    harmony.close()
+
+    with pytest.raises(ConnectionError):
+        future.result(5)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Test concurrent texture conversions of Maya look extractor.
+
+Maya modules are replaced by empty modules and conversion subprocess is
+replaced by fake so tests are running without Maya and OpenImageIO.
+"""
+import os
+import sys
+import time
+import types
+import importlib
+import threading
+
+import pytest
+
+PLUGIN_MODULE_NAME = "openpype.hosts.maya.plugins.publish.extract_look"
+
+
+class FakeConversions(object):
+    """Record conversions running at the same time."""
+
+    def __init__(self):
+        self.destinations = []
+        self.running = set()
+        self.max_running = 0
+        self.same_name_overlaps = 0
+        self._lock = threading.Lock()
+
+    def run_subprocess(self, args, **kwargs):
+        destination = args[args.index("-o") + 1]
+        name = os.path.basename(destination)
+        with self._lock:
+            if name in self.running:
+                self.same_name_overlaps += 1
+            self.running.add(name)
+            self.max_running = max(self.max_running, len(self.running))
+        # Give other conversions chance to start
+        time.sleep(0.05)
+        with open(destination, "w") as stream:
+            stream.write(args[args.index("--checknan") + 1])
+        with self._lock:
+            self.running.discard(name)
+            self.destinations.append(destination)
+
+
+@pytest.fixture
+def extract_look(monkeypatch):
+    maya_module = types.ModuleType("maya")
+    maya_module.cmds = types.ModuleType("maya.cmds")
+    maya_api = types.ModuleType("openpype.hosts.maya.api")
+    maya_api.lib = types.ModuleType("openpype.hosts.maya.api.lib")
+    for module in (
+        maya_module,
+        maya_module.cmds,
+        maya_api,
+        maya_api.lib,
+    ):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    monkeypatch.delitem(sys.modules, PLUGIN_MODULE_NAME, raising=False)
+    module = importlib.import_module(PLUGIN_MODULE_NAME)
+    # Plugin module imported with fake Maya modules is removed after test
+    monkeypatch.setitem(sys.modules, PLUGIN_MODULE_NAME, module)
+    return module
+
+
+@pytest.fixture
+def conversions(extract_look, monkeypatch):
+    conversions = FakeConversions()
+    monkeypatch.setattr(
+        extract_look, "get_oiio_tool_args", lambda tool_name: [tool_name]
+    )
+    monkeypatch.setattr(
+        extract_look, "run_subprocess", conversions.run_subprocess
+    )
+    return conversions
+
+
+def _create_textures(root, relative_paths):
+    filepaths = []
+    for relative_path in relative_paths:
+        filepath = os.path.normpath(os.path.join(str(root), relative_path))
+        dirpath = os.path.dirname(filepath)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(filepath, "w") as stream:
+            stream.write(relative_path)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def _process_textures(extract_look, filepaths, staging_dir, workers):
+    plugin = extract_look.ExtractLook()
+    plugin.max_concurrent_conversions = workers
+    return plugin._process_textures(
+        {filepath: "sRGB" for filepath in filepaths},
+        processors=[extract_look.MakeTX()],
+        staging_dir=staging_dir,
+        force_copy=True,
+        color_management={"enabled": False},
+        project_name="test_project"
+    )
+
+
+def test_textures_converted_concurrently(
+    extract_look, conversions, tmp_path, monkeypatch
+):
+    filepaths = _create_textures(
+        tmp_path / "sources",
+        ["texture_{}.png".format(idx) for idx in range(8)]
+    )
+    staging_dir = str(tmp_path / "staging")
+    os.makedirs(staging_dir)
+
+    makedirs = os.makedirs
+
+    def slow_makedirs(*args, **kwargs):
+        # All conversions try to create resources directory at once
+        time.sleep(0.02)
+        return makedirs(*args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", slow_makedirs)
+
+    results = _process_textures(extract_look, filepaths, staging_dir, 4)
+
+    resources_dir = os.path.join(staging_dir, "resources")
+    assert set(results) == set(filepaths)
+    for filepath, result in results.items():
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        assert result.path == os.path.join(resources_dir, name + ".tx")
+        assert result.transfer_mode == extract_look.COPY
+        with open(result.path, "r") as stream:
+            assert stream.read() == filepath
+
+    assert len(conversions.destinations) == 8
+    assert 1 < conversions.max_running <= 4
+
+
+def test_textures_with_same_name_converted_serially(
+    extract_look, conversions, tmp_path
+):
+    filepaths = _create_textures(
+        tmp_path / "sources",
+        [
+            "char/diffuse.png",
+            "prop/diffuse.png",
+            "set/diffuse.png",
+            "char/specular.png",
+        ]
+    )
+    staging_dir = str(tmp_path / "staging")
+    # Resources directory which already exists is used
+    os.makedirs(os.path.join(staging_dir, "resources"))
+
+    results = _process_textures(extract_look, filepaths, staging_dir, 4)
+
+    assert set(results) == set(filepaths)
+    assert len(conversions.destinations) == 4
+    assert conversions.same_name_overlaps == 0
+    assert conversions.max_running == 2
+
+
+def test_published_textures_resolved_in_batch(
+    extract_look, tmp_path, monkeypatch
+):
+    filepaths = _create_textures(
+        tmp_path / "sources", ["diffuse.png", "specular.png"]
+    )
+    published_path = _create_textures(
+        tmp_path / "publish", ["diffuse.png"]
+    )[0]
+    diffuse_hash = extract_look.source_hash(filepaths[0])
+    lookups = []
+
+    def find_paths_by_hashes(project_name, texture_hashes, include_legacy):
+        lookups.append((set(texture_hashes), include_legacy))
+        return {diffuse_hash: ["/missing/diffuse.png", published_path]}
+
+    monkeypatch.setattr(
+        extract_look, "find_paths_by_hashes", find_paths_by_hashes
+    )
+    plugin = extract_look.ExtractLook()
+    results = plugin._process_textures(
+        {filepath: "sRGB" for filepath in filepaths},
+        processors=[],
+        staging_dir=str(tmp_path / "staging"),
+        force_copy=False,
+        color_management={"enabled": False},
+        project_name="test_project"
+    )
+
+    assert lookups == [({
+        diffuse_hash, extract_look.source_hash(filepaths[1])
+    }, False)]
+    diffuse_result = results[filepaths[0]]
+    assert diffuse_result.path == published_path
+    assert diffuse_result.transfer_mode == extract_look.HARDLINK
+    assert diffuse_result.file_hash == diffuse_hash
+    specular_result = results[filepaths[1]]
+    assert specular_result.path == filepaths[1]
+    assert specular_result.transfer_mode == extract_look.COPY
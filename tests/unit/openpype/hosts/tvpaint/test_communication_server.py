@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Test matching of TVPaint responses to requests in communication server.
+
+Websocket of TVPaint client is replaced by fake which records sent messages
+so tests are running without TVPaint.
+"""
+import json
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp_json_rpc")
+
+from openpype.hosts.tvpaint.api.communication_server import (  # noqa: E402
+    BaseTVPaintRpc,
+    BaseCommunicator,
+)
+
+CLIENT_HOST = "localhost:12345"
+
+
+class FakeWebSocket(object):
+    def __init__(self):
+        self.closed = False
+        self.messages = []
+        self.received = threading.Condition()
+        # Number of messages after which sending fails
+        self.fail_after = None
+
+    async def send_str(self, message):
+        if (
+            self.fail_after is not None
+            and len(self.messages) >= self.fail_after
+        ):
+            raise ConnectionResetError("Connection lost")
+        with self.received:
+            self.messages.append(json.loads(message))
+            self.received.notify_all()
+
+    def wait_for_messages(self, count, timeout=5):
+        with self.received:
+            return self.received.wait_for(
+                lambda: len(self.messages) >= count, timeout
+            )
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.host = CLIENT_HOST
+        self.ws = FakeWebSocket()
+
+
+class FakeHttpRequest(object):
+    host = CLIENT_HOST
+
+
+class FakeRawMessage(object):
+    def __init__(self, data):
+        self.data = json.dumps(data)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.daemon = True
+    thread.start()
+    yield loop
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+@pytest.fixture
+def rpc(loop):
+    rpc = BaseTVPaintRpc(None, loop=loop)
+    rpc.closed_check_interval = 0.05
+    return rpc
+
+
+def _respond(rpc, loop, request_id, result=None, error=None):
+    message = {"jsonrpc": "2.0", "id": request_id}
+    if error is not None:
+        message["error"] = error
+    else:
+        message["result"] = result
+    asyncio.run_coroutine_threadsafe(
+        rpc._handle_rpc_msg(FakeHttpRequest(), FakeRawMessage(message)),
+        loop
+    ).result(5)
+
+
+def _call_in_thread(func, *args):
+    output = {}
+
+    def _target():
+        try:
+            output["result"] = func(*args)
+        except Exception as exc:
+            output["error"] = exc
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    return thread, output
+
+
+def test_responses_out_of_order(rpc, loop):
+    client = FakeClient()
+    requests = [
+        ("execute_george", ["tv_version"]),
+        ("execute_george", ["tv_projectinfo"]),
+        ("execute_george", ["tv_layercurrentid"]),
+    ]
+    thread, output = _call_in_thread(rpc.send_requests, client, requests)
+
+    # All requests are sent before any response arrives
+    assert client.ws.wait_for_messages(3)
+    sent = list(client.ws.messages)
+    assert [message["params"] for message in sent] == [
+        params for _, params in requests
+    ]
+    request_ids = [message["id"] for message in sent]
+    assert len(set(request_ids)) == 3
+
+    for request_id in reversed(request_ids):
+        _respond(rpc, loop, request_id, "result {}".format(request_id))
+
+    thread.join(5)
+    assert output["result"] == [
+        "result {}".format(request_id)
+        for request_id in request_ids
+    ]
+    assert rpc._response_waiters == {}
+
+
+def test_response_error(rpc, loop):
+    client = FakeClient()
+    thread, output = _call_in_thread(
+        rpc.send_request, client, "execute_george", ["invalid"]
+    )
+    assert client.ws.wait_for_messages(1)
+    request_id = client.ws.messages[0]["id"]
+    error = {"code": -32000, "message": "Failed"}
+    _respond(rpc, loop, request_id, error=error)
+
+    thread.join(5)
+    assert "Failed" in str(output["error"])
+
+
+def test_closed_connection_returns_none(rpc):
+    client = FakeClient()
+    thread, output = _call_in_thread(
+        rpc.send_request, client, "execute_george", ["tv_version"]
+    )
+    assert client.ws.wait_for_messages(1)
+    client.ws.closed = True
+
+    thread.join(5)
+    assert output == {"result": None}
+    assert rpc._response_waiters == {}
+
+
+def test_execute_george_batch(rpc, loop):
+    client = FakeClient()
+    communicator = BaseCommunicator()
+    communicator.websocket_rpc = rpc
+    communicator._connected_client = client
+
+    scripts = ["tv_version", "tv_projectinfo"]
+    thread, output = _call_in_thread(
+        communicator.execute_george_batch, scripts
+    )
+    assert client.ws.wait_for_messages(2)
+    for message in reversed(client.ws.messages):
+        assert message["method"] == "execute_george"
+        _respond(rpc, loop, message["id"], message["params"][0].upper())
+
+    thread.join(5)
+    assert output["result"] == ["TV_VERSION", "TV_PROJECTINFO"]
+
+
+def test_failed_send_removes_waiter(rpc):
+    client = FakeClient()
+    client.ws.fail_after = 0
+    with pytest.raises(ConnectionResetError):
+        rpc.send_request(client, "execute_george", ["tv_version"])
+    assert rpc._response_waiters == {}
+
+
+def test_failed_send_of_requests_removes_waiters(rpc):
+    client = FakeClient()
+    client.ws.fail_after = 2
+    requests = [
+        ("execute_george", ["tv_version"]),
+        ("execute_george", ["tv_projectinfo"]),
+        ("execute_george", ["tv_layercurrentid"]),
+    ]
+    with pytest.raises(ConnectionResetError):
+        rpc.send_requests(client, requests)
+    assert len(client.ws.messages) == 2
+    assert rpc._response_waiters == {}
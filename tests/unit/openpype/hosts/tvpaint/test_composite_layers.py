@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Test compositing of rendered TVPaint layers."""
+import os
+
+from PIL import Image
+
+from openpype.hosts.tvpaint.lib import (
+    composite_images,
+    composite_rendered_layers,
+    fill_reference_frames,
+)
+
+RANGE_START = 0
+RANGE_END = 5
+
+
+def _render_layer(dirpath, layer_id, frame_references, colors):
+    """Create layer images, frames without color are held frames."""
+    filepaths_by_frame = {}
+    for frame_idx in frame_references:
+        filepaths_by_frame[frame_idx] = os.path.join(
+            dirpath, "{}_{:0>4}.png".format(layer_id, frame_idx)
+        )
+
+    for frame_idx, color in colors.items():
+        img_obj = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+        img_obj.paste(color, (0, 0, 6, 6))
+        img_obj.save(filepaths_by_frame[frame_idx])
+
+    fill_reference_frames(frame_references, filepaths_by_frame)
+    return filepaths_by_frame
+
+
+def test_composite_rendered_layers(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    layers_data = [
+        {"layer_id": 1, "position": 0},
+        {"layer_id": 2, "position": 1},
+    ]
+    filepaths_by_layer_id = {
+        # Top layer with held frames
+        1: _render_layer(
+            str(src_dir), 1,
+            {0: 0, 1: 0, 2: 0, 3: 3, 4: 3, 5: None},
+            {0: (255, 0, 0, 128), 3: (0, 255, 0, 200)},
+        ),
+        # Background layer
+        2: _render_layer(
+            str(src_dir), 2,
+            {0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: None},
+            {0: (0, 0, 255, 255)},
+        ),
+    }
+    filepaths_by_layer_id[1].pop(5)
+    filepaths_by_layer_id[2].pop(5)
+
+    # Expected output composited frame by frame
+    expected = {}
+    for frame_idx in range(RANGE_START, RANGE_END):
+        dst_filepath = str(tmp_path / "expected_{}.png".format(frame_idx))
+        composite_images(
+            [
+                filepaths_by_layer_id[2][frame_idx],
+                filepaths_by_layer_id[1][frame_idx],
+            ],
+            dst_filepath
+        )
+        expected[frame_idx] = Image.open(dst_filepath).tobytes()
+
+    dst_filepaths_by_frame = {
+        frame_idx: str(tmp_path / "out_{}.png".format(frame_idx))
+        for frame_idx in range(RANGE_START, RANGE_END + 1)
+    }
+    composite_rendered_layers(
+        layers_data, filepaths_by_layer_id,
+        RANGE_START, RANGE_END,
+        dst_filepaths_by_frame,
+        max_workers=2
+    )
+
+    for frame_idx, image_bytes in expected.items():
+        img_obj = Image.open(dst_filepaths_by_frame[frame_idx])
+        assert img_obj.tobytes() == image_bytes
+
+    # Held frames are linked to first composited frame
+    dst_filepaths = dst_filepaths_by_frame
+    assert os.path.samefile(dst_filepaths[0], dst_filepaths[2])
+    assert os.path.samefile(dst_filepaths[3], dst_filepaths[4])
+    assert not os.path.samefile(dst_filepaths[0], dst_filepaths[3])
+    # Frame without content is transparent
+    img_obj = Image.open(dst_filepaths_by_frame[RANGE_END])
+    assert img_obj.getextrema()[3] == (0, 0)
+    # Source files were removed
+    assert not os.listdir(str(src_dir))
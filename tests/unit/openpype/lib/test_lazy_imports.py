@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Test lazy attributes of packages and import profiler.
+
+Temporary packages are created for each test so imports are not cached.
+"""
+import sys
+import zipfile
+import textwrap
+
+import pytest
+
+from openpype.lib.import_profiler import ImportProfiler
+
+
+@pytest.fixture
+def package_factory(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    created = []
+
+    def _create(name, files):
+        package_dir = tmp_path / name
+        package_dir.mkdir()
+        for filename, content in files.items():
+            (package_dir / filename).write_text(textwrap.dedent(content))
+        created.append(name)
+        return name
+
+    yield _create
+
+    for module_name in tuple(sys.modules):
+        if module_name.split(".")[0] in created:
+            sys.modules.pop(module_name)
+
+
+LAZY_PACKAGE_FILES = {
+    "__init__.py": """
+        from openpype.lib.python_module_tools import (
+            set_lazy_module_attributes
+        )
+
+        set_lazy_module_attributes(__name__, {
+            ".heavy": ("HeavyClass", ("alias", "heavy_function")),
+            ".execute": ("execute", ),
+        })
+    """,
+    "heavy.py": """
+        class HeavyClass(object):
+            pass
+
+
+        def heavy_function():
+            return "heavy"
+    """,
+    "execute.py": """
+        def execute():
+            return "executed"
+    """,
+    "other.py": "VALUE = 1\n",
+}
+
+
+def test_lazy_attributes(package_factory):
+    name = package_factory("lazy_package_attrs", LAZY_PACKAGE_FILES)
+    package = __import__(name)
+    assert name + ".heavy" not in sys.modules
+
+    assert package.alias() == "heavy"
+    assert package.HeavyClass.__name__ == "HeavyClass"
+    assert name + ".heavy" in sys.modules
+    assert "alias" in dir(package)
+
+    # Submodules which are not exported are available too
+    assert package.other.VALUE == 1
+
+    with pytest.raises(AttributeError):
+        package.missing
+
+
+def test_submodule_does_not_replace_attribute(package_factory):
+    name = package_factory("lazy_package_shadow", LAZY_PACKAGE_FILES)
+    __import__(name + ".execute")
+    package = sys.modules[name]
+    assert package.execute() == "executed"
+
+    namespace = {}
+    exec("from {} import execute".format(name), namespace)
+    assert callable(namespace["execute"])
+
+
+def test_import_profiler(package_factory):
+    name = package_factory("profiled_package", {
+        "__init__.py": "from . import first\n",
+        "first.py": "from . import second\n",
+        "second.py": "import time\ntime.sleep(0.01)\n",
+    })
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        __import__(name)
+    finally:
+        profiler.uninstall()
+
+    assert profiler not in sys.meta_path
+    records = [
+        (record.name, depth)
+        for record, depth in profiler.iter_records()
+    ]
+    assert records == [
+        (name, 0),
+        (name + ".first", 1),
+        (name + ".second", 2),
+    ]
+    root = profiler.root_records[0]
+    second = root.children[0].children[0]
+    assert second.self_time >= 0.01
+    assert root.self_time < root.cumulative_time
+
+    report = profiler.get_report()
+    assert "| | {}.second".format(name) in report
+    assert profiler.get_package_times()[0][0] == name
+
+
+def test_import_profiler_zipimport(tmp_path, monkeypatch):
+    name = "profiled_zip_package"
+    archive_path = tmp_path / "packages.zip"
+    with zipfile.ZipFile(str(archive_path), "w") as archive:
+        archive.writestr(
+            name + "/__init__.py", "from . import first, second\n"
+        )
+        archive.writestr(name + "/first.py", "from . import third\n")
+        archive.writestr(name + "/second.py", "VALUE = 2\n")
+        archive.writestr(name + "/third.py", "VALUE = 3\n")
+        archive.writestr(name + "/data.txt", "data")
+    monkeypatch.syspath_prepend(str(archive_path))
+
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        package = __import__(name)
+    finally:
+        profiler.uninstall()
+        for module_name in tuple(sys.modules):
+            if module_name.split(".")[0] == name:
+                monkeypatch.delitem(sys.modules, module_name)
+
+    # Submodules share one zipimporter which must stay untouched
+    records = [
+        (record.name, depth)
+        for record, depth in profiler.iter_records()
+    ]
+    assert records == [
+        (name, 0),
+        (name + ".first", 1),
+        (name + ".third", 2),
+        (name + ".second", 1),
+    ]
+    modules = [package.first, package.second, package.first.third]
+    loader = modules[0].__spec__.loader._loader
+    for module in modules:
+        assert module.__spec__.loader._loader is loader
+    assert "exec_module" not in vars(loader)
+    assert package.second.VALUE == 2
+    assert package.first.third.VALUE == 3
+
+    # Loader attributes are available through the proxy
+    data_path = str(archive_path / name / "data.txt")
+    assert package.__loader__.get_data(data_path) == b"data"
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Test batched mongo log handler.
+
+Collection is replaced by in-memory fake so tests are running without
+database.
+"""
+import logging
+import threading
+
+import pytest
+
+from openpype.lib.log import MongoFormatter, MongoQueueHandler
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.batches = []
+        # Blocks inserts until set
+        self.released = threading.Event()
+        self.released.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.released.wait(5)
+        self.batches.append(list(documents))
+
+    @property
+    def documents(self):
+        return [doc for batch in self.batches for doc in batch]
+
+
+@pytest.fixture
+def collection():
+    return FakeCollection()
+
+
+def _create_logger(handler):
+    handler.setFormatter(MongoFormatter())
+    logger = logging.getLogger("test_mongo_log_{}".format(id(handler)))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_records_are_batched(collection):
+    handler = MongoQueueHandler(
+        lambda: collection, batch_size=10, flush_interval=5.0
+    )
+    logger = _create_logger(handler)
+    for idx in range(25):
+        logger.info("message %s", idx, extra={"custom": idx})
+    handler.flush(5)
+
+    documents = collection.documents
+    assert [doc["message"] for doc in documents] == [
+        "message {}".format(idx) for idx in range(25)
+    ]
+    assert documents[3]["custom"] == 3
+    assert "process_id" in documents[0]
+    assert max(len(batch) for batch in collection.batches) <= 10
+    handler.close()
+
+
+def test_backpressure(collection):
+    collection.released.clear()
+    handler = MongoQueueHandler(
+        lambda: collection,
+        max_queue_size=100,
+        batch_size=1,
+        flush_interval=0.01
+    )
+    handler.block_timeout = 0.01
+    logger = _create_logger(handler)
+    for idx in range(500):
+        logger.debug("debug %s", idx)
+    for idx in range(500):
+        logger.info("info %s", idx)
+    logger.error("error")
+
+    assert handler.dropped_count > 0
+    collection.released.set()
+    handler.close()
+
+    messages = [doc["message"] for doc in collection.documents]
+    assert "error" in messages
+    # Dropped records are reported
+    dropped_messages = [msg for msg in messages if msg.startswith("Dropped")]
+    assert sum(
+        int(msg.split(" ")[1]) for msg in dropped_messages
+    ) == handler.dropped_count
+    assert (
+        len(messages) - len(dropped_messages) + handler.dropped_count
+        == 1001
+    )
+    debug_indexes = [
+        int(msg.split(" ")[1])
+        for msg in messages
+        if msg.startswith("debug")
+    ]
+    # Debug records are sampled when queue is almost full
+    assert len(debug_indexes) <= 100
+    assert max(debug_indexes) > 150
+
+
+def test_close_flushes_queue(collection):
+    handler = MongoQueueHandler(
+        lambda: collection, batch_size=100, flush_interval=60
+    )
+    logger = _create_logger(handler)
+    logger.warning("last message")
+    handler.close()
+
+    assert [doc["message"] for doc in collection.documents] == [
+        "last message"
+    ]
+    # Records after close are ignored
+    logger.warning("ignored")
+    assert len(collection.documents) == 1
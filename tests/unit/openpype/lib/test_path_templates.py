@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Test suite for string templates."""
+import copy
+
+import pytest
+
+from openpype.lib import StringTemplate, TemplatesDict, TemplateUnsolved
+from openpype.lib.path_templates import TemplatesResultDict
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{asset}/publish/{subset}"
+    "/v{version:0>3}/{asset}_{subset}<_{output}>.{frame:0>4}.{ext}"
+)
+DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "demo"},
+    "asset": "sh010",
+    "subset": "renderMain",
+    "version": 7,
+    "ext": "exr",
+    "frame": 1001,
+}
+
+
+def test_compiled_template_matches_format():
+    template = StringTemplate(TEMPLATE)
+    compiled = template.compile_strict(DATA)
+
+    frames = list(range(1001, 1011))
+    expected = []
+    for frame in frames:
+        data = dict(DATA, frame=frame)
+        expected.append(str(template.format_strict(data)))
+
+    assert compiled.fill_sequence("frame", frames) == expected
+    assert compiled.fill({"frame": 1001}) == expected[0]
+    assert compiled.result.used_values == (
+        template.format_strict(DATA).used_values
+    )
+    assert compiled.dynamic_keys == {"frame"}
+
+
+def test_compiled_template_padding():
+    template = StringTemplate(TEMPLATE)
+    compiled = template.compile(DATA)
+
+    paths = compiled.fill_sequence("frame", [999, 1000, 10000], padding=5)
+
+    assert [path.rsplit(".", 2)[1] for path in paths] == [
+        "00999", "01000", "10000"
+    ]
+
+
+def test_compiled_template_optional_dynamic_key():
+    template = StringTemplate("{subset}<.{udim}>.{ext}")
+
+    compiled = template.compile(dict(DATA, udim=1001))
+    assert compiled.fill_sequence("udim", [1001, 1002]) == [
+        "renderMain.1001.exr", "renderMain.1002.exr"
+    ]
+
+    compiled = template.compile(DATA)
+    assert compiled.dynamic_keys == set()
+    assert compiled.fill_sequence("udim", [1001]) == ["renderMain.exr"]
+
+
+def test_compiled_template_strict():
+    data = dict(DATA)
+    data.pop("asset")
+    template = StringTemplate(TEMPLATE)
+
+    assert not template.compile(data).result.solved
+    with pytest.raises(TemplateUnsolved):
+        template.compile_strict(data)
+
+
+def test_templates_dict_lazy_format():
+    solved_paths = []
+
+    class _TemplatesDict(TemplatesDict):
+        def _format_value(self, value, data):
+            solved_paths.append(str(value))
+            return super(_TemplatesDict, self)._format_value(value, data)
+
+    templates = _TemplatesDict({
+        "publish": {
+            "folder": "{root[work]}/{asset}/publish",
+            "path": "{root[work]}/{asset}/publish/{subset}.{ext}",
+            "frame_padding": 4,
+        },
+        "work": {
+            "path": "{root[work]}/{asset}/work/{task}.{ext}",
+        },
+    })
+    data = dict(DATA)
+    result = templates.format(data)
+
+    assert solved_paths == []
+    path = result["publish"]["path"]
+    assert path == "/mnt/projects/sh010/publish/renderMain.exr"
+    assert solved_paths == [templates.templates["publish"]["path"]]
+
+    # Solved values are memoized
+    assert result["publish"]["path"] is path
+    assert len(solved_paths) == 1
+    # Data were not modified
+    assert data == DATA
+
+    # Work template is missing 'task' key
+    with pytest.raises(TemplateUnsolved):
+        result["work"]["path"]
+    assert result.get_solved() == {"publish": {
+        "folder": "/mnt/projects/sh010/publish",
+        "path": path,
+        "frame_padding": 4,
+    }}
+    assert dict(result["publish"])["folder"] == (
+        "/mnt/projects/sh010/publish"
+    )
+
+
+@pytest.mark.parametrize("only_keys", [True, False])
+def test_templates_dict_lazy_format_data_snapshot(only_keys):
+    templates = TemplatesDict({
+        "publish": {
+            "path": "{root[work]}/{project[name]}/{asset}/{subset}.{ext}",
+        },
+    })
+    data = {
+        "root": {"work": "/mnt/projects"},
+        "project": {"name": "demo"},
+        "asset": "sh010",
+        "subset": "renderMain",
+        "ext": "exr",
+    }
+    result = templates.format(data, only_keys=only_keys)
+
+    # Changes of data before templates are accessed don't affect result
+    data["asset"] = "sh020"
+    data["project"]["name"] = "other"
+    data["root"] = {"work": "/other"}
+
+    assert result["publish"]["path"] == (
+        "/mnt/projects/demo/sh010/renderMain.exr"
+    )
+    assert data["project"] == {"name": "other"}
+
+
+def test_templates_dict_lazy_format_deepcopy():
+    templates = TemplatesDict({
+        "publish": {
+            "folder": "{root[work]}/{asset}/publish",
+            "path": "{root[work]}/{asset}/publish/{subset}.{ext}",
+        },
+        "work": {
+            "path": "{root[work]}/{asset}/{task}/work.ma",
+        },
+    })
+    result = templates.format({
+        "root": {"work": "/mnt/projects"},
+        "asset": "sh010",
+        "subset": "renderMain",
+        "ext": "exr",
+    })
+
+    result_copy = copy.deepcopy(result)
+
+    assert isinstance(result_copy, TemplatesResultDict)
+    assert result_copy == result
+    assert result_copy["publish"]["path"] == (
+        "/mnt/projects/sh010/publish/renderMain.exr"
+    )
+    assert result_copy["publish"].hierarchy() == ["publish"]
+    # Copy keeps strict behavior of the original
+    with pytest.raises(TemplateUnsolved):
+        result_copy["work"]["path"]
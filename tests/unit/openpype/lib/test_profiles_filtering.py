@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles filtering."""
+import random
+
+from openpype.lib.profiles_filtering import (
+    ProfileMatcher,
+    filter_profiles,
+    get_profile_matcher,
+    validate_value_by_regexes,
+    _profile_exclusion,
+    _KeyFilter,
+)
+
+PROFILES = [
+    {"hosts": [], "families": [], "task_types": [], "name": "any"},
+    {"hosts": ["maya"], "families": [], "task_types": [], "name": "maya"},
+    {
+        "hosts": ["maya", "nuke"],
+        "families": ["render.*"],
+        "task_types": [],
+        "name": "render",
+    },
+    {
+        "hosts": ["*"],
+        "families": ["review"],
+        "task_types": ["Compositing"],
+        "name": "review_comp",
+    },
+    {
+        "hosts": ["houdini"],
+        "families": ["review", "render"],
+        "task_types": ["FX", "Lighting"],
+        "name": "houdini",
+    },
+    {"hosts": ["maya"], "families": ["model"], "name": "maya_model"},
+]
+
+
+def _reference_filter(profiles, key_values):
+    """Filtering without compiled profiles."""
+    matching_profiles = None
+    highest_points = -1
+    for profile in profiles:
+        points = 0
+        scores = []
+        for key, value in key_values.items():
+            match = validate_value_by_regexes(value, profile.get(key))
+            if match == -1:
+                points = -1
+                break
+            points += match
+            scores.append(bool(match))
+
+        if points < 0 or points < highest_points:
+            continue
+        if points > highest_points:
+            matching_profiles = []
+            highest_points = points
+        matching_profiles.append((profile, scores))
+    return _profile_exclusion(matching_profiles, None)
+
+
+def test_filter_profiles():
+    def _name(key_values):
+        profile = filter_profiles(PROFILES, key_values)
+        if profile:
+            return profile["name"]
+        return None
+
+    assert _name({"hosts": "maya", "families": "model"}) == "maya_model"
+    assert _name({"hosts": "maya", "families": "renderLayer"}) == "render"
+    assert _name({"hosts": "nuke", "families": "workfile"}) == "any"
+    assert _name({
+        "hosts": "nuke",
+        "families": "review",
+        "task_types": "Compositing",
+    }) == "review_comp"
+    assert _name({
+        "hosts": "houdini",
+        "families": "render",
+        "task_types": "FX",
+    }) == "houdini"
+    assert _name({"hosts": "maya", "families": None}) == "maya"
+    assert filter_profiles([], {"hosts": "maya"}) is None
+
+
+def test_profile_matcher_matches_reference():
+    rand = random.Random(0)
+    hosts = ["maya", "nuke", "houdini", "", None, "blender"]
+    families = ["model", "render", "renderLayer", "review", "", "look"]
+    task_types = ["FX", "Lighting", "Compositing", "Modeling", ""]
+    matcher = ProfileMatcher(PROFILES)
+    for _ in range(200):
+        key_values = {
+            "hosts": rand.choice(hosts),
+            "families": rand.choice(families),
+            "task_types": rand.choice(task_types),
+        }
+        assert (
+            matcher.match(key_values)
+            is _reference_filter(PROFILES, key_values)
+        ), key_values
+
+
+def test_profile_matcher_cache():
+    profiles = list(PROFILES)
+    matcher = get_profile_matcher(profiles)
+    assert get_profile_matcher(profiles) is matcher
+
+    profiles.append({"hosts": ["blender"], "name": "blender"})
+    new_matcher = get_profile_matcher(profiles)
+    assert new_matcher is not matcher
+    assert filter_profiles(profiles, {"hosts": "blender"})["name"] == "blender"
+
+    # Change of profile in place is not hidden by cached matcher
+    matcher = get_profile_matcher(profiles)
+    profiles[-1]["hosts"].append("resolve")
+    assert get_profile_matcher(profiles) is not matcher
+    assert (
+        filter_profiles(profiles, {"hosts": "resolve"})["name"] == "blender"
+    )
+
+
+def test_key_filter_without_fullmatch():
+    key_filter = _KeyFilter(["render.*", "model"])
+    # Python 2 regexes do not have 'fullmatch', patterns without it are used
+    key_filter.regexes = [regex.pattern for regex in key_filter.regexes]
+    assert key_filter.match("renderLayer") == 1
+    assert key_filter.match("model") == 1
+    assert key_filter.match("look") == -1
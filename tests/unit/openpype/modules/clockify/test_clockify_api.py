@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Test caching and background timers of Clockify API client.
+
+Session is replaced by fake which records requests so tests are running
+without Clockify server.
+"""
+import threading
+
+import pytest
+
+from openpype.modules.clockify.clockify_api import ClockifyAPI
+from openpype.modules.clockify.constants import CLOCKIFY_ENDPOINT
+
+
+class FakeResponse(object):
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+
+    def json(self):
+        return self._data
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.requests = []
+        self.tags = [{"name": "Animation", "id": "tag-1"}]
+        self.released = threading.Event()
+        self.released.set()
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        self.released.wait(5)
+        action_url = url[len(CLOCKIFY_ENDPOINT):]
+        self.requests.append((method, action_url))
+        if action_url.endswith("/tags"):
+            if method == "POST":
+                self.tags.append({"name": json["name"], "id": "tag-new"})
+                return FakeResponse(self.tags[-1])
+            return FakeResponse(list(self.tags))
+        if action_url.endswith("in-progress=1"):
+            return FakeResponse([])
+        return FakeResponse({})
+
+
+@pytest.fixture
+def api():
+    api = ClockifyAPI(api_key="key")
+    api._workspace_id = "workspace-1"
+    api._user_id = "user-1"
+    api._session = FakeSession()
+    return api
+
+
+def test_tags_are_cached(api):
+    session = api._session
+    for _ in range(3):
+        assert api.get_tag_id("Animation") == "tag-1"
+    assert api.get_tag_id("Lighting") is None
+    assert len(session.requests) == 1
+
+    # Cache is invalidated when tag is added
+    api.add_tag("Lighting")
+    assert api.get_tag_id("Lighting") == "tag-new"
+    assert len(session.requests) == 3
+
+    # Returned values can be modified without affecting cache
+    api.get_tags().clear()
+    assert api.get_tag_id("Lighting") == "tag-new"
+
+    api.invalidate_cache("tags", "workspace-2")
+    api.get_tags()
+    assert len(session.requests) == 3
+
+    api.invalidate_cache()
+    api.get_tags()
+    assert len(session.requests) == 4
+
+
+def test_cache_expiration(api):
+    api.cache_ttl = 0
+    api.get_tags()
+    api.get_tags()
+    assert len(api._session.requests) == 2
+
+
+def test_timer_calls_are_not_blocking(api):
+    session = api._session
+    session.released.clear()
+
+    start_future = api.start_time_entry_async("asset/task", "project-1")
+    finish_future = api.finish_time_entry_async()
+    assert not start_future.done()
+    assert not session.requests
+
+    session.released.set()
+    assert start_future.result(5) is True
+    finish_future.result(5)
+    # Calls are processed in order of submission
+    assert [method for method, _ in session.requests] == ["GET", "POST", "GET"]
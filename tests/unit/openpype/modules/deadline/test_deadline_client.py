@@ -0,0 +1,93 @@
+"""Test Deadline Web Service client against local fake Web Service.
+
+    Tests are running offline, the fake Web Service is started on localhost
+    for each test.
+"""
+import pytest
+
+from openpype.modules.deadline.deadline_client import (
+    DeadlineClient,
+    create_session,
+    JOB_IDS_CHUNK_SIZE,
+)
+from openpype.modules.deadline.deadline_module import DeadlineWebserviceError
+from tests.lib.fake_deadline_webservice import FakeDeadlineWebService
+
+
+@pytest.fixture
+def webservice():
+    with FakeDeadlineWebService(pools=["none", "local"]) as fake:
+        yield fake
+
+
+@pytest.fixture
+def client(webservice):
+    session = create_session(backoff_factor=0)
+    return DeadlineClient(webservice.url, session=session)
+
+
+def test_get_jobs_batched(webservice, client):
+    job_ids = [
+        webservice.add_job(frames="{}-{}".format(idx, idx + 1))
+        for idx in range(JOB_IDS_CHUNK_SIZE + 5)
+    ]
+    jobs = client.get_jobs(job_ids + job_ids[:3])
+
+    assert [job["_id"] for job in jobs] == job_ids
+    # Duplicated ids are skipped and ids are queried in chunks
+    assert len(webservice.requests) == 2
+
+
+def test_connections_are_reused(webservice, client):
+    for _ in range(5):
+        client.get_pools()
+
+    assert len(webservice.requests) == 5
+    assert len(webservice.client_addresses) == 1
+
+
+def test_get_retries_server_errors(webservice, client):
+    job_id = webservice.add_job(frames="1-5")
+    webservice.failures.extend([503, 503])
+
+    job = client.get_job(job_id)
+
+    assert job["Props"]["Frames"] == "1-5"
+    assert len(webservice.requests) == 3
+
+
+def test_get_raises_after_failed_retries(webservice, client):
+    webservice.failures.extend([500])
+
+    with pytest.raises(DeadlineWebserviceError):
+        client.get_pools()
+
+
+def test_submit_is_not_retried(webservice, client):
+    webservice.failures.extend([503])
+
+    responses = client.submit_jobs([{"JobInfo": {"Frames": "1"}}])
+
+    assert responses[0].status_code == 503
+    assert len(webservice.requests) == 1
+    assert not webservice.jobs
+
+
+def test_submit_jobs_keeps_order(webservice, client):
+    payloads = [
+        {"JobInfo": {"Frames": str(idx)}, "PluginInfo": {}, "AuxFiles": []}
+        for idx in range(10)
+    ]
+    responses = client.submit_jobs(payloads, max_workers=4)
+
+    frames = [response.json()["Props"]["Frames"] for response in responses]
+    assert frames == [str(idx) for idx in range(10)]
+    assert len(webservice.jobs) == 10
+
+
+def test_connection_error():
+    client = DeadlineClient(
+        "http://127.0.0.1:1", session=create_session(max_retries=0)
+    )
+    with pytest.raises(DeadlineWebserviceError):
+        client.get_pools()
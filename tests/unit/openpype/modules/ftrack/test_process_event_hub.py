@@ -0,0 +1,448 @@
+# -*- coding: utf-8 -*-
+"""Test bulk acknowledgment, metrics and workers of ftrack ProcessEventHub.
+
+Events collection is replaced by fake which records database operations so
+tests are running without Mongo and ftrack servers.
+"""
+import sys
+import time
+import types
+import random
+import logging
+import datetime
+import threading
+
+import pymongo
+import pytest
+import ftrack_api.event.base
+
+# Event server imports module by name used by loaded OpenPype modules which
+#   requires connection to Mongo
+if "openpype_modules.ftrack.lib" not in sys.modules:
+    _ftrack_lib = types.ModuleType("openpype_modules.ftrack.lib")
+    _ftrack_lib.get_ftrack_event_mongo_info = lambda: ("test", "events")
+    sys.modules["openpype_modules.ftrack.lib"] = _ftrack_lib
+
+from openpype.modules.ftrack.ftrack_server.lib import (  # noqa: E402
+    PartitionedEventExecutor,
+    ProcessEventHub,
+    WorkerEventHub,
+)
+
+
+class FakeChangeStream(object):
+    def __init__(self, changes, released):
+        self._changes = changes
+        self._released = released
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def __iter__(self):
+        for change in self._changes:
+            yield change
+        # Change stream is blocking until new change happens
+        self._released.wait(5)
+
+
+class FakeCollection(object):
+    def __init__(self, changes=None):
+        self.updates = []
+        self.deletes = []
+        self.changes = changes
+        self.watch_released = threading.Event()
+
+    def update_many(self, query, update):
+        self.updates.append((query, update))
+
+    def delete_many(self, query):
+        self.deletes.append(query)
+
+    def watch(self, pipeline):
+        if self.changes is None:
+            raise pymongo.errors.OperationFailure(
+                "The $changeStream stage is only supported on replica sets"
+            )
+        return FakeChangeStream(self.changes, self.watch_released)
+
+    def updated_ids(self):
+        return [
+            mongo_id
+            for query, _ in self.updates
+            for mongo_id in query["_id"]["$in"]
+        ]
+
+
+def _create_event(mongo_id):
+    event = ftrack_api.event.base.Event(topic="ftrack.update", data={})
+    event["data"]["_event_mongo_id"] = mongo_id
+    return event
+
+
+@pytest.fixture
+def hub():
+    hub = ProcessEventHub(
+        "https://test.ftrackapp.com", "user", "key", sock=None
+    )
+    hub.dbcon = FakeCollection()
+    return hub
+
+
+def test_ack_flush_on_buffer_size(hub):
+    hub.ack_buffer_size = 3
+    # Queued event means that buffer is not flushed because queue drained
+    hub._event_queue.put(_create_event("queued"))
+
+    hub._mark_processed(_create_event(1))
+    hub._mark_processed(_create_event(2))
+    assert hub.dbcon.updates == []
+
+    hub._mark_processed(_create_event(3))
+    assert len(hub.dbcon.updates) == 1
+    query, update = hub.dbcon.updates[0]
+    assert query == {"_id": {"$in": [1, 2, 3]}}
+    assert update == {"$set": {"pype_data.is_processed": True}}
+
+
+def test_ack_flush_on_interval(hub):
+    hub._event_queue.put(_create_event("queued"))
+
+    hub._mark_processed(_create_event(1))
+    assert hub.dbcon.updates == []
+
+    hub._last_ack_flush = time.time() - hub.ack_flush_interval - 1
+    hub._flush_processed()
+    assert hub.dbcon.updated_ids() == [1]
+
+    # Nothing to flush
+    hub._last_ack_flush = time.time() - hub.ack_flush_interval - 1
+    hub._flush_processed()
+    assert len(hub.dbcon.updates) == 1
+
+
+def test_ack_flush_when_queue_drained(hub):
+    hub._dispatched_ids.update({1, 2})
+    hub._mark_processed(_create_event(1))
+    hub._mark_processed(_create_event(2))
+
+    assert hub.dbcon.updated_ids() == [1, 2]
+    assert not hub._dispatched_ids
+
+
+def test_forced_ack_flush(hub):
+    hub._event_queue.put(_create_event("queued"))
+    hub._mark_processed(_create_event(1))
+    assert hub.dbcon.updates == []
+
+    hub._flush_processed(force=True)
+    assert hub.dbcon.updated_ids() == [1]
+
+
+def test_cleanup_runs_on_interval(hub):
+    hub._cleanup_processed_events()
+    hub._cleanup_processed_events()
+    assert len(hub.dbcon.deletes) == 1
+
+    query = hub.dbcon.deletes[0]
+    assert query["pype_data.is_processed"] is True
+    expected_date = datetime.datetime.now() - datetime.timedelta(
+        days=hub.cleanup_older_than_days
+    )
+    difference = expected_date - query["pype_data.stored"]["$lte"]
+    assert abs(difference.total_seconds()) < 60
+
+    hub._last_cleanup = time.time() - hub.cleanup_interval - 1
+    hub._cleanup_processed_events()
+    assert len(hub.dbcon.deletes) == 2
+
+
+def test_change_stream_not_available(hub):
+    hub._start_change_stream()
+    hub._change_stream_thread.join(5)
+
+    assert not hub._change_stream_thread.is_alive()
+    assert not hub._change_stream_enabled
+    assert ["Events loading", "Polling (0.5s)"] in hub.get_status_info()
+
+    # Thread is not started again
+    thread = hub._change_stream_thread
+    hub._start_change_stream()
+    assert hub._change_stream_thread is thread
+
+
+def test_change_stream_wakes_up_loading(hub):
+    hub.dbcon = FakeCollection(changes=[{"operationType": "insert"}])
+    hub._start_change_stream()
+    try:
+        assert hub._new_events_signal.wait(5)
+        assert hub._change_stream_enabled
+        assert ["Events loading", "Change stream"] in hub.get_status_info()
+
+        started = time.time()
+        hub._wait_for_new_events()
+        # Signal was already set so waiting returned immediately
+        assert time.time() - started < hub.poll_interval
+        assert not hub._new_events_signal.is_set()
+
+    finally:
+        hub.dbcon.watch_released.set()
+        hub._change_stream_thread.join(5)
+
+    assert not hub._change_stream_enabled
+
+
+def test_status_counters(hub):
+    hub.ack_buffer_size = 10
+    hub._event_queue.put(_create_event("queued"))
+    hub._event_stored_times[1] = (
+        datetime.datetime.utcnow() - datetime.timedelta(seconds=30)
+    )
+
+    hub._mark_processed(_create_event(1))
+    hub._mark_processed(_create_event(2))
+    # Event without mongo id is counted but not acknowledged
+    hub._mark_processed(ftrack_api.event.base.Event(topic="ftrack.update"))
+    # Handled before metrics window
+    hub._handled_timestamps[0] -= hub.metrics_window + 1
+
+    status = dict(hub.get_status_info())
+    assert status["Events handled"] == "3"
+    assert status["Events/s (last 60s)"] == "{:.2f}".format(2 / 60.0)
+    assert status["Queued events"] == "1"
+    assert status["Pending acknowledgments"] == "2"
+    assert status["Execution mode"] == "Serial"
+    assert 30 <= float(status["Queue lag"].rstrip("s")) < 90
+
+
+def test_executor_keeps_order_in_partition():
+    processed = {}
+    lock = threading.Lock()
+
+    def callback(event):
+        partition_key, idx = event
+        # Give other workers chance to take over
+        time.sleep(random.random() * 0.002)
+        with lock:
+            processed.setdefault(partition_key, []).append(idx)
+
+    executor = PartitionedEventExecutor(
+        4, callback, logging.getLogger(__name__)
+    )
+    partition_keys = ["project-{}".format(idx) for idx in range(5)]
+    expected = {key: list(range(20)) for key in partition_keys}
+    for idx in range(20):
+        for partition_key in partition_keys:
+            executor.submit(partition_key, (partition_key, idx))
+
+    assert executor.wait_until_idle(10)
+    executor.shutdown()
+    assert processed == expected
+    assert executor.pending_count == 0
+    assert executor.get_partition_depths() == {}
+
+
+def test_executor_handles_partitions_concurrently():
+    blocked_started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def callback(event):
+        if event == "blocked":
+            blocked_started.set()
+            release.wait(5)
+        processed.append(event)
+
+    executor = PartitionedEventExecutor(
+        2, callback, logging.getLogger(__name__)
+    )
+    try:
+        executor.submit("project-a", "blocked")
+        assert blocked_started.wait(5)
+        executor.submit("project-a", "after blocked")
+        executor.submit("project-b", "other project")
+
+        # Other partition is not blocked by slow handler
+        assert not executor.wait_until_idle(0.5)
+        assert processed == ["other project"]
+        assert executor.get_partition_depths() == {"project-a": 2}
+
+    finally:
+        release.set()
+    assert executor.wait_until_idle(5)
+    executor.shutdown()
+    assert processed == ["other project", "blocked", "after blocked"]
+
+
+class FakeHandler(object):
+    concurrent_safe = False
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _launch(self, event):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self._lock:
+            self.running -= 1
+
+
+class FakeConcurrentHandler(FakeHandler):
+    concurrent_safe = True
+
+
+def _call_concurrently(callback, count):
+    threads = [
+        threading.Thread(target=callback, args=(_create_event(idx), ))
+        for idx in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+
+def test_stateful_handlers_are_serialized(hub):
+    handler = FakeHandler()
+    _call_concurrently(hub._wrap_timed_callback(handler._launch), 3)
+    assert handler.max_running == 1
+
+    handler = FakeConcurrentHandler()
+    _call_concurrently(hub._wrap_timed_callback(handler._launch), 3)
+    assert handler.max_running > 1
+
+
+class FakeWorkerHandler(object):
+    def __init__(self, launch_func):
+        self._launch_func = launch_func
+
+    def _launch(self, event):
+        self._launch_func(self, event)
+
+
+class FakeWorkerSession(object):
+    """Session of worker with own instance of handler."""
+
+    def __init__(self, main_hub, launch_func):
+        self.closed = False
+        self.event_hub = WorkerEventHub(
+            "https://test.ftrackapp.com", "user", "key", main_hub=main_hub
+        )
+        self.handler = FakeWorkerHandler(launch_func)
+        self.event_hub.subscribe("topic=ftrack.update", self.handler._launch)
+
+    def close(self):
+        self.closed = True
+
+
+def _create_project_event(mongo_id, project_id):
+    event = ftrack_api.event.base.Event(
+        topic="ftrack.update",
+        data={"entities": [{"entityType": "show", "entityId": project_id}]}
+    )
+    event["data"]["_event_mongo_id"] = mongo_id
+    return event
+
+
+def test_worker_sessions_handle_projects_concurrently(hub):
+    # Both handlers must be running at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    handled = []
+
+    def launch_func(handler, event):
+        barrier.wait()
+        handled.append((handler, event["data"]["_event_mongo_id"]))
+
+    sessions = []
+
+    def create_worker_session():
+        session = FakeWorkerSession(hub, launch_func)
+        sessions.append(session)
+        return session
+
+    hub.worker_count = 2
+    hub.set_worker_session_factory(create_worker_session)
+    hub._start_executor()
+    assert ["Execution mode", "Concurrent (2 workers, session per worker)"] \
+        in hub.get_status_info()
+
+    hub._executor.submit("project-a", _create_project_event(1, "project-a"))
+    hub._executor.submit("project-b", _create_project_event(2, "project-b"))
+    assert hub._executor.wait_until_idle(10)
+    hub._stop_executor()
+
+    assert not barrier.broken
+    assert sorted(mongo_id for _, mongo_id in handled) == [1, 2]
+    # Each event was handled by handler of different worker session
+    assert len(sessions) == 2
+    assert {handler for handler, _ in handled} == {
+        session.handler for session in sessions
+    }
+    assert all(session.closed for session in sessions)
+    assert sorted(hub._processed_ids) == [1, 2]
+    assert hub._handler_stats["FakeWorkerHandler._launch"]["count"] == 2
+
+
+def test_worker_hub_publishes_with_processor_hub(hub, monkeypatch):
+    published = []
+    monkeypatch.setattr(
+        hub, "_publish",
+        lambda event, **kwargs: published.append(event["topic"])
+    )
+    worker_hub = WorkerEventHub(
+        "https://test.ftrackapp.com", "user", "key", main_hub=hub
+    )
+    worker_hub.publish(ftrack_api.event.base.Event(topic="openpype.test"))
+    assert published == ["openpype.test"]
+
+    # Synchronous events are handled only by worker hub subscribers
+    worker_hub.subscribe("topic=openpype.sync", lambda event: "handled")
+    results = worker_hub.publish(
+        ftrack_api.event.base.Event(topic="openpype.sync"),
+        synchronous=True
+    )
+    assert results == ["handled"]
+    assert published == ["openpype.test"]
+
+
+def test_handler_time_budget(hub):
+    hub.handler_time_budget = 0.01
+
+    def fast_callback(event):
+        pass
+
+    def slow_callback(event):
+        time.sleep(0.05)
+
+    fast_callback = hub._wrap_timed_callback(fast_callback)
+    slow_callback = hub._wrap_timed_callback(slow_callback)
+    event = ftrack_api.event.base.Event(
+        topic="ftrack.update",
+        data={"entities": [{"entityType": "show", "entityId": "project-1"}]}
+    )
+    fast_callback(event)
+    slow_callback(event)
+    slow_callback(event)
+
+    fast_stats = hub._handler_stats["fast_callback"]
+    slow_stats = hub._handler_stats["slow_callback"]
+    assert fast_stats["count"] == 1
+    assert fast_stats["slow"] == 0
+    assert slow_stats["count"] == 2
+    assert slow_stats["slow"] == 2
+    assert slow_stats["max"] >= 0.05
+
+    warnings = list(hub._slow_handler_warnings)
+    assert len(warnings) == 2
+    assert "slow_callback took" in warnings[0]
+    assert "\"ftrack.update\" [project-1]" in warnings[0]
+
+    status = dict(hub.get_status_info())
+    assert status["Handler time budget"] == "0.01s"
+    assert status["Slowest handlers"].startswith("slow_callback")
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Test bulk sync of Kitsu data to OpenPype.
+
+Requests of gazu are sent to local Zou stub server which counts received
+requests.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from bson.objectid import ObjectId
+
+gazu = pytest.importorskip("gazu")
+
+from openpype.modules.kitsu.utils import update_op_with_zou  # noqa: E402
+
+PROJECT = {"id": "project-1", "name": "test_project", "type": "Project"}
+SHOT_COUNT = 50
+
+
+def _create_zou_data():
+    sequence = {
+        "id": "sequence-1",
+        "name": "sq01",
+        "type": "Sequence",
+        "parent_id": None,
+    }
+    shots = [
+        {
+            "id": "shot-{}".format(idx),
+            "name": "sh{:03d}".format(idx),
+            "type": "Shot",
+            "parent_id": sequence["id"],
+            "entity_type_id": "entity-type-shot",
+            "nb_frames": 10,
+            "data": {},
+        }
+        for idx in range(SHOT_COUNT)
+    ]
+    tasks = [
+        {
+            "id": "task-{}-{}".format(shot["id"], task_type_id),
+            "name": "main",
+            "entity_id": shot["id"],
+            "task_type_id": task_type_id,
+            "task_status_id": "status-1",
+            "assignees": ["person-1"],
+        }
+        for shot in shots
+        for task_type_id in ("task-type-1", "task-type-2")
+    ]
+    return {
+        "/api/data/projects/project-1/assets": [],
+        "/api/data/projects/project-1/asset-types": [],
+        "/api/data/projects/project-1/episodes": [],
+        "/api/data/projects/project-1/sequences": [sequence],
+        "/api/data/projects/project-1/shots": shots,
+        "/api/data/tasks": tasks,
+        "/api/data/task-types": [
+            {"id": "task-type-1", "name": "Animation"},
+            {"id": "task-type-2", "name": "Lighting"},
+        ],
+        "/api/data/task-status": [{"id": "status-1", "name": "Todo"}],
+        "/api/data/entity-types": [
+            {"id": "entity-type-shot", "name": "Shot"}
+        ],
+        "/api/data/persons": [{"id": "person-1", "first_name": "Artist"}],
+    }
+
+
+class ZouStubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        path, _, query = self.path.partition("?")
+        with server.lock:
+            server.requests.append((path, query))
+
+        if path not in server.routes:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = json.dumps(server.routes[path]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+@pytest.fixture
+def zou_server():
+    server = HTTPServer(("127.0.0.1", 0), ZouStubHandler)
+    server.routes = _create_zou_data()
+    server.requests = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    previous_host = gazu.client.get_host()
+    gazu.client.set_host(
+        "http://127.0.0.1:{}/api".format(server.server_address[1])
+    )
+    yield server
+
+    gazu.client.set_host(previous_host)
+    server.shutdown()
+    server.server_close()
+
+
+def test_project_data_is_fetched_in_bulk(zou_server):
+    project_data = update_op_with_zou.fetch_kitsu_project_data(PROJECT)
+    assert len(project_data["shots"]) == SHOT_COUNT
+
+    # Number of requests does not depend on number of entities
+    assert len(zou_server.requests) == 10
+    assert ("/api/data/tasks", "project_id=project-1") in zou_server.requests
+
+    tasks_by_entity_id = update_op_with_zou.get_full_tasks_by_entity_id(
+        PROJECT, project_data
+    )
+    tasks = tasks_by_entity_id["shot-0"]
+    assert [task["task_type"]["name"] for task in tasks] == [
+        "Animation", "Lighting"
+    ]
+    task = tasks[0]
+    assert task["entity"]["name"] == "sh000"
+    assert task["entity_type"]["name"] == "Shot"
+    assert task["sequence"]["name"] == "sq01"
+    assert task["task_status"]["name"] == "Todo"
+    assert task["assignees"][0]["first_name"] == "Artist"
+    assert task["project"] is PROJECT
+
+
+def test_update_assets_with_prefetched_tasks(zou_server):
+    project_data = update_op_with_zou.fetch_kitsu_project_data(PROJECT)
+    tasks_by_entity_id = update_op_with_zou.get_full_tasks_by_entity_id(
+        PROJECT, project_data
+    )
+    request_count = len(zou_server.requests)
+
+    project_doc = {
+        "_id": ObjectId(),
+        "name": PROJECT["name"],
+        "data": {
+            "frameStart": 1001,
+            "fps": 25,
+            "resolutionWidth": 1920,
+            "resolutionHeight": 1080,
+            "pixelAspect": 1.0,
+            "handleStart": 0,
+            "handleEnd": 0,
+            "clipIn": 1,
+            "clipOut": 1,
+        },
+    }
+    entities = project_data["sequences"] + project_data["shots"]
+    asset_doc_ids = {}
+    for entity in entities:
+        asset_doc = update_op_with_zou.create_op_asset(entity)
+        asset_doc["_id"] = ObjectId()
+        asset_doc_ids[entity["id"]] = asset_doc
+
+    root_folder_ids = {"Assets": ObjectId(), "Shots": ObjectId()}
+    updates = dict(
+        update_op_with_zou.update_op_assets(
+            None,
+            {"resolution": "1920x1080"},
+            project_doc,
+            entities,
+            asset_doc_ids,
+            tasks_by_entity_id,
+            root_folder_ids,
+        )
+    )
+    # All data were prefetched
+    assert len(zou_server.requests) == request_count
+    assert len(updates) == SHOT_COUNT + 1
+
+    shot_data = updates[asset_doc_ids["shot-0"]["_id"]]["$set"]
+    assert shot_data["name"] == "sq01_sh000"
+    assert set(shot_data["data"]["tasks"]) == {"Animation", "Lighting"}
+    assert shot_data["data"]["parents"] == ["Shots", "sq01"]
+
+    sequence_data = updates[asset_doc_ids["sequence-1"]["_id"]]["$set"]
+    assert sequence_data["data"]["visualParent"] == root_folder_ids["Shots"]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Test queries of Log Viewer.
+
+Logs collection is replaced by fake which records queries so tests are
+running without database.
+"""
+import datetime
+
+from openpype.modules.log_viewer.lib import (
+    LOG_INDEXES,
+    ensure_log_indexes,
+    get_logs_filter,
+    query_processes,
+    query_process_logs,
+)
+
+
+class FakeCursor(list):
+    def __init__(self, docs, calls):
+        super(FakeCursor, self).__init__(docs)
+        self.calls = calls
+
+    def sort(self, *args):
+        self.calls.append(("sort", args))
+        return self
+
+    def skip(self, value):
+        self.calls.append(("skip", value))
+        return self
+
+    def limit(self, value):
+        self.calls.append(("limit", value))
+        return self
+
+
+class FakeCollection(object):
+    def __init__(self, docs=None, indexes=None):
+        self.docs = docs or []
+        self.indexes = dict.fromkeys(indexes or ["_id_"])
+        self.calls = []
+
+    def index_information(self):
+        return dict(self.indexes)
+
+    def create_index(self, keys, name, **kwargs):
+        self.indexes[name] = keys
+
+    def aggregate(self, pipeline, **kwargs):
+        self.calls.append(("aggregate", pipeline))
+        return [dict(doc) for doc in self.docs]
+
+    def find(self, query_filter, projection=None):
+        self.calls.append(("find", query_filter, projection))
+        return FakeCursor(self.docs, self.calls)
+
+
+def test_logs_filter():
+    started_from = datetime.datetime(2023, 1, 1)
+    query_filter = get_logs_filter(
+        started_from=started_from,
+        usernames={"user"},
+        hostnames=[]
+    )
+    assert query_filter == {
+        "process_id": {"$nin": [None, ""]},
+        "timestamp": {"$gte": started_from},
+        "username": {"$in": ["user"]},
+        "hostname": {"$in": []},
+    }
+    assert set(get_logs_filter()) == {"process_id"}
+
+
+def test_query_processes():
+    collection = FakeCollection([{"_id": "process", "username": "user"}])
+    query_filter = get_logs_filter(usernames=["user"])
+    processes = query_processes(
+        collection, query_filter, skip=500, limit=500
+    )
+    assert processes == [{"process_id": "process", "username": "user"}]
+
+    pipeline = collection.calls[0][1]
+    # Filters are applied before grouping
+    assert pipeline[0] == {"$match": query_filter}
+    assert pipeline[1]["$group"]["_id"] == "$process_id"
+    assert pipeline[1]["$group"]["started"] == {"$min": "$timestamp"}
+    assert pipeline[-2:] == [{"$skip": 500}, {"$limit": 500}]
+
+
+def test_query_process_logs():
+    collection = FakeCollection([{"message": "message"}])
+    assert query_process_logs(collection, "process", limit=10) == [
+        {"message": "message"}
+    ]
+    _, query_filter, projection = collection.calls[0]
+    assert query_filter == {"process_id": "process"}
+    assert projection["_id"] is False
+    assert ("limit", 10) in collection.calls
+
+
+def test_ensure_indexes():
+    collection = FakeCollection(indexes=["_id_", "timestamp"])
+    ensure_log_indexes(collection)
+    assert set(collection.indexes) == {"_id_"} | {
+        name for name, _ in LOG_INDEXES
+    }
+    # Existing index is not recreated
+    assert collection.indexes["timestamp"] is None
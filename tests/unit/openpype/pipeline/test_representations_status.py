@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Test batched status of loaded representations.
+
+Database queries are replaced by in-memory fakes so tests are running
+without database.
+"""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.pipeline.load import utils
+
+PROJECT_NAME = "test_project"
+
+
+class FakeDatabase(object):
+    def __init__(self):
+        self.queries = []
+        self.subset_id = ObjectId()
+        self.old_version = {
+            "_id": ObjectId(), "parent": self.subset_id, "type": "version"
+        }
+        self.last_version = {
+            "_id": ObjectId(), "parent": self.subset_id, "type": "version"
+        }
+        self.hero_version = {
+            "_id": ObjectId(), "parent": self.subset_id, "type": "hero_version"
+        }
+        self.versions = [
+            self.old_version, self.last_version, self.hero_version
+        ]
+        self.representations = []
+        for version in self.versions:
+            self.representations.append({
+                "_id": ObjectId(),
+                "parent": version["_id"],
+                "name": "ma",
+                "context": {},
+                "data": {"path": "/missing/{}.ma".format(version["type"])},
+            })
+
+    def get_representations(self, project_name, representation_ids, fields):
+        self.queries.append("representations")
+        repre_ids = {str(repre_id) for repre_id in representation_ids}
+        return [
+            repre for repre in self.representations
+            if str(repre["_id"]) in repre_ids
+        ]
+
+    def get_versions(self, project_name, version_ids, hero, fields):
+        self.queries.append("versions")
+        version_ids = set(version_ids)
+        return [
+            version for version in self.versions
+            if version["_id"] in version_ids
+        ]
+
+    def get_last_versions(self, project_name, subset_ids, fields):
+        self.queries.append("last_versions")
+        return {
+            subset_id: self.last_version
+            for subset_id in subset_ids
+            if subset_id == self.subset_id
+        }
+
+    def get_representations_parents(self, project_name, representations):
+        self.queries.append("parents")
+        return {
+            repre["_id"]: (None, None, None, None)
+            for repre in representations
+        }
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    for name in (
+        "get_representations",
+        "get_versions",
+        "get_last_versions",
+        "get_representations_parents",
+    ):
+        monkeypatch.setattr(utils, name, getattr(database, name))
+    monkeypatch.setattr(
+        utils.RepresentationsStatusCache,
+        "_get_root",
+        lambda self, project_name: {"work": "/root"}
+    )
+    return database
+
+
+def _container(repre_id):
+    return {"objectName": str(repre_id), "representation": str(repre_id)}
+
+
+def test_filter_containers(database):
+    old_repre, last_repre, hero_repre = database.representations
+    containers = [
+        _container(old_repre["_id"]),
+        _container(last_repre["_id"]),
+        _container(hero_repre["_id"]),
+        _container(ObjectId()),
+        {"objectName": "invalid", "representation": ""},
+    ]
+    # Add more containers of the same representations
+    containers.extend(_container(old_repre["_id"]) for _ in range(10))
+
+    cache = utils.RepresentationsStatusCache()
+    utils._REPRESENTATIONS_STATUS_CACHE = cache
+    try:
+        result = utils.filter_containers(containers, PROJECT_NAME)
+        assert len(result.outdated) == 11
+        assert [c["objectName"] for c in result.latest] == [
+            str(last_repre["_id"]), str(hero_repre["_id"])
+        ]
+        assert len(result.not_found) == 1
+        assert len(result.invalid) == 1
+        assert database.queries == [
+            "representations", "versions", "last_versions"
+        ]
+
+        # Results are cached until invalidated
+        utils.filter_containers(containers, PROJECT_NAME)
+        assert len(database.queries) == 3
+
+        utils.invalidate_representations_status_cache(PROJECT_NAME)
+        utils.filter_containers(containers, PROJECT_NAME)
+        assert len(database.queries) == 6
+    finally:
+        utils._REPRESENTATIONS_STATUS_CACHE = None
+
+
+def test_paths(database):
+    template_repre, data_repre, _ = database.representations
+    template_repre["data"]["template"] = "{root[work]}/{representation}"
+    template_repre["context"] = {"representation": "ma"}
+    missing_id = str(ObjectId())
+
+    cache = utils.RepresentationsStatusCache()
+    paths = cache.get_paths(
+        PROJECT_NAME,
+        [template_repre["_id"], data_repre["_id"], missing_id]
+    )
+    assert paths == {
+        str(template_repre["_id"]): "/root/ma",
+        str(data_repre["_id"]): None,
+        missing_id: None,
+    }
+    # Parents are queried only for representation without template
+    assert database.queries.count("parents") == 1
+    cache.get_paths(PROJECT_NAME, [data_repre["_id"]])
+    assert database.queries.count("parents") == 1
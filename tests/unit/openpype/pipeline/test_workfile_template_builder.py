@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Test preparation of load placeholders in workfile template builder.
+
+Database queries and loading are replaced by in-memory fakes so tests are
+running without database and host.
+"""
+import sys
+import threading
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.pipeline.workfile import workfile_template_builder as builder
+from openpype.pipeline.workfile.workfile_template_builder import (
+    PlaceholderPlugin,
+    PlaceholderLoadMixin,
+    LoadPlaceholderItem,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class FakeLoader(object):
+    pass
+
+
+class FakeBuilder(object):
+    project_name = PROJECT_NAME
+    current_asset_doc = {"_id": ObjectId(), "name": "sh010"}
+    linked_asset_docs = []
+
+    def __init__(self):
+        self._shared_populate_data = {}
+        self.loaders_requests = 0
+
+    def get_loaders_by_name(self):
+        self.loaders_requests += 1
+        return {"FakeLoader": FakeLoader}
+
+    def get_shared_populate_data(self, key):
+        return self._shared_populate_data.get(key)
+
+    def set_shared_populate_data(self, key, value):
+        self._shared_populate_data[key] = value
+
+    def clear_shared_populate_data(self):
+        self._shared_populate_data = {}
+
+
+class FakeLoadPlugin(PlaceholderPlugin, PlaceholderLoadMixin):
+    identifier = "fake.load"
+
+    def create_placeholder(self, placeholder_data):
+        pass
+
+    def update_placeholder(self, placeholder_item, placeholder_data):
+        pass
+
+    def collect_placeholders(self):
+        return []
+
+    def populate_placeholder(self, placeholder):
+        self.populate_load_placeholder(placeholder)
+
+
+class FakeDatabase(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queries = []
+        self.context_queries = 0
+        self.loaded = []
+        self.representations = []
+        for asset_name in ("char", "prop"):
+            for version in (1, 2):
+                self.representations.append({
+                    "_id": ObjectId(),
+                    "name": "ma",
+                    "context": {
+                        "asset": asset_name,
+                        "subset": "modelMain",
+                        "version": version,
+                    },
+                })
+
+    def get_representations(self, project_name, context_filters):
+        with self.lock:
+            self.queries.append(context_filters)
+        asset_regex = context_filters["asset"][0]
+        return [
+            repre_doc
+            for repre_doc in self.representations
+            if asset_regex.match(repre_doc["context"]["asset"])
+        ]
+
+    def get_contexts_for_repre_docs(self, project_name, repre_docs):
+        self.context_queries += 1
+        return {
+            repre_doc["_id"]: {"representation": repre_doc}
+            for repre_doc in repre_docs
+        }
+
+    def load_with_repre_context(self, loader, repre_context, options=None):
+        self.loaded.append(repre_context["representation"]["_id"])
+        return repre_context
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    monkeypatch.setattr(builder, "AYON_SERVER_ENABLED", False)
+    for attr_name in (
+        "get_representations",
+        "get_contexts_for_repre_docs",
+        "load_with_repre_context",
+    ):
+        monkeypatch.setattr(builder, attr_name, getattr(database, attr_name))
+    return database
+
+
+def _create_placeholders(plugin, asset_regexes, loader="FakeLoader"):
+    placeholders = []
+    for idx, asset_regex in enumerate(asset_regexes):
+        placeholders.append(LoadPlaceholderItem(
+            "placeholder{}".format(idx),
+            {
+                "builder_type": "all_assets",
+                "asset": asset_regex,
+                "subset": "model",
+                "hierarchy": "",
+                "family": "model",
+                "representation": "ma",
+                "loader": loader,
+                "loader_args": "",
+                "order": 0,
+            },
+            plugin
+        ))
+    return placeholders
+
+
+def test_placeholders_are_prepared_in_batch(database):
+    plugin = FakeLoadPlugin(FakeBuilder())
+    placeholders = _create_placeholders(
+        plugin, ["char", "prop", "char", ".*"] * 10
+    )
+    plugin.prepare_load_placeholders(placeholders)
+    for placeholder in placeholders:
+        plugin.populate_placeholder(placeholder)
+
+    # Unique queries only
+    assert len(database.queries) == 3
+    assert database.context_queries == 1
+    assert plugin.builder.loaders_requests == 1
+
+    last_versions = [
+        repre_doc["_id"]
+        for repre_doc in database.representations
+        if repre_doc["context"]["version"] == 2
+    ]
+    char_id, prop_id = last_versions
+    assert database.loaded[:5] == [
+        char_id, prop_id, char_id, char_id, prop_id
+    ]
+    assert len(database.loaded) == 50
+
+
+def test_placeholders_are_prepared_without_executor(database, monkeypatch):
+    # Import of 'concurrent.futures' fails like in python 2 hosts
+    monkeypatch.setitem(sys.modules, "concurrent.futures", None)
+    plugin = FakeLoadPlugin(FakeBuilder())
+    placeholders = _create_placeholders(plugin, ["char", "prop", ".*"])
+    plugin.prepare_load_placeholders(placeholders)
+    for placeholder in placeholders:
+        plugin.populate_placeholder(placeholder)
+
+    assert len(database.queries) == 3
+    assert len(database.loaded) == 4
+
+
+def test_not_prepared_placeholder(database):
+    plugin = FakeLoadPlugin(FakeBuilder())
+    placeholder = _create_placeholders(plugin, ["prop"])[0]
+    ignored_ids = {
+        str(repre_doc["_id"])
+        for repre_doc in database.representations
+    }
+    plugin.populate_load_placeholder(placeholder, ignored_ids)
+    assert len(database.queries) == 1
+    assert database.loaded == []
+
+
+def test_missing_loader_fails_placeholder(database):
+    plugin = FakeLoadPlugin(FakeBuilder())
+    placeholder = _create_placeholders(plugin, ["char"], "Missing")[0]
+    plugin.prepare_load_placeholders([placeholder])
+    plugin.populate_placeholder(placeholder)
+    assert database.loaded == []
+    assert len(placeholder.get_errors()) == 1
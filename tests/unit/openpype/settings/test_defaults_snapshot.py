@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Test precompiled snapshot of default settings."""
+import os
+import json
+import shutil
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.defaults_snapshot import load_snapshot
+
+
+@pytest.fixture
+def defaults_dir(tmp_path):
+    dirpath = tmp_path / "defaults"
+    shutil.copytree(lib.DEFAULTS_DIR, str(dirpath))
+    return str(dirpath)
+
+
+def _set_mtime(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+
+def _set_sources_mtime(defaults_dir, mtime):
+    for base, _, filenames in os.walk(defaults_dir):
+        _set_mtime(base, mtime)
+        for filename in filenames:
+            _set_mtime(os.path.join(base, filename), mtime)
+
+
+def test_snapshot_matches_json_defaults(tmp_path, monkeypatch):
+    snapshot_path = str(tmp_path / "defaults_snapshot.bin")
+    lib.create_default_settings_snapshot(snapshot_path)
+    monkeypatch.setattr(lib, "DEFAULTS_SNAPSHOT_PATH", snapshot_path)
+
+    assert (
+        lib.load_openpype_default_settings()
+        == lib.load_jsons_from_dir(lib.DEFAULTS_DIR)
+    )
+
+
+def test_outdated_snapshot(tmp_path, defaults_dir, monkeypatch):
+    snapshot_path = str(tmp_path / "defaults_snapshot.bin")
+    monkeypatch.setattr(lib, "DEFAULTS_DIR", defaults_dir)
+    lib.create_default_settings_snapshot(snapshot_path)
+    _set_mtime(snapshot_path, 1000)
+
+    # Sources are newer but content is the same (e.g. extracted zip)
+    _set_sources_mtime(defaults_dir, 2000)
+    assert load_snapshot(snapshot_path, defaults_dir) is not None
+
+    filepath = os.path.join(
+        defaults_dir, "system_settings", "general.json"
+    )
+    with open(filepath, "r") as stream:
+        data = json.load(stream)
+    data["studio_name"] = "changed"
+    with open(filepath, "w") as stream:
+        json.dump(data, stream)
+
+    assert load_snapshot(snapshot_path, defaults_dir) is None
+
+    monkeypatch.setattr(lib, "DEFAULTS_SNAPSHOT_PATH", snapshot_path)
+    defaults = lib.load_openpype_default_settings()
+    assert defaults["system_settings"]["general"]["studio_name"] == "changed"
+
+
+def test_invalid_snapshot(tmp_path, defaults_dir):
+    snapshot_path = str(tmp_path / "defaults_snapshot.bin")
+    assert load_snapshot(snapshot_path, defaults_dir) is None
+
+    with open(snapshot_path, "wb") as stream:
+        stream.write(b"invalid content")
+    assert load_snapshot(snapshot_path, defaults_dir) is None
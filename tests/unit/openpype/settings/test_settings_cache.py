@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of resolved settings.
+
+Settings handlers are replaced with in-memory fakes so tests are running
+without database.
+"""
+import os
+import copy
+import time
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import M_OVERRIDDEN_KEY
+from openpype.settings.handlers import CacheValues
+
+PROJECT_NAME = "test_project"
+
+
+class FakeSettingsHandler(object):
+    def __init__(self):
+        self.system_cache = CacheValues()
+        self.project_caches = {
+            None: CacheValues(),
+            PROJECT_NAME: CacheValues(),
+        }
+        self.system_cache.update_data({}, "1.0.0")
+        self.project_caches[None].update_data({}, "1.0.0")
+        self.project_caches[PROJECT_NAME].update_data({}, "1.0.0")
+
+    def get_studio_system_settings_overrides(self, return_version=False):
+        return self.system_cache.data_copy()
+
+    def get_studio_project_settings_overrides(self, return_version=False):
+        return self.project_caches[None].data_copy()
+
+    def get_project_settings_overrides(
+        self, project_name, return_version=False
+    ):
+        return self.project_caches[project_name].data_copy()
+
+    def get_system_settings_stamp(self):
+        return self.system_cache.stamp
+
+    def get_project_settings_stamp(self, project_name):
+        return (
+            self.project_caches[None].stamp,
+            self.project_caches[project_name].stamp
+        )
+
+
+class FakeLocalSettingsHandler(object):
+    def __init__(self):
+        self.cache = CacheValues()
+        self.cache.update_data({}, None)
+
+    def get_local_settings(self):
+        return self.cache.data_copy()
+
+    def get_local_settings_stamp(self):
+        return self.cache.stamp
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    defaults = lib.load_openpype_default_settings()
+    handler = FakeSettingsHandler()
+    monkeypatch.setattr(
+        lib, "get_default_settings", lambda: copy.deepcopy(defaults)
+    )
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", handler)
+    monkeypatch.setattr(
+        lib, "_LOCAL_SETTINGS_HANDLER", FakeLocalSettingsHandler()
+    )
+    lib.reset_resolved_settings_cache()
+    yield handler
+    lib.reset_resolved_settings_cache()
+
+
+def _set_project_value(handler, value):
+    overrides = {
+        "global": {
+            M_OVERRIDDEN_KEY: ["version_start_category"],
+            "version_start_category": {"profiles": value},
+        }
+    }
+    handler.project_caches[PROJECT_NAME].update_data(overrides, "1.0.0")
+
+
+def test_project_settings_are_cached(handler):
+    settings = lib._get_project_settings(PROJECT_NAME)
+    settings["global"]["modified"] = True
+
+    cached = lib._get_project_settings(PROJECT_NAME)
+    assert "modified" not in cached["global"]
+    assert cached == lib._resolve_project_settings(PROJECT_NAME)
+
+    view = lib.get_project_settings_view(PROJECT_NAME)
+    assert view is lib.get_project_settings_view(PROJECT_NAME)
+    with pytest.raises(TypeError):
+        view["global"]["modified"] = True
+
+
+def test_project_settings_cache_invalidation(handler):
+    view = lib.get_project_settings_view(PROJECT_NAME)
+    assert view["global"]["version_start_category"]["profiles"] == ()
+
+    _set_project_value(handler, [{"version_start": 2}])
+    settings = lib._get_project_settings(PROJECT_NAME)
+    assert settings["global"]["version_start_category"]["profiles"] == [
+        {"version_start": 2}
+    ]
+    assert lib.get_project_settings_view(PROJECT_NAME) is not view
+
+    # Same data don't change the stamp
+    stamp = handler.get_project_settings_stamp(PROJECT_NAME)
+    _set_project_value(handler, [{"version_start": 2}])
+    assert handler.get_project_settings_stamp(PROJECT_NAME) == stamp
+
+
+def test_system_settings_cache_invalidation(handler):
+    first = lib.get_system_settings_view()
+    assert first is lib.get_system_settings_view()
+
+    handler.system_cache.update_data(
+        {"general": {"studio_name": "Studio"}}, "1.0.0"
+    )
+    view = lib.get_system_settings_view()
+    assert view["general"]["studio_name"] == "Studio"
+    assert lib._get_system_settings()["general"]["studio_name"] == "Studio"
+
+
+def test_project_settings_resolved_once(handler, monkeypatch):
+    resolve_calls = []
+    resolve_project_settings = lib._resolve_project_settings
+
+    def _resolve_project_settings(*args, **kwargs):
+        resolve_calls.append(args)
+        return resolve_project_settings(*args, **kwargs)
+
+    monkeypatch.setattr(
+        lib, "_resolve_project_settings", _resolve_project_settings
+    )
+
+    for _ in range(5):
+        lib._get_project_settings(PROJECT_NAME)
+        lib.get_project_settings_view(PROJECT_NAME)
+    assert len(resolve_calls) == 1
+
+    # Settings with metadata are cached separately
+    lib._get_project_settings(PROJECT_NAME, clear_metadata=False)
+    lib._get_project_settings(PROJECT_NAME, clear_metadata=False)
+    assert len(resolve_calls) == 2
+
+    # Change of overrides resolves settings again
+    _set_project_value(handler, [{"version_start": 2}])
+    for _ in range(5):
+        lib._get_project_settings(PROJECT_NAME)
+    assert len(resolve_calls) == 3
+
+
+def _measure(func, iterations=20):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+@pytest.mark.skipif(
+    not os.environ.get("OPENPYPE_RUN_BENCHMARKS"),
+    reason="Benchmarks run only with 'OPENPYPE_RUN_BENCHMARKS' set"
+)
+def test_resolved_settings_benchmark(handler):
+    """Print per-call cost of resolving and cached settings.
+
+    Timings depend on machine load so they are only printed. Run with
+    'pytest -s' to see them.
+    """
+    _set_project_value(handler, [{"version_start": 2}])
+    resolve_time = _measure(
+        lambda: lib._resolve_project_settings(PROJECT_NAME)
+    )
+    copy_time = _measure(lambda: lib._get_project_settings(PROJECT_NAME))
+    view_time = _measure(
+        lambda: lib.get_project_settings_view(PROJECT_NAME)
+    )
+    print((
+        "\nProject settings per call:"
+        " resolve {:.2f}ms, cached copy {:.2f}ms, cached view {:.4f}ms"
+    ).format(resolve_time * 1000, copy_time * 1000, view_time * 1000))
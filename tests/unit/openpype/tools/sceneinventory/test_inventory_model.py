@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""Test query of scene inventory entities.
+
+Entity getters are replaced by fakes working with in-memory documents so
+tests are running without database.
+"""
+import pytest
+from bson.objectid import ObjectId
+
+try:
+    from qtpy import QtCore  # noqa: F401
+except ImportError:
+    # qtpy raises ImportError subclass when Qt bindings are not available
+    pytest.skip("Qt bindings are not available", allow_module_level=True)
+
+from openpype.pipeline import HeroVersionType  # noqa: E402
+from openpype.tools.sceneinventory import model  # noqa: E402
+
+PROJECT_NAME = "test_project"
+ENTITY_KEYS = ("representation", "version", "subset", "asset")
+
+
+class FakeDatabase(object):
+    """Documents with getters recording their calls."""
+
+    def __init__(self):
+        self.docs_by_type = {
+            "asset": [],
+            "subset": [],
+            "version": [],
+            "hero_version": [],
+            "representation": [],
+        }
+        self.calls = []
+
+    def add(self, doc_type, **kwargs):
+        doc = {"_id": ObjectId(), "type": doc_type, "data": {}}
+        doc.update(kwargs)
+        self.docs_by_type[doc_type].append(doc)
+        return doc
+
+    def _find(self, doc_types, ids):
+        ids = {ObjectId(str(entity_id)) for entity_id in ids}
+        return [
+            dict(doc)
+            for doc_type in doc_types
+            for doc in self.docs_by_type[doc_type]
+            if doc["_id"] in ids
+        ]
+
+    def get_representations(
+        self, project_name, representation_ids, archived=False
+    ):
+        self.calls.append("get_representations")
+        return self._find(["representation"], representation_ids)
+
+    def get_versions(
+        self, project_name, version_ids, hero=False, fields=None
+    ):
+        self.calls.append("get_versions")
+        doc_types = ["version"]
+        if hero:
+            doc_types.append("hero_version")
+        return self._find(doc_types, version_ids)
+
+    def get_subsets(self, project_name, subset_ids):
+        self.calls.append("get_subsets")
+        return self._find(["subset"], subset_ids)
+
+    def get_assets(self, project_name, asset_ids):
+        self.calls.append("get_assets")
+        return self._find(["asset"], asset_ids)
+
+    def get_last_versions(self, project_name, subset_ids, fields=None):
+        self.calls.append("get_last_versions")
+        subset_ids = set(subset_ids)
+        output = {}
+        for version_doc in self.docs_by_type["version"]:
+            subset_id = version_doc["parent"]
+            if subset_id not in subset_ids:
+                continue
+            last_version = output.get(subset_id)
+            if (
+                last_version is None
+                or last_version["name"] < version_doc["name"]
+            ):
+                output[subset_id] = version_doc
+        return output
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    for name in (
+        "get_representations",
+        "get_versions",
+        "get_subsets",
+        "get_assets",
+        "get_last_versions",
+    ):
+        monkeypatch.setattr(model, name, getattr(database, name))
+    return database
+
+
+def _add_hierarchy(database, count):
+    """Add assets with one subset, two versions and representation each.
+
+    Returns:
+        list[dict[str, dict]]: Documents of each hierarchy.
+    """
+    hierarchies = []
+    for idx in range(count):
+        asset_doc = database.add("asset", name="asset{}".format(idx))
+        subset_doc = database.add(
+            "subset", name="modelMain", parent=asset_doc["_id"]
+        )
+        version_doc = database.add(
+            "version",
+            name=1,
+            parent=subset_doc["_id"],
+            data={"families": ["model"]}
+        )
+        last_version_doc = database.add(
+            "version", name=2, parent=subset_doc["_id"]
+        )
+        repre_doc = database.add(
+            "representation", name="abc", parent=version_doc["_id"]
+        )
+        hierarchies.append({
+            "asset": asset_doc,
+            "subset": subset_doc,
+            "version": version_doc,
+            "last_version": last_version_doc,
+            "representation": repre_doc,
+        })
+    return hierarchies
+
+
+def _query_entities(repre_ids):
+    # Method does not use model so it is called without Qt model instance
+    return model.InventoryModel._query_entities(
+        None, PROJECT_NAME, repre_ids
+    )
+
+
+def _first_missing(entities):
+    return next((key for key in ENTITY_KEYS if not entities[key]), None)
+
+
+def test_entities_found(database):
+    hierarchy = _add_hierarchy(database, 1)[0]
+    repre_id = str(hierarchy["representation"]["_id"])
+
+    output = _query_entities([repre_id])
+
+    entities = output[repre_id]
+    for key in ENTITY_KEYS:
+        assert entities[key]["_id"] == hierarchy[key]["_id"]
+    assert (
+        entities["highest_version"]["_id"]
+        == hierarchy["last_version"]["_id"]
+    )
+
+
+@pytest.mark.parametrize("count", [1, 10])
+def test_query_count_is_constant(database, count):
+    hierarchies = _add_hierarchy(database, count)
+    hero_version_doc = database.add(
+        "hero_version",
+        parent=hierarchies[0]["subset"]["_id"],
+        version_id=hierarchies[0]["version"]["_id"]
+    )
+    hero_repre_doc = database.add(
+        "representation", name="abc", parent=hero_version_doc["_id"]
+    )
+    repre_ids = [
+        str(hierarchy["representation"]["_id"])
+        for hierarchy in hierarchies
+    ]
+    repre_ids.append(str(hero_repre_doc["_id"]))
+
+    output = _query_entities(repre_ids)
+
+    assert set(output) == set(repre_ids)
+    for entities in output.values():
+        assert _first_missing(entities) is None
+    # Versions are queried twice, second time for sources of hero versions
+    assert database.calls == [
+        "get_representations",
+        "get_versions",
+        "get_versions",
+        "get_subsets",
+        "get_assets",
+        "get_last_versions",
+    ]
+
+
+def test_not_found_entities(database):
+    hierarchies = _add_hierarchy(database, 4)
+    # Break each hierarchy on different level
+    database.docs_by_type["version"].remove(hierarchies[1]["version"])
+    database.docs_by_type["subset"].remove(hierarchies[2]["subset"])
+    database.docs_by_type["asset"].remove(hierarchies[3]["asset"])
+    missing_repre_id = str(ObjectId())
+    repre_ids = [
+        str(hierarchy["representation"]["_id"])
+        for hierarchy in hierarchies
+    ]
+
+    output = _query_entities(repre_ids + [missing_repre_id])
+
+    expected_missing = [None, "version", "subset", "asset"]
+    for repre_id, missing in zip(repre_ids, expected_missing):
+        assert _first_missing(output[repre_id]) == missing
+    assert _first_missing(output[missing_repre_id]) == "representation"
+
+    # Entities following the missing entity are not filled
+    for entities in output.values():
+        missing = _first_missing(entities)
+        if missing is None:
+            continue
+        following = ENTITY_KEYS[ENTITY_KEYS.index(missing):]
+        assert all(entities[key] is None for key in following)
+
+
+def test_hero_version_uses_source_version(database):
+    hierarchy = _add_hierarchy(database, 1)[0]
+    source_version_doc = hierarchy["version"]
+    hero_version_doc = database.add(
+        "hero_version",
+        parent=hierarchy["subset"]["_id"],
+        version_id=source_version_doc["_id"]
+    )
+    hero_repre_doc = database.add(
+        "representation", name="abc", parent=hero_version_doc["_id"]
+    )
+    # Hero version of which source version was removed
+    orphan_hero_version_doc = database.add(
+        "hero_version",
+        parent=hierarchy["subset"]["_id"],
+        version_id=ObjectId()
+    )
+    orphan_repre_doc = database.add(
+        "representation", name="abc", parent=orphan_hero_version_doc["_id"]
+    )
+    hero_repre_id = str(hero_repre_doc["_id"])
+    orphan_repre_id = str(orphan_repre_doc["_id"])
+
+    output = _query_entities([hero_repre_id, orphan_repre_id])
+
+    version_doc = output[hero_repre_id]["version"]
+    assert version_doc["_id"] == hero_version_doc["_id"]
+    assert isinstance(version_doc["name"], HeroVersionType)
+    assert version_doc["name"].version == source_version_doc["name"]
+    assert version_doc["data"] == source_version_doc["data"]
+    assert output[hero_repre_id]["subset"]["_id"] == hierarchy["subset"]["_id"]
+
+    assert _first_missing(output[orphan_repre_id]) == "version"